@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+
+import re
+import json
+import hashlib
+
+#####################################
+# Normalization of author names, driven by a rule file (see
+# input/author_name_rules.json) instead of a long chain of string
+# replacements. The rule file has four parts:
+# - doi_overrides: literal replacements in the author list of one specific paper
+# - list_rules: fixes of the whole author list (e.g., for lists in an unusual
+#   format or with extra text), either literal ("text") or as regular
+#   expression ("pattern"); all of them are applied in a single pass
+# - name_map: exact replacements of single author names ([from, to] or [from, to, comment])
+# - name_rules: regular expressions that have to match a single author name completely
+# Each author name is normalized only once, later occurrences are looked up.
+#####################################
+
+# the ways in which authors are separated in the lists we get
+authorSeparatorPattern = re.compile(r'\s*;\s*|, and | and | , |, ')
+
+def compileAuthorNameRules(rules):
+    # list rules: one regular expression with a named group per rule, so that we know which rule matched
+    listRules = []
+    listAlternatives = []
+    for ruleIndex, rule in enumerate(rules.get("list_rules", [])):
+        if "text" in rule.keys():
+            pattern = re.escape(rule["text"])
+            listRules.append((None, rule["replacement"]))
+        else:
+            # the rule's own regex is later applied to the matched text only, so it should not use lookarounds
+            pattern = rule["pattern"]
+            listRules.append((re.compile(pattern), rule["replacement"]))
+        listAlternatives.append("(?P<rule" + str(ruleIndex) + ">" + pattern + ")")
+
+    nameRules = []
+    for rule in rules.get("name_rules", []):
+        nameRules.append((re.compile(rule["pattern"]), rule["replacement"]))
+
+    authorNameRules = {}
+    authorNameRules["doi_overrides"] = rules.get("doi_overrides", {})
+    authorNameRules["list_rules"] = listRules
+    authorNameRules["list_regex"] = re.compile("|".join(listAlternatives)) if (len(listAlternatives) > 0) else None
+    authorNameRules["name_map"] = { entry[0] : entry[1] for entry in rules.get("name_map", []) }
+    authorNameRules["name_rules"] = nameRules
+    authorNameRules["memo"] = {} # already normalized names
+    return authorNameRules
+
+def loadAuthorNameRules(fileName):
+    with open(fileName, "rb") as f:
+        rulesData = f.read()
+    authorNameRules = compileAuthorNameRules(json.loads(rulesData.decode('utf-8')))
+    authorNameRules["version"] = hashlib.sha256(rulesData).hexdigest() # to know if data made with older rules is outdated
+    return authorNameRules
+
+def applyListRule(authorNameRules, match):
+    ruleRegex, replacement = authorNameRules["list_rules"][int(match.lastgroup[len("rule"):])]
+    if ruleRegex == None: return replacement
+    return ruleRegex.fullmatch(match.group(0)).expand(replacement)
+
+def normalizeAuthorName(authorNameRules, name):
+    if name in authorNameRules["memo"]: return authorNameRules["memo"][name]
+
+    normalizedName = re.sub(' +', ' ', name.replace('​', '').strip())
+    if normalizedName in authorNameRules["name_map"]:
+        normalizedName = authorNameRules["name_map"][normalizedName]
+    else:
+        for ruleRegex, replacement in authorNameRules["name_rules"]:
+            match = ruleRegex.fullmatch(normalizedName)
+            if match != None:
+                normalizedName = match.expand(replacement)
+                break
+
+    authorNameRules["memo"][name] = normalizedName
+    return normalizedName
+
+def normalizeAuthorList(authorNameRules, authors, doi = ""):
+    # returns the normalized authors as one string, separated consistently by ", "
+    for fromText, toText in authorNameRules["doi_overrides"].get(doi, []):
+        authors = authors.replace(fromText, toText)
+    authors = authors.replace('​', '')
+    if authorNameRules["list_regex"] != None:
+        authors = authorNameRules["list_regex"].sub(lambda match: applyListRule(authorNameRules, match), authors)
+
+    normalizedAuthors = []
+    for name in authorSeparatorPattern.split(authors):
+        if len(name.strip()) > 0: normalizedAuthors.append(normalizeAuthorName(authorNameRules, name))
+    return ", ".join(normalizedAuthors)
@@ -0,0 +1,136 @@
+#!/usr/bin/python3
+
+import os
+import sys
+import re
+import json
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+#####################################
+# Rendering of the charts in parallel. Saving an Altair chart as PDF goes
+# through vl-convert and takes a while for each chart, so instead of
+# saving each chart right where we create it, we only queue its Vega-Lite
+# spec there (taken right away, so that later changes to the chart object,
+# such as the grayscale variants, do not affect it) and then render all
+# queued charts at once with a pool of processes. If a file is queued more
+# than once, the last chart wins (as it would have overwritten the file).
+# Each chart is compiled (Vega-Lite to Vega) only once, and from that we
+# write all requested formats (PDF, SVG, PNG), plus always the Vega-Lite
+# spec itself as JSON next to them (e.g., for restyling the chart later).
+# We also record a hash of each rendered spec (the data and the complete
+# chart configuration), and if a file already exists and its spec did not
+# change since we rendered it, we do not render it again (and leave the
+# file untouched, so that LaTeX does not see a change). If we only want
+# some of the charts (e.g., only those that the paper uses), then the
+# others are neither turned into a spec nor rendered.
+#####################################
+
+chartFormats = ["pdf", "svg", "png"]
+
+def createRenderQueue(hashFileName = None, formats = ["pdf"]):
+    # hashFileName: where we keep the hashes of the specs of the rendered files (None: always render everything)
+    # formats: the files we write for each chart (from chartFormats; the .vl.json spec is always written)
+    renderQueue = {}
+    renderQueue["charts"] = {} # base file name (without extension) -> Vega-Lite spec
+    renderQueue["formats"] = list(formats)
+    renderQueue["hash_file"] = hashFileName
+    renderQueue["hashes"] = {} # base file name -> hash of the spec (and formats) we rendered it from
+    renderQueue["wanted"] = None # the names (without directory and extension) of the charts we want, None: all of them
+    if (hashFileName != None) and os.path.isfile(hashFileName):
+        with open(hashFileName, "r", encoding='utf-8') as f:
+            renderQueue["hashes"] = json.load(f)
+    return renderQueue
+
+def saveRenderHashes(renderQueue):
+    if renderQueue["hash_file"] == None: return
+    if os.path.dirname(renderQueue["hash_file"]) != '': os.makedirs(os.path.dirname(renderQueue["hash_file"]), exist_ok=True)
+    with open(renderQueue["hash_file"], "w", encoding='utf-8') as f:
+        json.dump(renderQueue["hashes"], f, indent=1, sort_keys=True)
+
+def chartSpecHash(spec, formats):
+    return hashlib.sha256(json.dumps([spec, formats], sort_keys=True).encode('utf-8')).hexdigest()
+
+def chartOutputFiles(baseFileName, formats):
+    return [baseFileName + ".vl.json"] + [baseFileName + "." + format for format in formats]
+
+def setWantedCharts(renderQueue, chartNames):
+    renderQueue["wanted"] = set(chartNames)
+
+def isChartWanted(renderQueue, fileName):
+    return (renderQueue["wanted"] == None) or (os.path.splitext(os.path.basename(fileName))[0] in renderQueue["wanted"])
+
+def findIncludedGraphics(texFileNames):
+    # the names of the graphics (without directory and extension) that the LaTeX files include (ignoring commented-out lines)
+    graphicsNames = set()
+    for texFileName in texFileNames:
+        with open(texFileName, "r", encoding='utf-8') as f:
+            for line in f:
+                line = re.sub(r"(?<!\\)%.*", "", line)
+                for graphicsFile in re.findall(r"\\includegraphics\s*(?:\[[^\]]*\])?\s*\{([^}]+)\}", line):
+                    graphicsNames.add(os.path.splitext(os.path.basename(graphicsFile.strip()))[0])
+    return graphicsNames
+
+def queueChartRender(renderQueue, chart, fileName):
+    # fileName can come with an extension (e.g., '.pdf'), we write the configured formats anyway
+    if not isChartWanted(renderQueue, fileName): return
+    renderQueue["charts"][os.path.splitext(fileName)[0]] = chart.to_dict()
+
+def vlConvertVersion(spec):
+    # the Vega-Lite version for vl-convert (e.g., "v5_20") from the spec's schema (e.g., ".../vega-lite/v5.20.1.json"), as Altair does it
+    schemaVersion = spec["$schema"].split("/")[-1].replace(".json", "")
+    return "_".join(schemaVersion.split(".")[:2])
+
+def writeChartFile(fileName, data):
+    with open(fileName + ".tmp", "wb") as f:
+        f.write(data)
+    os.replace(fileName + ".tmp", fileName)
+
+def renderChartFiles(baseFileName, spec, formats):
+    import vl_convert as vlc # only needed in the rendering processes
+    writeChartFile(baseFileName + ".vl.json", json.dumps(spec, indent=1).encode('utf-8'))
+    vegaSpec = vlc.vegalite_to_vega(spec, vl_version=vlConvertVersion(spec)) # compile only once for all formats
+    for format in formats:
+        if format == "pdf": writeChartFile(baseFileName + ".pdf", vlc.vega_to_pdf(vegaSpec))
+        elif format == "svg": writeChartFile(baseFileName + ".svg", vlc.vega_to_svg(vegaSpec).encode('utf-8'))
+        elif format == "png": writeChartFile(baseFileName + ".png", vlc.vega_to_png(vegaSpec))
+        else: raise ValueError("unknown chart format: " + format)
+
+def canRenderInProcesses():
+    # we can only fork the rendering processes (spawned ones would run the whole calling script again), which Windows does not support
+    # and which is not safe on macOS, so there we render the charts one after the other in this process
+    return ("fork" in multiprocessing.get_all_start_methods()) and (sys.platform != "darwin")
+
+def renderQueuedCharts(renderQueue, processes = None):
+    # renders (and then removes from the queue) all queued charts, processes: None = one per core, 1 = no extra processes
+    # returns base file name -> error message of the charts we could not render (the others are rendered anyway)
+    # charts whose files all exist and whose spec did not change since we last rendered them are skipped
+    formats = renderQueue["formats"]
+    specHashes = { baseFileName : chartSpecHash(spec, formats) for baseFileName, spec in renderQueue["charts"].items() }
+    baseFileNames = sorted([baseFileName for baseFileName in renderQueue["charts"].keys()
+        if not (all([os.path.isfile(fileName) for fileName in chartOutputFiles(baseFileName, formats)]) and (renderQueue["hashes"].get(baseFileName) == specHashes[baseFileName]))])
+    failedFiles = {}
+    if (processes == 1) or not canRenderInProcesses():
+        for baseFileName in baseFileNames:
+            try:
+                renderChartFiles(baseFileName, renderQueue["charts"][baseFileName], formats)
+            except Exception as e:
+                failedFiles[baseFileName] = str(e)
+    elif len(baseFileNames) > 0:
+        # forked (see canRenderInProcesses), so vl-convert must not be loaded in this process before
+        with ProcessPoolExecutor(max_workers = processes, mp_context = multiprocessing.get_context("fork")) as executor:
+            futures = { executor.submit(renderChartFiles, baseFileName, renderQueue["charts"][baseFileName], formats) : baseFileName for baseFileName in baseFileNames }
+            for future in as_completed(futures.keys()):
+                try:
+                    future.result()
+                except Exception as e:
+                    failedFiles[futures[future]] = str(e)
+    for baseFileName in sorted(failedFiles.keys()):
+        print("WARNING: Could not render " + baseFileName + ": " + failedFiles[baseFileName])
+        renderQueue["hashes"].pop(baseFileName, None)
+    for baseFileName in baseFileNames:
+        if not (baseFileName in failedFiles.keys()): renderQueue["hashes"][baseFileName] = specHashes[baseFileName]
+    saveRenderHashes(renderQueue)
+    renderQueue["charts"] = {}
+    return failedFiles
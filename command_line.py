@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+
+import argparse
+
+#####################################
+# The command line of replicability.py. Without a subcommand the script
+# runs as the settings at its top say. A subcommand only runs the stages
+# that it needs (e.g., "classify" stops after the classification, "scrape"
+# also gets the data of the new papers from the digital libraries, and
+# "numbers" does not create any charts), and the options override the
+# individual settings for this run. The settings keep their names, so the
+# script can simply take them back from the returned dict.
+#####################################
+
+# what each subcommand changes in the settings (lastStage: after which stage the script stops, None: it runs all of them)
+commandSettings = {
+    "scrape": { "useLocalDataOnly": False, "lastStage": "enrich" },
+    "classify": { "lastStage": "classify" },
+    "report": { "doNameChecking": True, "doAbstractCheckingForKeywords": True, "doVerifyCountryInformation": True, "doPrintTVCGInPressDetails": True, "doPrintConferenceTotals": True,
+        "exportVisualizations": False, "doExportNumbersForPaper": False, "doCopyPlotsAccordingToFigureNumbers": False },
+    "enrich": { "doCheckExtendedDataAlways": True, "lastStage": "enrich" },
+    "plot": { "exportVisualizations": True, "doNumbersOnly": False, "doExportNumbersForPaper": False, "doCopyPlotsAccordingToFigureNumbers": False },
+    "numbers": { "doNumbersOnly": True, "doExportNumbersForPaper": True },
+    "export": { "exportVisualizations": True, "doNumbersOnly": False, "doExportNumbersForPaper": True, "doCopyPlotsAccordingToFigureNumbers": True },
+}
+commandHelp = {
+    "scrape": "get the current GRSI data from the web, classify it, and get the data of the new papers from the digital libraries",
+    "classify": "classify the papers and write the author list",
+    "report": "print the checks of the data (names, abstract keywords, countries, papers in press)",
+    "enrich": "get the missing data of the papers from the digital libraries",
+    "plot": "create the charts",
+    "numbers": "only compute the numbers that the paper uses",
+    "export": "create the charts, the numbers for the paper, and the paper figures",
+}
+
+# the settings that can be switched on (--option) and off (--no-option)
+booleanOptions = [
+    ("useLocalDataOnly", "--local-data-only", "use the stored data instead of getting the current GRSI data from the web"),
+    ("exportVisualizations", "--visualizations", "create the charts"),
+    ("doNumbersOnly", "--numbers-only", "only compute the numbers that the paper uses, without charts"),
+    ("doExportNumbersForPaper", "--export-numbers", "write the numbers for the paper"),
+    ("doCopyPlotsAccordingToFigureNumbers", "--copy-figures", "copy the charts into the paper figures"),
+    ("doNameChecking", "--name-checking", "check the author names against the digital libraries"),
+    ("doAbstractCheckingForKeywords", "--abstract-checking", "also look for visualization keywords in the abstracts"),
+    ("doVerifyCountryInformation", "--verify-countries", "report papers without country information"),
+    ("doPrintTVCGInPressDetails", "--print-tvcg-in-press", "print the IEEE TVCG papers that are still in press"),
+    ("doPrintConferenceTotals", "--print-conference-totals", "print the totals of IEEE VIS presentations"),
+    ("doLongitudinalAnalysis", "--longitudinal", "replay the GRSI data history for the longitudinal analysis"),
+    ("useExtendedPaperStore", "--extended-paper-store", "keep the extended paper data in the SQLite database"),
+    ("rederiveExtendedDataFromCache", "--rederive-from-cache", "re-create the extended paper data from the cached DL responses"),
+    ("doCheckExtendedDataAlways", "--check-extended-data", "check for missing DL data even if we did not get new GRSI data"),
+]
+
+# the names of all settings that the command line can change
+settingNames = [setting for setting, option, helpText in booleanOptions] + ["chartRenderMode", "chartRenderProcesses", "lastStage"]
+
+def parseCommandLine(arguments, settings):
+    # settings: the defaults (from the top of the script), returns a copy with the subcommand and the options applied (and "command": the subcommand or None)
+    parser = argparse.ArgumentParser(prog="replicability.py", description="Analysis of the papers with a Graphics Replicability Stamp.")
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+    commandParsers = [parser] + [subparsers.add_parser(command, help=commandHelp[command]) for command in commandSettings.keys()]
+    for commandParser in commandParsers:
+        for setting, option, helpText in booleanOptions:
+            commandParser.add_argument(option, dest=setting, action=argparse.BooleanOptionalAction, default=argparse.SUPPRESS, help=helpText)
+        commandParser.add_argument("--render-mode", dest="chartRenderMode", choices=["all", "paper"], default=argparse.SUPPRESS, help="render all charts or only those the paper uses")
+        commandParser.add_argument("--render-processes", dest="chartRenderProcesses", type=int, default=argparse.SUPPRESS, help="how many processes render the charts (1: no extra processes)")
+    options = vars(parser.parse_args(arguments))
+
+    commandLineSettings = dict(settings)
+    commandLineSettings["command"] = options.pop("command", None)
+    if commandLineSettings["command"] != None: commandLineSettings.update(commandSettings[commandLineSettings["command"]])
+    commandLineSettings.update(options) # the explicitly given options win over the subcommand
+    return commandLineSettings
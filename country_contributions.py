@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+
+import csv
+
+#####################################
+# How much the authors' countries contribute to the papers, as we show it
+# in the country pie charts and report it in the paper. Each paper counts
+# as 1, split evenly among its authors (or only given to the last, i.e.,
+# the senior author) and then among each author's countries. In addition
+# we count for each country the papers it contributed to at all. Papers
+# for which we do not have any country information are left out.
+#####################################
+
+def loadCountryNames(fileName):
+    # returns the names for the charts and for use in a sentence (e.g., "the Netherlands"), by two-letter code
+    # (from https://github.com/lukes/ISO-3166-Countries-with-Regional-Codes/blob/master/all/all.csv)
+    countryNames = {}
+    countryNamesSentence = {}
+    with open(fileName, 'r', encoding="utf-8") as csvfile:
+        # create a CSV reader object
+        reader = csv.DictReader(csvfile)
+        # iterate over the rows
+        for row in reader:
+            countryNames[row['alpha-2']] = row['name'] \
+                .replace('United States of America', 'United States') \
+                .replace('United Kingdom of Great Britain and Northern Ireland', 'UK') \
+                .replace('Korea, Republic of', 'South Korea') \
+                .replace('Taiwan, Province of China', 'Taiwan') \
+                .replace('Viet Nam', 'Vietnam') \
+                .replace('Czechia', 'Czech Republic')
+            countryNamesSentence[row['alpha-2']] = countryNames[row['alpha-2']] \
+                .replace('United States', 'the United States') \
+                .replace('Netherlands', 'the Netherlands') \
+                .replace('Czech Republic', 'the Czech Republic') \
+                .replace('UK', 'the UK') \
+                .replace('United Arab Emirates', 'the United Arab Emirates')
+    return countryNames, countryNamesSentence
+
+def computeCountryContributions(authorLists, seniorOnly = False):
+    # authorLists: the list of authors (from the extended paper data) of each paper we look at
+    # returns {"proportional": country -> share, "papers": country -> number of papers, "papers_with_country_information": ...}, both sorted by decreasing value
+    grsiPerCountryProportional = {}
+    grsiPerCountrySum = {}
+    papersWithCountryInformation = 0
+    for authors in authorLists:
+        if seniorOnly: authors = authors[-1:] # we assume that the last author is the senior author
+        contributionPerAuthor = 1.0 / len(authors)
+        countryAlreadyCountedForPaper = {}
+        paperHasCountryInfo = False
+        for author in authors:
+            if "countries" in author.keys(): # we may not have the whole information for everyone
+                paperHasCountryInfo = True
+                contributionOfSingleAuthorCountry = contributionPerAuthor / len(author["countries"])
+                for country in author["countries"]:
+                    if not (country in grsiPerCountryProportional.keys()): grsiPerCountryProportional[country] = 0.0
+                    if not (country in grsiPerCountrySum.keys()): grsiPerCountrySum[country] = 0
+                    grsiPerCountryProportional[country] += contributionOfSingleAuthorCountry
+                    if not (country in countryAlreadyCountedForPaper.keys()):
+                        countryAlreadyCountedForPaper[country] = 1
+                        grsiPerCountrySum[country] += 1
+        if paperHasCountryInfo: papersWithCountryInformation += 1
+
+    countryContributions = {}
+    countryContributions["proportional"] = dict(sorted(grsiPerCountryProportional.items(), key=lambda kv: kv[1], reverse = True))
+    countryContributions["papers"] = dict(sorted(grsiPerCountrySum.items(), key=lambda kv: kv[1], reverse = True))
+    countryContributions["papers_with_country_information"] = papersWithCountryInformation
+    return countryContributions
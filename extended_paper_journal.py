@@ -0,0 +1,49 @@
+#!/usr/bin/python3
+
+import os
+import json
+
+#####################################
+# A write-ahead journal for the extended paper data. Instead of rewriting
+# the whole publication_data/extended_paper_data.json after the lookups,
+# every entry we get is appended (one JSON line per doi) and synced to
+# disk right away, so that the work is not lost if the script stops
+# halfway (e.g., because of an IP block). When loading, we replay the
+# journal on top of the JSON file, and from time to time we fold it back
+# into the JSON file (compaction) and start a new, empty journal.
+#####################################
+
+def appendExtendedPaperJournal(journalFileName, doi, entry):
+    if os.path.dirname(journalFileName) != '': os.makedirs(os.path.dirname(journalFileName), exist_ok=True)
+    with open(journalFileName, "a", encoding='utf-8') as f:
+        f.write(json.dumps({ "doi": doi, "entry": entry }) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+def replayExtendedPaperJournal(journalFileName, paperListExtended):
+    # applies the journaled entries (in order, so the last one for a doi wins) and returns the list of (doi, entry) we applied
+    replayedEntries = []
+    if not os.path.isfile(journalFileName): return replayedEntries
+    with open(journalFileName, "r", encoding='utf-8') as f:
+        for line in f:
+            if line.strip() == '': continue
+            try:
+                journalItem = json.loads(line)
+            except ValueError:
+                print("WARNING: Skipping an incomplete line in " + journalFileName + " (probably the script stopped while writing it).")
+                continue
+            paperListExtended[journalItem["doi"]] = journalItem["entry"]
+            replayedEntries.append((journalItem["doi"], journalItem["entry"]))
+    return replayedEntries
+
+def compactExtendedPaperJournal(journalFileName, jsonFileName, paperListExtended, writeFunction = None):
+    # writes the complete data (safely, via a temporary file) and then removes the journal
+    # writeFunction(jsonFileName) can take over the writing (e.g., an export from the SQLite store)
+    if writeFunction != None: writeFunction(jsonFileName)
+    else:
+        with open(jsonFileName + ".tmp", "w", encoding='utf-8') as f:
+            json.dump(paperListExtended, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(jsonFileName + ".tmp", jsonFileName)
+    if os.path.isfile(journalFileName): os.remove(journalFileName)
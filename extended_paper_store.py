@@ -0,0 +1,141 @@
+#!/usr/bin/python3
+
+import os
+import json
+import sqlite3
+
+#####################################
+# An optional SQLite store for the extended paper data (the data from the
+# publishers' DLs in publication_data/extended_paper_data.json). Each paper
+# is one row that keeps its complete entry as JSON (so that we can export
+# exactly the file we have in the paper repository), plus indexed columns
+# for the things we query (journal, year, completeness, country info), and
+# the authors and their countries in their own tables. Updates are written
+# per doi instead of rewriting the whole file. The JSON file stays the
+# reference (we add the country info there manually), so whenever it is
+# newer than what we imported last, we import it again.
+#####################################
+
+extendedPaperStoreSchema = '''
+CREATE TABLE IF NOT EXISTS papers (
+    doi TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    journal TEXT,
+    publication_year INTEGER,
+    is_complete INTEGER NOT NULL,
+    has_countries INTEGER NOT NULL,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS papers_journal ON papers (journal);
+CREATE INDEX IF NOT EXISTS papers_publication_year ON papers (publication_year);
+CREATE INDEX IF NOT EXISTS papers_is_complete ON papers (is_complete);
+CREATE INDEX IF NOT EXISTS papers_has_countries ON papers (has_countries);
+CREATE TABLE IF NOT EXISTS authors (
+    doi TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    family TEXT,
+    given TEXT,
+    orcid TEXT,
+    PRIMARY KEY (doi, position)
+);
+CREATE TABLE IF NOT EXISTS author_countries (
+    doi TEXT NOT NULL,
+    author_position INTEGER NOT NULL,
+    country TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS author_countries_doi ON author_countries (doi);
+CREATE INDEX IF NOT EXISTS author_countries_country ON author_countries (country);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+'''
+
+def isExtendedPaperComplete(entry):
+    # incomplete entries (e.g., papers still in press) are looked up again
+    return not ((entry['volume'] == '') or (entry['pages'] == '') or (entry['number_of_pages'] < 1) or (entry['abstract'] == ''))
+
+def openExtendedPaperStore(fileName):
+    if os.path.dirname(fileName) != '': os.makedirs(os.path.dirname(fileName), exist_ok=True)
+    store = sqlite3.connect(fileName)
+    store.executescript(extendedPaperStoreSchema)
+    return store
+
+def getStoreMetadata(store, key):
+    row = store.execute("SELECT value FROM metadata WHERE key = ?", (key,)).fetchone()
+    if row == None: return None
+    return row[0]
+
+def setStoreMetadata(store, key, value):
+    store.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)", (key, value))
+
+def writeExtendedPaper(store, doi, entry, position):
+    store.execute("INSERT OR REPLACE INTO papers (doi, position, journal, publication_year, is_complete, has_countries, entry) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (doi, position, entry.get('journal'), entry.get('publication_year'), int(isExtendedPaperComplete(entry)), int('countries' in entry.keys()), json.dumps(entry)))
+    store.execute("DELETE FROM authors WHERE doi = ?", (doi,))
+    store.execute("DELETE FROM author_countries WHERE doi = ?", (doi,))
+    for authorPosition, author in enumerate(entry.get('authors', [])):
+        store.execute("INSERT INTO authors (doi, position, family, given, orcid) VALUES (?, ?, ?, ?, ?)", (doi, authorPosition, author.get('family'), author.get('given'), author.get('orcid')))
+        for country in author.get('countries', []):
+            store.execute("INSERT INTO author_countries (doi, author_position, country) VALUES (?, ?, ?)", (doi, authorPosition, country))
+
+def upsertExtendedPaper(store, doi, entry):
+    # new papers go to the end (as in the JSON file), updated ones keep their position
+    with store:
+        row = store.execute("SELECT position FROM papers WHERE doi = ?", (doi,)).fetchone()
+        if row != None: position = row[0]
+        else: position = store.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM papers").fetchone()[0]
+        writeExtendedPaper(store, doi, entry, position)
+
+def importExtendedPaperData(store, paperListExtended, jsonFileName = None):
+    # replaces everything in the store with the data (as we read it from the JSON file)
+    with store:
+        store.execute("DELETE FROM papers")
+        store.execute("DELETE FROM authors")
+        store.execute("DELETE FROM author_countries")
+        for position, doi in enumerate(paperListExtended.keys()):
+            writeExtendedPaper(store, doi, paperListExtended[doi], position)
+        if jsonFileName != None: setStoreMetadata(store, 'json_mtime', repr(os.path.getmtime(jsonFileName)))
+
+def syncExtendedPaperStore(store, jsonFileName):
+    # import the JSON file if it changed since we last imported or exported it
+    if getStoreMetadata(store, 'json_mtime') != repr(os.path.getmtime(jsonFileName)):
+        with open(jsonFileName, "r", encoding='utf-8') as f:
+            importExtendedPaperData(store, json.load(f), jsonFileName)
+        return True
+    return False
+
+def getExtendedPaper(store, doi):
+    row = store.execute("SELECT entry FROM papers WHERE doi = ?", (doi,)).fetchone()
+    if row == None: return None
+    return json.loads(row[0])
+
+def loadExtendedPaperData(store):
+    # the same dict (and order) that we would get by loading the JSON file
+    paperListExtended = {}
+    for doi, entry in store.execute("SELECT doi, entry FROM papers ORDER BY position"):
+        paperListExtended[doi] = json.loads(entry)
+    return paperListExtended
+
+def exportExtendedPaperData(store, jsonFileName):
+    # safely, via a temporary file, since the journal is removed after the export (see compactExtendedPaperJournal)
+    with open(jsonFileName + ".tmp", "w", encoding='utf-8') as f:
+        json.dump(loadExtendedPaperData(store), f, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(jsonFileName + ".tmp", jsonFileName)
+    with store:
+        setStoreMetadata(store, 'json_mtime', repr(os.path.getmtime(jsonFileName)))
+
+def findIncompleteDois(store):
+    return [row[0] for row in store.execute("SELECT doi FROM papers WHERE is_complete = 0 ORDER BY position")]
+
+def findDoisWithoutCountries(store):
+    return [row[0] for row in store.execute("SELECT doi FROM papers WHERE has_countries = 0 ORDER BY position")]
+
+def findDoisPublishedAfter(store, year, doiPrefix = ''):
+    # e.g., the papers that are still in press (their publication year is in the future)
+    return [row[0] for row in store.execute("SELECT doi FROM papers WHERE publication_year > ? AND doi LIKE ? ORDER BY position", (year, doiPrefix + '%'))]
+
+def findDoisForJournal(store, journal):
+    return [row[0] for row in store.execute("SELECT doi FROM papers WHERE journal = ? ORDER BY position", (journal,))]
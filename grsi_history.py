@@ -0,0 +1,143 @@
+#!/usr/bin/python3
+
+import os
+import re
+import glob
+import gzip
+import json
+import hashlib
+import difflib
+
+#####################################
+# The history of the GRSI paper list, one snapshot per day, stored as
+# deltas instead of a full "YYYYMMDD grsi paper data.json" copy per day.
+# Each paper entry is identified by a hash of its content, and each day is
+# one compressed file with the changes of the list of hashes compared to
+# the previous stored day (which entries were added, removed, or replaced,
+# at which positions) plus the entries that we had not seen before. The
+# first day is simply a delta to the empty list. To get the list of a given
+# day, we replay the deltas up to this day.
+#####################################
+
+def paperContentHash(paperItem):
+    return hashlib.sha256(json.dumps(paperItem, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+def openGrsiHistory(directory):
+    os.makedirs(directory, exist_ok=True)
+    grsiHistory = {}
+    grsiHistory["directory"] = directory
+    grsiHistory["dates"] = sorted([os.path.basename(fileName)[0:8] for fileName in glob.glob(os.path.join(directory, "????????.json.gz"))])
+    grsiHistory["latest"] = None # (date, hashes, papers) of the last day we replayed to, so that appending does not need a full replay
+    return grsiHistory
+
+def hasGrsiSnapshot(grsiHistory, date):
+    return date in grsiHistory["dates"]
+
+def readGrsiDelta(grsiHistory, date):
+    with gzip.open(os.path.join(grsiHistory["directory"], date + ".json.gz"), "rt", encoding='utf-8') as f:
+        return json.load(f)
+
+def writeGrsiDelta(grsiHistory, date, delta):
+    fileName = os.path.join(grsiHistory["directory"], date + ".json.gz")
+    with gzip.open(fileName + ".tmp", "wt", encoding='utf-8') as f:
+        json.dump(delta, f)
+    os.replace(fileName + ".tmp", fileName)
+
+def applyGrsiDelta(hashes, papers, delta):
+    # returns the new list of hashes; papers (hash -> entry) gets the new entries
+    papers.update(delta["papers"])
+    newHashes = []
+    position = 0
+    for operation in delta["operations"]:
+        if operation[0] == "keep":
+            newHashes += hashes[position:position + operation[1]]
+            position += operation[1]
+        elif operation[0] == "remove":
+            position += operation[1]
+        elif operation[0] == "add":
+            newHashes += operation[1]
+    return newHashes
+
+def grsiDeltaChanges(previousHashes, delta):
+    # the hashes that the delta removes from the previous list and the ones it adds
+    removedHashes = []
+    addedHashes = []
+    position = 0
+    for operation in delta["operations"]:
+        if operation[0] == "keep":
+            position += operation[1]
+        elif operation[0] == "remove":
+            removedHashes += previousHashes[position:position + operation[1]]
+            position += operation[1]
+        elif operation[0] == "add":
+            addedHashes += operation[1]
+    return removedHashes, addedHashes
+
+def computeGrsiDelta(previousHashes, hashes, knownPapers, paperList, previousDate):
+    # the operations transform the previous list of hashes into the new one
+    operations = []
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, previousHashes, hashes, autojunk=False).get_opcodes():
+        if tag == "equal": operations.append(["keep", i2 - i1])
+        if tag in ["delete", "replace"]: operations.append(["remove", i2 - i1])
+        if tag in ["insert", "replace"]: operations.append(["add", hashes[j1:j2]])
+    newPapers = {}
+    for paperHash, paperItem in zip(hashes, paperList):
+        if not (paperHash in knownPapers.keys()): newPapers[paperHash] = paperItem
+    return { "previous": previousDate, "operations": operations, "papers": newPapers }
+
+def iterateGrsiSnapshots(grsiHistory, untilDate = None):
+    # replays the history and yields (date, hashes, papers, delta) for each stored day (papers: hash -> entry, of all days so far)
+    hashes = []
+    papers = {}
+    for date in grsiHistory["dates"]:
+        if (untilDate != None) and (date > untilDate): break
+        delta = readGrsiDelta(grsiHistory, date)
+        hashes = applyGrsiDelta(hashes, papers, delta)
+        yield date, hashes, papers, delta
+
+def replayGrsiHistory(grsiHistory, untilDate):
+    # the (date, hashes, papers) of the last stored day up to untilDate
+    if (grsiHistory["latest"] != None) and (grsiHistory["latest"][0] == untilDate): return grsiHistory["latest"]
+    replayed = (None, [], {})
+    for date, hashes, papers, delta in iterateGrsiSnapshots(grsiHistory, untilDate):
+        replayed = (date, hashes, papers)
+    if (len(grsiHistory["dates"]) > 0) and (replayed[0] == grsiHistory["dates"][-1]): grsiHistory["latest"] = replayed
+    return replayed
+
+def materializeGrsiSnapshot(grsiHistory, date):
+    # the paper list of that day (or None if we do not have that day)
+    if not hasGrsiSnapshot(grsiHistory, date): return None
+    replayedDate, hashes, papers = replayGrsiHistory(grsiHistory, date)
+    return [json.loads(json.dumps(papers[paperHash])) for paperHash in hashes] # deep copies
+
+def storeGrsiSnapshot(grsiHistory, date, paperList):
+    # adds (or replaces) the snapshot of the day; only the latest day can be replaced, earlier days are fixed
+    if (len(grsiHistory["dates"]) > 0) and (date < grsiHistory["dates"][-1]):
+        if materializeGrsiSnapshot(grsiHistory, date) != paperList:
+            print("WARNING: Not storing the GRSI data of " + date + " in the history, since we already have later days there.")
+        return False
+    previousDates = [otherDate for otherDate in grsiHistory["dates"] if otherDate < date]
+    previousDate = previousDates[-1] if (len(previousDates) > 0) else None
+    if previousDate != None: replayedDate, previousHashes, knownPapers = replayGrsiHistory(grsiHistory, previousDate)
+    else: previousHashes, knownPapers = [], {}
+    knownPapers = dict(knownPapers)
+    hashes = [paperContentHash(paperItem) for paperItem in paperList]
+    delta = computeGrsiDelta(previousHashes, hashes, knownPapers, paperList, previousDate)
+    writeGrsiDelta(grsiHistory, date, delta)
+    if not (date in grsiHistory["dates"]): grsiHistory["dates"].append(date)
+    knownPapers.update(delta["papers"])
+    grsiHistory["latest"] = (date, hashes, knownPapers)
+    return True
+
+def importGrsiSnapshotFiles(grsiHistory, directory):
+    # adds the old "YYYYMMDD grsi paper data.json" files that are newer than what we have in the history
+    # returns the list of the imported files (which can then be deleted)
+    importedFiles = []
+    for fileName in sorted(glob.glob(os.path.join(directory, "???????? grsi paper data.json"))):
+        date = os.path.basename(fileName)[0:8]
+        if not re.fullmatch(r"\d{8}", date): continue
+        if (len(grsiHistory["dates"]) > 0) and (date <= grsiHistory["dates"][-1]): continue
+        with open(fileName, "r", encoding='utf-8') as f:
+            storeGrsiSnapshot(grsiHistory, date, json.load(f))
+        importedFiles.append(fileName)
+    return importedFiles
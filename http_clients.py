@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit
+
+#####################################
+# The HTTP connections that the query modules share. Instead of opening a
+# new connection (and doing a new TLS handshake) for every DOI, we keep one
+# session with a pool of keep-alive connections per host, and the API
+# clients (base URL plus the headers/parameters with the API keys) are made
+# once and then reused. Timeouts, compression, and the pool size are set
+# here for all publishers.
+#####################################
+
+httpSettings = {
+    "timeout": 30, # seconds, for connecting and for each read
+    "pool_size": 8, # connections per host, should match the number of workers that query concurrently
+    "gzip": True,
+    "user_agent": "Visualization-Reproducibility (https://github.com/tobiasisenberg/Visualization-Reproducibility)",
+}
+
+httpSessions = {} # host -> session
+apiClients = {} # (base URL, headers, parameters) -> client
+httpClientsLock = threading.Lock()
+
+def configureHttpClients(timeout = None, poolSize = None, gzip = None, userAgent = None):
+    # only affects sessions that are made after the call, so it should happen before the first query
+    if timeout != None: httpSettings["timeout"] = timeout
+    if poolSize != None: httpSettings["pool_size"] = poolSize
+    if gzip != None: httpSettings["gzip"] = gzip
+    if userAgent != None: httpSettings["user_agent"] = userAgent
+
+def getHttpSession(url):
+    # the session for the host of the url (made on first use)
+    host = urlsplit(url).netloc.lower()
+    with httpClientsLock:
+        if not (host in httpSessions.keys()):
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections = 1, pool_maxsize = httpSettings["pool_size"])
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["User-Agent"] = httpSettings["user_agent"]
+            session.headers["Accept-Encoding"] = "gzip, deflate" if httpSettings["gzip"] else "identity"
+            httpSessions[host] = session
+        return httpSessions[host]
+
+def httpGet(url, params = None, headers = None):
+    return getHttpSession(url).get(url, params = params, headers = headers, timeout = httpSettings["timeout"])
+
+def httpPost(url, data = None, headers = None):
+    return getHttpSession(url).post(url, data = data, headers = headers, timeout = httpSettings["timeout"])
+
+def getApiClient(baseUrl, headers = {}, params = {}):
+    # headers/params are sent with every call of this client (e.g., the API key)
+    key = (baseUrl, tuple(sorted(headers.items())), tuple(sorted(params.items())))
+    with httpClientsLock:
+        if not (key in apiClients.keys()):
+            apiClients[key] = { "base_url": baseUrl, "headers": dict(headers), "params": dict(params) }
+        return apiClients[key]
+
+def apiGet(apiClient, path = "", params = {}):
+    allParams = dict(apiClient["params"])
+    allParams.update(params)
+    return httpGet(apiClient["base_url"] + path, params = allParams, headers = apiClient["headers"])
+
+def closeHttpSessions():
+    with httpClientsLock:
+        for session in httpSessions.values(): session.close()
+        httpSessions.clear()
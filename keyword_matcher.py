@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+
+import re
+
+#####################################
+# A matcher for keyword rules in titles and abstracts. A rule is a list of
+# terms that all have to appear in the text (e.g., ["visual", "analytics"]),
+# and all terms of all rules are compiled into a single regular expression,
+# so that each text is lowercased and scanned only once. The matcher then
+# reports which rules fired, not only whether any did.
+#####################################
+
+def keywordRuleName(rule):
+    return "+".join(rule)
+
+def compileKeywordRules(rules):
+    terms = []
+    for rule in rules:
+        for term in rule:
+            if not (term in terms): terms.append(term)
+
+    # the longest term that starts at a position wins the alternation, so we remember
+    # for each term all shorter terms that are its prefixes (and thus also start there)
+    termsStartingWith = {}
+    for term in terms:
+        termsStartingWith[term] = set([otherTerm for otherTerm in terms if term.startswith(otherTerm)])
+
+    # the lookahead lets us find matches at every position, including overlapping ones
+    alternatives = "|".join([re.escape(term) for term in sorted(terms, key=len, reverse=True)])
+    matcher = {}
+    matcher["regex"] = re.compile("(?=(" + alternatives + "))")
+    matcher["terms_starting_with"] = termsStartingWith
+    matcher["rules"] = [(keywordRuleName(rule), set(rule)) for rule in rules]
+    return matcher
+
+def findKeywordTerms(matcher, text):
+    foundTerms = set()
+    for match in matcher["regex"].finditer(text.lower()):
+        foundTerms.update(matcher["terms_starting_with"][match.group(1)])
+    return foundTerms
+
+def matchKeywordRules(matcher, text):
+    # the names of all rules that fired for this text, in the order of the rule table
+    foundTerms = findKeywordTerms(matcher, text)
+    return [ruleName for ruleName, ruleTerms in matcher["rules"] if ruleTerms.issubset(foundTerms)]
+
+def hasKeywordMatch(matcher, text):
+    return len(matchKeywordRules(matcher, text)) > 0
@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+
+import csv
+from grsi_history import iterateGrsiSnapshots, grsiDeltaChanges
+
+#####################################
+# How the main numbers (papers, visualization papers, papers per venue,
+# papers in press) changed over all days in the GRSI data history. Instead
+# of redoing the whole analysis for each day, we replay the history once
+# and only update the counters with the entries that each day's delta
+# removed or added. Whether a paper was in press on a given day we derive
+# from its (current) publication year in the extended paper data.
+#####################################
+
+def paperMetricCounters(paperItem, venueFunction):
+    # the counters to which this paper contributes
+    counters = ["papers", "venue:" + venueFunction(paperItem)]
+    if paperItem.get("is_vis", False): counters.append("vis_papers")
+    return counters
+
+def computeLongitudinalMetrics(grsiHistory, paperListExtended, venueFunction):
+    # returns one row per stored day: {"date": ..., "papers": ..., "vis_papers": ..., "in_press": ..., "venue:...": ...}
+    counts = { "papers": 0, "vis_papers": 0 }
+    publicationYearCounts = {}
+    previousHashes = []
+    rows = []
+    for date, hashes, papers, delta in iterateGrsiSnapshots(grsiHistory):
+        removedHashes, addedHashes = grsiDeltaChanges(previousHashes, delta)
+        for paperHash, change in [(paperHash, -1) for paperHash in removedHashes] + [(paperHash, 1) for paperHash in addedHashes]:
+            paperItem = papers[paperHash]
+            for counter in paperMetricCounters(paperItem, venueFunction):
+                counts[counter] = counts.get(counter, 0) + change
+            if paperItem["doi"] in paperListExtended.keys():
+                publicationYear = paperListExtended[paperItem["doi"]]["publication_year"]
+                publicationYearCounts[publicationYear] = publicationYearCounts.get(publicationYear, 0) + change
+        previousHashes = hashes
+
+        row = { "date": date[0:4] + "-" + date[4:6] + "-" + date[6:8] }
+        row.update(counts)
+        row["in_press"] = sum([count for publicationYear, count in publicationYearCounts.items() if publicationYear > int(date[0:4])])
+        rows.append(row)
+    return rows
+
+def writeLongitudinalMetrics(rows, fileName):
+    # as a table with one line per day (venues that did not exist yet on a day are 0)
+    columns = ["date", "papers", "vis_papers", "in_press"]
+    for row in rows:
+        for column in row.keys():
+            if not (column in columns): columns.append(column)
+    with open(fileName, "w", encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, restval=0)
+        writer.writeheader()
+        for row in rows: writer.writerow(row)
@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+
+import re
+
+#####################################
+# Numbers for the paper (the \newcommand macros in numbersFromScript.tex)
+# that are computed lazily. Each producer has a name, the names of the
+# producers whose results it needs, and the patterns of the macros it
+# defines. It is only evaluated (once) when someone asks for its result,
+# either the plotting code that also uses the data or the export of the
+# macros. So if we only need the numbers that the paper actually uses, we
+# only evaluate the producers of these macros (and what they depend on).
+#####################################
+
+def createPaperNumbers():
+    paperNumbers = {}
+    paperNumbers["producers"] = {} # name -> {"function": ..., "dependencies": [...], "macros": [compiled patterns]}
+    paperNumbers["results"] = {} # name -> result of the evaluated producers
+    paperNumbers["evaluating"] = [] # to detect dependency cycles
+    return paperNumbers
+
+def registerPaperNumbers(paperNumbers, name, function, dependencies = [], macroPatterns = []):
+    # function(*results of the dependencies) returns a dict, whose "macros" (if any) are a list of (macro name without backslash, value)
+    paperNumbers["producers"][name] = { "function": function, "dependencies": list(dependencies), "macros": [re.compile(pattern) for pattern in macroPatterns] }
+
+def evaluatePaperNumbers(paperNumbers, name):
+    if name in paperNumbers["results"].keys(): return paperNumbers["results"][name]
+    if name in paperNumbers["evaluating"]: raise ValueError("cyclic dependency of the paper numbers: " + " -> ".join(paperNumbers["evaluating"] + [name]))
+    paperNumbers["evaluating"].append(name)
+    producer = paperNumbers["producers"][name]
+    dependencyResults = [evaluatePaperNumbers(paperNumbers, dependency) for dependency in producer["dependencies"]]
+    paperNumbers["results"][name] = producer["function"](*dependencyResults)
+    paperNumbers["evaluating"].pop()
+    return paperNumbers["results"][name]
+
+def producesUsedMacro(producer, usedMacros):
+    return any([pattern.fullmatch(macro) != None for pattern in producer["macros"] for macro in usedMacros])
+
+def findUsedMacros(texFileNames):
+    # the names of all macros that the LaTeX files use (ignoring commented-out parts)
+    usedMacros = set()
+    for texFileName in texFileNames:
+        with open(texFileName, "r", encoding='utf-8') as f:
+            for line in f:
+                usedMacros.update(re.findall(r"\\([A-Za-z]+)", re.sub(r"(?<!\\)%.*", "", line)))
+    return usedMacros
+
+def paperNumbersLatex(paperNumbers, usedMacros = None):
+    # the \newcommand lines of the producers that define any of the used macros (or of all producers if usedMacros is None), in the order of registration
+    latexString = ""
+    for name, producer in paperNumbers["producers"].items():
+        if (len(producer["macros"]) == 0) or ((usedMacros != None) and not producesUsedMacro(producer, usedMacros)): continue
+        for macroName, value in evaluatePaperNumbers(paperNumbers, name).get("macros", []):
+            latexString += "\\newcommand{\\" + macroName + "}{" + str(value) + "}\n"
+    return latexString
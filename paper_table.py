@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+
+import math
+import numpy as np
+import pandas as pd
+
+#####################################
+# One table of all papers (for which we have the extended data) with the
+# columns that the plots group by, built once after the classification.
+# The year x category series for the time-series plots (with zeros for
+# years without papers, and the extra "in press" year at the end) are then
+# counted in one vectorized pass per breakdown, instead of a separate loop
+# with nested dictionaries for each of them.
+#####################################
+
+def buildPaperTable(paperList, paperListExtended, venueFunction, referenceYear, inPressYear):
+    # venueFunction(journalName) gives the (shortened) venue name we use in the plots
+    # referenceYear: the year of the data download (the series always include it), inPressYear: the fake year of the papers in press
+    rows = { "doi": [], "publication_year": [], "venue": [], "is_vis": [], "type": [] }
+    for paper in paperList:
+        if not (paper["doi"] in paperListExtended.keys()): continue
+        paperExtended = paperListExtended[paper["doi"]]
+        rows["doi"].append(paper["doi"])
+        rows["publication_year"].append(paperExtended["publication_year"])
+        rows["venue"].append(venueFunction(paperExtended["journal"]))
+        rows["is_vis"].append(bool(paper["is_vis"]))
+        rows["type"].append(paper.get("type", None))
+    paperTable = pd.DataFrame(rows)
+    paperTable["in_press"] = paperTable["publication_year"] == inPressYear
+    paperTable.attrs["reference_year"] = referenceYear
+    paperTable.attrs["in_press_year"] = inPressYear
+    return paperTable
+
+def orderedCategories(categories, presetCategories = []):
+    # the preset ones first (in their order), then the others in the order in which they appear in the papers
+    return list(presetCategories) + [category for category in pd.unique(categories) if not (category in presetCategories)]
+
+def yearCategorySeries(paperTable, categories, dataField, presetCategories = [], rowMask = None, nanMaskFunction = None):
+    # the data for plotTimeSeriesPublicationData: [{dataField: category, "order": ..., "year": "YYYY" or "in press", "count": ...}, ...]
+    # categories: one value per row of the table (e.g., paperTable["venue"]), rowMask: which papers to count
+    # nanMaskFunction(category, year) can replace empty (0) counts with nan, so that the line graphs leave a gap there
+    if rowMask is None: rowMask = np.ones(len(paperTable), dtype=bool)
+    referenceYear = paperTable.attrs["reference_year"]
+    inPressYear = paperTable.attrs["in_press_year"]
+    categories = pd.Series(categories, index=paperTable.index)[rowMask]
+    publicationYears = paperTable["publication_year"][rowMask].to_numpy()
+
+    # all the real years (including the reference year, even if it does not have papers yet), plus the in-press year at the end
+    publishedYears = publicationYears[publicationYears != inPressYear]
+    earliestYear = min([referenceYear] + publishedYears.tolist())
+    latestYear = max([referenceYear] + publishedYears.tolist())
+    listOfYears = list(range(earliestYear, latestYear + 1)) + [inPressYear]
+    yearIndices = np.where(publicationYears == inPressYear, len(listOfYears) - 1, publicationYears - earliestYear)
+
+    allCategories = orderedCategories(categories, presetCategories)
+    categoryCodes = pd.Categorical(categories, categories=allCategories).codes
+    counts = np.bincount(categoryCodes * len(listOfYears) + yearIndices, minlength=len(allCategories) * len(listOfYears)).reshape(len(allCategories), len(listOfYears))
+
+    dataToPlot = []
+    for categoryIndex, category in enumerate(allCategories):
+        for yearIndex, year in enumerate(listOfYears):
+            dataItem = {}
+            dataItem[dataField] = category
+            dataItem["order"] = categoryIndex + 1
+            dataItem["year"] = "in press" if (year == inPressYear) else str(year)
+            dataItem["count"] = int(counts[categoryIndex, yearIndex])
+            if (dataItem["count"] == 0) and (nanMaskFunction != None) and nanMaskFunction(category, year): dataItem["count"] = math.nan
+            dataToPlot.append(dataItem)
+    return dataToPlot
@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+
+import os
+import glob
+import json
+import shutil
+import hashlib
+
+#####################################
+# Make-style stages of the script. Each stage declares the files it reads
+# (as glob patterns), and after it ran we record in a manifest the content
+# hashes of these files and of the files it wrote, plus (optionally) a hash
+# of the data it got from the earlier stages (e.g., the classified papers).
+# The next time we only run the stage again if any of its inputs or this
+# data changed, or if any of its outputs is missing or was changed since.
+# A stage that copies files records each copied file on its own, so that
+# it only copies those whose source changed.
+#####################################
+
+def openStageManifest(fileName):
+    # fileName: where we keep the hashes (None: all stages are always stale)
+    stageManifest = {}
+    stageManifest["file"] = fileName
+    stageManifest["stages"] = {} # name -> {"inputs": {file: hash}, "outputs": {file: hash}, "data": hash}
+    if (fileName != None) and os.path.isfile(fileName):
+        with open(fileName, "r", encoding='utf-8') as f:
+            stageManifest["stages"] = json.load(f)
+    return stageManifest
+
+def saveStageManifest(stageManifest):
+    if stageManifest["file"] == None: return
+    if os.path.dirname(stageManifest["file"]) != '': os.makedirs(os.path.dirname(stageManifest["file"]), exist_ok=True)
+    with open(stageManifest["file"], "w", encoding='utf-8') as f:
+        json.dump(stageManifest["stages"], f, indent=1, sort_keys=True)
+
+def fileContentHash(fileName):
+    # None if the file does not exist
+    if not os.path.isfile(fileName): return None
+    fileHash = hashlib.sha256()
+    with open(fileName, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            fileHash.update(block)
+    return fileHash.hexdigest()
+
+def dataContentHash(data):
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+def expandStageFiles(patterns):
+    return sorted(set([os.path.normpath(fileName) for pattern in patterns for fileName in glob.glob(pattern)]))
+
+def stageFileHashes(fileNames):
+    return { fileName: fileContentHash(fileName) for fileName in fileNames }
+
+def isStageCurrent(stageManifest, name, inputPatterns, dataHash = None):
+    if (stageManifest["file"] == None) or not (name in stageManifest["stages"].keys()): return False
+    stage = stageManifest["stages"][name]
+    if stage["data"] != dataHash: return False
+    if stage["inputs"] != stageFileHashes(expandStageFiles(inputPatterns)): return False
+    return stage["outputs"] == stageFileHashes(stage["outputs"].keys())
+
+def stageRecord(inputPatterns, outputFiles, dataHash = None):
+    stage = {}
+    stage["inputs"] = stageFileHashes(expandStageFiles(inputPatterns))
+    stage["outputs"] = stageFileHashes(sorted(set([os.path.normpath(fileName) for fileName in outputFiles])))
+    stage["data"] = dataHash
+    return stage
+
+def recordStage(stageManifest, name, inputPatterns, outputFiles, dataHash = None):
+    # after the stage ran (and wrote all of outputFiles)
+    stageManifest["stages"][name] = stageRecord(inputPatterns, outputFiles, dataHash)
+    saveStageManifest(stageManifest)
+
+def copyChangedFiles(stageManifest, name, filePairs):
+    # filePairs: (source, target), we only copy a file if its source changed since we last copied it or if its target is missing or was changed,
+    # so that the other targets keep their modification times; each pair is recorded as its own stage (name + ":" + target), returns the copied targets
+    copiedFiles = []
+    for sourceFile, targetFile in filePairs:
+        if not os.path.isfile(sourceFile):
+            print("WARNING: Could not copy " + sourceFile + " since it does not exist")
+            continue
+        pairName = name + ":" + os.path.normpath(targetFile)
+        if isStageCurrent(stageManifest, pairName, [sourceFile]): continue
+        shutil.copy(sourceFile, targetFile)
+        stageManifest["stages"][pairName] = stageRecord([sourceFile], [targetFile])
+        copiedFiles.append(targetFile)
+    if len(copiedFiles) > 0: saveStageManifest(stageManifest)
+    return copiedFiles
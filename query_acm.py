@@ -3,19 +3,18 @@
 import os,sys
 import json
 import re
-import requests
 import datetime
 
 from acmdownload import PageParser
 from acmdownload import CitationParser
+from response_cache import getResponse
+from http_clients import httpGet, httpPost
 
-def generateEntryForDoi(doi, apiKey = ''):
-    # find the correct date string to be able to read and write the correct files
-    current_date = datetime.datetime.now()
-    current_year = current_date.year
+def fetchResponseForDoi(doi, apiKey = ''):
+    # the raw response of the API (which we may cache)
 
     # first part copied from the acmdownloads script
-    r = requests.get('https://dl.acm.org/doi/' + doi)
+    r = httpGet('https://dl.acm.org/doi/' + doi)
     page_parser = PageParser()
 
     page_parser.feed(r.text)
@@ -26,14 +25,14 @@ def generateEntryForDoi(doi, apiKey = ''):
         doc['title'] = page_parser.title
 
     if page_parser.cbu:
-        r = requests.get('https://dl.acm.org' + page_parser.cbu)
+        r = httpGet('https://dl.acm.org' + page_parser.cbu)
         citation_parser = CitationParser()
         citation_parser.feed(r.text)
         doc['citedby'] = citation_parser.links
     else:
         doc['citedby'] = []
 
-    r = requests.post('https://dl.acm.org/action/exportCiteProcCitation', data={
+    r = httpPost('https://dl.acm.org/action/exportCiteProcCitation', data={
         'dois': doi,
         'targetFile': 'custom-bibtex',
         'format': 'bibTex'
@@ -45,7 +44,20 @@ def generateEntryForDoi(doi, apiKey = ''):
     # with open('acm-test.txt', 'w', encoding='utf-8') as f:
     #     f.write(text)
     
-    if "ACM Error: IP blocked" in text: print("WARNING: We got IP-blocked by ACM, try again later or use VPN.")
+    if "ACM Error: IP blocked" in text:
+        print("WARNING: We got IP-blocked by ACM, try again later or use VPN.")
+        return None
+    return text
+
+def generateEntryForDoi(doi, apiKey = '', responseCache = None):
+    text = getResponse(responseCache, 'acm', doi, lambda: fetchResponseForDoi(doi, apiKey))
+    if text == None: return {}
+    return generateEntryFromResponse(text)
+
+def generateEntryFromResponse(text):
+    # find the correct date string to be able to read and write the correct files
+    current_date = datetime.datetime.now()
+    current_year = current_date.year
 
     data = json.loads(text)
     values = list(data["items"][0].values())[0]
@@ -5,15 +5,79 @@ import json
 import re
 import time # if the calls are limited somehow
 import datetime
-from habanero import Crossref
-
-def generateEntryForDoi(doi, apiKey = ''):
+from urllib.parse import quote
+from response_cache import getResponse, getCachedResponse, storeResponse
+from http_clients import getApiClient, apiGet
+
+crossrefApiUrl = 'https://api.crossref.org/works/'
+crossrefBatchSize = 40 # dois per filter query, so that the query url does not get too long
+
+def fetchResponseForDoi(doi, apiKey = ''):
+    # the raw response of the API (which we may cache), the same that habanero's Crossref().works(ids = doi) gives us
+    response = apiGet(getApiClient(crossrefApiUrl), quote(doi, safe = '/'))
+    response.raise_for_status()
+    return response.json()
+
+def fetchResponsesForDois(dois):
+    # one filter query for all the dois; returns doi -> raw response, in the same form as for a single doi
+    # (dois that Crossref does not know are simply missing)
+    response = apiGet(getApiClient(crossrefApiUrl), params = { 'filter': ','.join(['doi:' + doi for doi in dois]), 'rows': len(dois) })
+    response.raise_for_status()
+    values = response.json()
+    responses = {}
+    for item in values["message"]["items"]:
+        responses[item["DOI"].lower()] = { "status": values["status"], "message-type": "work", "message-version": values["message-version"], "message": item }
+    return responses
+
+def generateEntryForDoi(doi, apiKey = '', responseCache = None):
+    response = getResponse(responseCache, 'crossref', doi, lambda: fetchResponseForDoi(doi, apiKey))
+    if response == None: return {}
+    return generateEntryFromResponse(response)
+
+def generateEntriesForDois(dois, responseCache = None, batchSize = crossrefBatchSize):
+    # like generateEntryForDoi, but for many dois at once: the ones we do not have cached are looked up in batches
+    # returns doi -> data item (an empty dict if the lookup failed)
+    responses = {}
+    doisToFetch = []
+    for doi in dois:
+        response = getCachedResponse(responseCache, 'crossref', doi) if (responseCache != None) else None
+        if response != None: responses[doi] = response
+        elif (responseCache == None) or not responseCache["cache_only"]:
+            if ',' in doi: # would break the filter query
+                try:
+                    responses[doi] = getResponse(responseCache, 'crossref', doi, lambda: fetchResponseForDoi(doi))
+                except Exception as e:
+                    print("WARNING: Looking up doi " + doi + " via crossref failed: " + str(e))
+            else: doisToFetch.append(doi)
+
+    for batchStart in range(0, len(doisToFetch), batchSize):
+        batch = doisToFetch[batchStart:batchStart + batchSize]
+        try:
+            batchResponses = fetchResponsesForDois(batch)
+        except Exception as e:
+            print("WARNING: Looking up " + str(len(batch)) + " dois via crossref failed: " + str(e))
+            continue
+        for doi in batch:
+            if doi.lower() in batchResponses.keys():
+                responses[doi] = batchResponses[doi.lower()]
+                if responseCache != None: storeResponse(responseCache, 'crossref', doi, responses[doi])
+
+    entries = {}
+    for doi in dois:
+        entries[doi] = {}
+        if responses.get(doi) == None: continue
+        try:
+            entries[doi] = generateEntryFromResponse(responses[doi])
+        except Exception as e:
+            print("WARNING: Processing the crossref data for doi " + doi + " failed: " + str(e))
+    return entries
+
+def generateEntryFromResponse(response):
     # find the correct date string to be able to read and write the correct files
     current_date = datetime.datetime.now()
     current_year = current_date.year
 
-    cr = Crossref()
-    values = cr.works(ids = doi)["message"]
+    values = response["message"]
 
     # with open("crossref-test.json", "w", encoding='utf-8') as f:
     #     json.dump(values, f, indent=4)
@@ -87,7 +151,7 @@ def manualProcessing():
     pathOfTheScript = os.path.dirname(sys.argv[0])
     os.chdir(pathOfTheScript)
 
-    # API documentation: https://github.com/sckott/habanero
+    # API documentation: https://api.crossref.org/swagger-ui/index.html
 
     # doiList = '10.1111/cgf.14550 10.1111/cgf.14533 10.1111/cgf.14747 10.1111/cgf.14784 10.1111/cgf.14734 10.1111/cgf.14693 10.1111/cgf.14487 10.1111/cgf.14609 10.1111/cgf.14615 10.1111/cgf.14550 10.1111/cgf.14607 10.1111/cgf.14533 10.1111/cgf.14402 10.1111/cgf.14420 10.1111/cgf.14488 10.1111/cgf.13815 10.1111/cgf.13951 10.1111/cgf.14460 10.1111/cgf.142632 10.1111/cgf.14367 10.1111/cgf.14368 10.1111/cgf.142625 10.1111/cgf.142659 10.1111/cgf.142654 10.1111/cgf.13910 10.1111/cgf.14061 10.1111/cgf.13592 10.1111/cgf.13934 10.1111/cgf.13492 10.1111/cgf.13395 10.1111/cgf.13253 10.1111/cgf.12979 10.1111/cgf.12974 10.1111/cgf.12970 10.1111/cgf.12975 10.1111/cgf.12973 10.1111/cgf.12962'.lower().split(' ')
     # doiList = '10.1016/j.cag.2024.01.001 10.1016/j.cag.2023.08.012 10.1016/j.cag.2023.08.009 10.1016/j.cag.2023.08.014 10.1016/j.cag.2023.07.034 10.1016/j.cag.2023.06.013 10.1016/j.cag.2023.05.025 10.1016/j.cag.2023.07.035 10.1016/j.cag.2023.08.008 10.1016/j.cag.2023.06.023 10.1016/j.cag.2023.07.001 10.1016/j.cag.2023.07.021 10.1016/j.cag.2023.07.028 10.1016/j.cag.2023.05.006 10.1016/j.cag.2023.06.031 10.1016/j.cag.2023.06.014 10.1016/j.cag.2023.06.012 10.1016/j.cag.2023.06.017 10.1016/j.cag.2023.06.015 10.1016/j.cag.2023.04.007 10.1016/j.cag.2022.10.008 10.1016/j.cag.2022.09.003 10.1016/j.cag.2022.08.003 10.1016/j.cag.2022.07.018 10.1016/j.cag.2022.07.020 10.1016/j.cag.2022.07.011 10.1016/j.cag.2022.07.004 10.1016/j.cag.2022.07.015 10.1016/j.cag.2022.06.008 10.1016/j.cag.2022.07.005 10.1016/j.simpa.2022.100367 10.1016/j.cag.2022.06.007 10.1016/j.cag.2022.06.001 10.1016/j.cag.2022.05.009 10.1016/j.cag.2021.10.017 10.1016/j.cag.2021.11.005 10.1016/j.cag.2021.10.021 10.1016/j.cag.2021.07.010 10.1016/j.cag.2021.06.010 10.1016/j.cag.2021.09.005 10.1016/j.cag.2021.09.013 10.1016/j.cag.2021.07.001 10.1016/j.cag.2021.07.022 10.1016/j.cad.2021.103069 10.1016/j.cag.2021.07.018 10.1016/j.cag.2021.06.015 10.1016/j.cag.2021.02.003 10.1016/j.cag.2021.01.014 10.1016/j.cag.2020.09.007 10.1016/j.cag.2020.09.001 10.1016/j.cag.2020.08.008 10.1016/j.cag.2020.07.007 10.1016/j.cag.2020.08.001 10.1016/j.cag.2020.06.001 10.1016/j.cag.2020.05.029 10.1016/j.cag.2020.05.028 10.1016/j.cag.2020.05.024 10.1016/j.gvc.2020.200013 10.1016/j.cag.2019.05.024 10.1016/j.cag.2018.05.015 10.1016/j.cag.2018.05.016 10.1016/j.cag.2018.05.014 10.1016/j.cad.2017.05.014 10.1016/j.cag.2017.05.006 10.1016/j.cad.2017.05.004 10.1016/j.cag.2016.05.015 10.1016/j.cag.2016.05.017 10.1016/j.cag.2016.05.009 10.1016/j.cag.2016.05.020 10.1016/j.cad.2016.05.001 10.1016/j.cad.2016.05.010'.lower().split(' ')
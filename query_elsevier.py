@@ -4,27 +4,39 @@ import os,sys
 import json
 import time # if the calls are limited somehow
 import datetime
-from elsapy.elsclient import ElsClient
-from elsapy.elsdoc import FullDoc
+from response_cache import getResponse
+from http_clients import getApiClient, apiGet
 
-def generateEntryForDoi(doi, apiKey = ''):
+elsevierApiUrl = 'https://api.elsevier.com/content/article/doi/'
+
+def fetchResponseForDoi(doi, apiKey = ''):
+    # the raw response of the API (which we may cache), the same that elsapy's FullDoc(doi = doi).data gives us
+    client = getApiClient(elsevierApiUrl, headers = { 'X-ELS-APIKey': apiKey, 'Accept': 'application/json' })
+    response = apiGet(client, doi)
+    if response.status_code != 200: return None
+    data = response.json()['full-text-retrieval-response']
+    if isinstance(data, list): data = data[0]
+    return data
+
+def generateEntryForDoi(doi, apiKey = '', responseCache = None):
+    return generateEntryFromResponse(getResponse(responseCache, 'elsevier', doi, lambda: fetchResponseForDoi(doi, apiKey)))
+
+def generateEntryFromResponse(response):
     # find the correct date string to be able to read and write the correct files
     current_date = datetime.datetime.now()
     current_year = current_date.year
 
-    client = ElsClient(apiKey)
-    scp_doc = FullDoc(doi = doi)
-    if scp_doc.read(client):
-        values = scp_doc.data["coredata"]
+    if response != None:
+        values = response["coredata"]
 
         # with open("elsevier-test.json", "w", encoding='utf-8') as f:
-        #     json.dump(scp_doc.data["coredata"], f, indent=4)
+        #     json.dump(response["coredata"], f, indent=4)
 
         # with open("elsevier-test2.json", "w", encoding='utf-8') as f:
-        #     json.dump(scp_doc.data, f, indent=4)
+        #     json.dump(response, f, indent=4)
 
         # with open("elsevier-debug.json", "w", encoding='utf-8') as f:
-        #     json.dump(scp_doc.data["coredata"], f, indent=4)
+        #     json.dump(response["coredata"], f, indent=4)
 
         dataItem = {}
         dataItem["doi"] = values["prism:doi"].lower()
@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+#####################################
+# Concurrent lookup of the extra paper data in the publishers' DLs. Each
+# publisher gets its own token bucket (calls per second, plus a small burst),
+# so that the requests to different publishers overlap while each of them
+# still stays within its own limits.
+#####################################
+
+# calls per second for each publisher (IEEE allows at most 10 calls per second, see query_ieee.py)
+publisherRateLimits = {
+    'crossref': 10.0,
+    'ieee': 10.0,
+    'elsevier': 5.0,
+    'acm': 2.0,
+}
+
+def createRateLimiter(callsPerSecond, burst = 1):
+    rateLimiter = {}
+    rateLimiter["rate"] = callsPerSecond
+    rateLimiter["capacity"] = float(burst)
+    rateLimiter["tokens"] = float(burst)
+    rateLimiter["last_update"] = time.monotonic()
+    rateLimiter["lock"] = threading.Lock()
+    return rateLimiter
+
+def waitForToken(rateLimiter):
+    # block until the bucket has a token for us, then take it
+    while True:
+        with rateLimiter["lock"]:
+            now = time.monotonic()
+            rateLimiter["tokens"] = min(rateLimiter["capacity"], rateLimiter["tokens"] + (now - rateLimiter["last_update"]) * rateLimiter["rate"])
+            rateLimiter["last_update"] = now
+            if rateLimiter["tokens"] >= 1.0:
+                rateLimiter["tokens"] -= 1.0
+                return
+            waitingTime = (1.0 - rateLimiter["tokens"]) / rateLimiter["rate"]
+        time.sleep(waitingTime)
+
+def fetchEntriesConcurrently(jobs, fetchFunctions, rateLimits = publisherRateLimits, maxWorkers = 8, isCachedFunction = None, onEntryFunction = None):
+    # jobs: list of (doi, publisher); fetchFunctions: publisher -> function(doi) that returns the data item
+    # returns doi -> data item (an empty dict if the lookup failed), the lookups finish in any order
+    # isCachedFunction(doi, publisher) can tell us that a lookup does not go to the network, so it does not need a token
+    # onEntryFunction(doi, dataItem) is called (in the calling thread) as soon as a lookup is done, e.g., to save it right away
+    rateLimiters = { publisher : createRateLimiter(rateLimits.get(publisher, 1.0)) for publisher in fetchFunctions.keys() }
+
+    def fetchEntry(doi, publisher):
+        if (isCachedFunction == None) or not isCachedFunction(doi, publisher): waitForToken(rateLimiters[publisher])
+        try:
+            return fetchFunctions[publisher](doi)
+        except Exception as e:
+            print("WARNING: Looking up doi " + doi + " via " + publisher + " failed: " + str(e))
+            return {}
+
+    # interleave the publishers, so that the workers waiting for one publisher's tokens do not hold up the others
+    jobsPerPublisher = {}
+    for doi, publisher in jobs: jobsPerPublisher.setdefault(publisher, []).append(doi)
+    interleavedJobs = []
+    for i in range(max([len(dois) for dois in jobsPerPublisher.values()], default = 0)):
+        for publisher in jobsPerPublisher.keys():
+            if i < len(jobsPerPublisher[publisher]): interleavedJobs.append((jobsPerPublisher[publisher][i], publisher))
+
+    entries = {}
+    with ThreadPoolExecutor(max_workers = maxWorkers) as executor:
+        futures = { executor.submit(fetchEntry, doi, publisher) : doi for doi, publisher in interleavedJobs }
+        for future in as_completed(futures.keys()):
+            entries[futures[future]] = future.result()
+            if onEntryFunction != None: onEntryFunction(futures[future], entries[futures[future]])
+    return entries
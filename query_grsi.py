@@ -0,0 +1,270 @@
+#!/usr/bin/python3
+
+import os
+import json
+import hashlib
+import codecs
+import urllib.error
+from urllib.request import urlopen, Request
+from html.parser import HTMLParser
+import re
+from author_names import normalizeAuthorList
+
+#####################################
+# Scraping of the papers from the GRSI page. We remember the HTTP validators
+# (ETag/Last-Modified) of the last download, so that we can ask the server
+# whether the page changed at all, and a content hash of each of the page's
+# paper sections together with the paper item we made from it, so that we
+# only need to process the sections that are new or that changed. The page
+# is parsed while it is downloaded, one paper section at a time, and since
+# the newest papers come first we can optionally stop reading once we only
+# see papers we already know.
+#####################################
+
+grsiPageUrl = 'https://www.replicabilitystamp.org/'
+
+def loadGrsiScrapeState(fileName):
+    scrapeState = { "etag": None, "last_modified": None, "rules_version": None, "papers": [], "section_hashes": {} }
+    if os.path.isfile(fileName):
+        try:
+            with open(fileName, "r", encoding='utf-8') as f:
+                scrapeState.update(json.load(f))
+        except (OSError, ValueError): # then we simply download and process the whole page again
+            print("The GRSI scrape state could not be read, so we process the whole GRSI page again.")
+    return scrapeState
+
+def saveGrsiScrapeState(fileName, scrapeState):
+    # via a temporary file, so that a killed run never leaves a half-written state behind
+    os.makedirs(os.path.dirname(fileName), exist_ok=True)
+    with open(fileName + ".tmp", "w", encoding='utf-8') as f:
+        json.dump(scrapeState, f, indent=1)
+    os.replace(fileName + ".tmp", fileName)
+
+def fetchGrsiPage(scrapeState):
+    # returns the (still open) response, or None if the page did not change since our last download
+    request = Request(grsiPageUrl)
+    if (scrapeState["etag"] != None): request.add_header('If-None-Match', scrapeState["etag"])
+    if (scrapeState["last_modified"] != None): request.add_header('If-Modified-Since', scrapeState["last_modified"])
+    try:
+        response = urlopen(request)
+    except urllib.error.HTTPError as e:
+        if e.code == 304: return None
+        raise
+    scrapeState["etag"] = response.headers.get('ETag')
+    scrapeState["last_modified"] = response.headers.get('Last-Modified')
+    return response
+
+class GrsiSectionParser(HTMLParser):
+    # collects the data of each paper (spotlight) section of the page as soon as the section is complete:
+    # {"title": ..., "links": [{"href": ..., "text": ...}, ...] (all links in the content part), "image_src": ..., "authors_html": ...}
+    def __init__(self):
+        HTMLParser.__init__(self)
+        self.sections = [] # the completed sections that were not yet picked up
+        self.section = None
+        self.sectionDepth = 0 # nesting of section elements inside the current paper section
+        self.contentDepth = 0 # nesting of div elements inside the content part (0: not in it)
+        self.imageDepth = 0 # same for the image part
+        self.link = None
+        self.titleLink = None
+        self.afterH3 = False
+        self.paragraphDepth = 0 # nesting of p elements inside the (first) paragraph with the authors
+
+    def handle_starttag(self, tag, attrs):
+        attributes = dict(attrs)
+        classes = (attributes.get('class') or '').split()
+        if self.section == None:
+            if (tag == 'section') and ('spotlight' in classes):
+                self.section = { "title": "", "links": [], "image_src": None, "authors_html": None }
+                self.sectionDepth = 1
+                self.afterH3 = False
+                self.titleLink = None
+            return
+        if tag == 'section': self.sectionDepth += 1
+        if self.paragraphDepth > 0:
+            self.section["authors_html"] += self.get_starttag_text() if (tag != 'br') else '<br/>'
+            if tag == 'p': self.paragraphDepth += 1
+        if tag == 'div':
+            if self.contentDepth > 0: self.contentDepth += 1
+            elif self.imageDepth > 0: self.imageDepth += 1
+            elif 'content' in classes: self.contentDepth = 1
+            elif 'image' in classes: self.imageDepth = 1
+        if (self.contentDepth > 0):
+            if tag == 'h3': self.afterH3 = True
+            if tag == 'a':
+                self.link = { "href": attributes.get('href'), "text": "" }
+                if self.afterH3 and (self.titleLink == None): self.titleLink = self.link
+            if (tag == 'p') and (self.section["authors_html"] == None):
+                self.section["authors_html"] = '<p>'
+                self.paragraphDepth = 1
+        if (self.imageDepth > 0) and (tag == 'img') and (self.section["image_src"] == None):
+            self.section["image_src"] = attributes.get('src')
+
+    def handle_endtag(self, tag):
+        if self.section == None: return
+        if self.paragraphDepth > 0:
+            if tag == 'p': self.paragraphDepth -= 1
+            if self.paragraphDepth > 0: self.section["authors_html"] += '</' + tag + '>'
+        if tag == 'a' and (self.link != None):
+            self.section["links"].append(self.link)
+            if self.link is self.titleLink: self.section["title"] = self.link["text"]
+            self.link = None
+        if tag == 'div':
+            if self.contentDepth > 0: self.contentDepth -= 1
+            elif self.imageDepth > 0: self.imageDepth -= 1
+        if tag == 'section':
+            self.sectionDepth -= 1
+            if self.sectionDepth == 0:
+                self.sections.append(self.section)
+                self.section = None
+
+    def handle_data(self, data):
+        if self.section == None: return
+        if self.link != None: self.link["text"] += data
+        if self.paragraphDepth > 0: self.section["authors_html"] += data
+
+def sectionHash(section):
+    return hashlib.sha256(json.dumps(section, sort_keys=True).encode('utf-8')).hexdigest()
+
+def readGrsiSections(response, chunkSize = 64 * 1024):
+    # yields the paper sections of the page one by one, while we are still downloading it
+    charset = response.headers.get_content_charset() or 'utf-8'
+    decoder = codecs.getincrementaldecoder(charset)(errors='replace')
+    parser = GrsiSectionParser()
+    while True:
+        chunk = response.read(chunkSize)
+        if not chunk: break
+        parser.feed(decoder.decode(chunk))
+        while len(parser.sections) > 0: yield parser.sections.pop(0)
+    parser.feed(decoder.decode(b'', final=True))
+    parser.close()
+    while len(parser.sections) > 0: yield parser.sections.pop(0)
+
+def generatePaperItemFromSection(section, authorNameRules):
+    paperItem = {}
+    paperItem['is_vis'] = False # by default
+    links = section["links"]
+
+    title = str(section["title"])
+    title = title.replace("Towards Efficieant Novel View Synthesis", "Towards Efficient Novel View Synthesis")
+    paperItem['title'] = title.strip()
+    if paperItem['title'][-1] == '.': paperItem['title'] = paperItem['title'][:-1] # cleaning up
+
+    # doi data clean-up
+    doi = str(links[3]["href"])
+    doi = doi.replace("https://doi.org/", "")
+    doi = doi.replace("https://doi.ieeecomputersociety.org/", "")
+    doi = re.sub(pattern=r"https://diglib\.eg\.org(?::443)?/handle/10\.1111/cgf(\d+)", repl=r"10.1111/cgf.\1", string=doi)
+    doi = doi.replace("https://dl.acm.org/doi/", "")
+    # some manual doi assignments because the GRSI page occasionally only provided Google searches instead of a real DOI at the beginning
+    # please note to replace the '%20' in the Google search links with a ' ' (manually or via a .replace("%20", " ") call as in the examples); otherwise the replacement does not work
+    doi = doi.replace("http://www.google.com/search?q=ArchComplete:%20Autoregressive%203D%20Architectural%20Design%20Generation%20with%20Hierarchical%20Diffusion-Based%20Upsampling".replace("%20", " "), "10.1016/j.cag.2025.104477")
+    # accepted real VIS papers below, need to fix later in both vis-2025.csv and via vispubdata, and remove here
+    doi = doi.replace("http://www.google.com/search?q=SynAnno:%20Interactive%20Guided%20Proofreading%20of%20Synaptic%20Annotations".replace("%20", " "), "10.vis2025/1718")
+    doi = doi.replace("http://www.google.com/search?q=Your%20Model%20Is%20Unfair,%20Are%20You%20Even%20Aware?%20Inverse%20Relationship%20Between%20Comprehension%20and%20Trust%20in%20Explainability%20Visualizations%20of%20Biased%20ML%20Models".replace("%20", " "), "10.vis2025/1446")
+    doi = doi.replace("http://www.google.com/search?q=Cluster-Based%20Random%20Forest%20Visualization%20and%20Interpretation".replace("%20", " "), "10.vis2025/1432")
+    doi = doi.replace("http://www.google.com/search?q=BondMatcher:%20H-Bond%20Stability%20Analysis%20in%20Molecular%20Systems".replace("%20", " "), "10.vis2025/1440")
+    doi = doi.replace("%20", " ") # in case we copy-pasted the link from the website
+    doi = re.sub(pattern=r"http(?:s)?://www\.google\.com/search.*", repl=r"NOT_ASSIGNED_YET", string=doi) # automatically assign the NOT_ASSIGNED_YET tag for remaining Google searches (once assigned but not yet on GRSI page add a manual override as above)
+    paperItem['doi'] = doi.lower()
+    # print a warning if the doi does not check out
+    if (doi[0:3] != "10."): print("WARNING: The DOI we read from GRSI page that does not seem to formatted correctly for a DOI: " + doi)
+
+    grsiUrl = str(links[1]["href"])
+    paperItem['grsi_url'] = "https://www.replicabilitystamp.org/" + grsiUrl
+
+    journalName = str(links[2]["text"].strip())
+    paperItem['journal'] = journalName
+
+    repoUrl = str(links[4]["href"])
+    paperItem['repo_url'] = repoUrl
+
+    repoArchiveUrl = ""
+    if (len(links) > 5):
+        repoArchiveUrl = str(links[5]["href"])
+    paperItem['repo_archive_url'] = repoArchiveUrl
+
+    imageUrl = str(section["image_src"])
+    paperItem['image_url'] = "https://www.replicabilitystamp.org/" + imageUrl
+
+    authors = str(section["authors_html"]).split("\n")[1].lstrip().split('<br/>')[0].rstrip() # this is now the list of authors per paper
+
+    # some systematic fixes
+    if (authors[-1] == '.'): authors = authors[:-1] # remove trailing dots (somewhat common)
+    if (authors[-1] == ','): authors = authors[:-1] # remove trailing commas (somewhat common)
+
+    # the author name fixes (easier than finding general solutions, if there even are any) are in the rule file; this also makes the author list reporting consistent
+    authors = normalizeAuthorList(authorNameRules, authors, doi)
+
+    paperItem['authors'] = authors # save the filtered authors list
+    return paperItem
+
+def scraperVersion(authorNameRules):
+    # changes whenever the author name rules or this file (e.g., the manual doi assignments) change
+    with open(__file__, "rb") as f:
+        return hashlib.sha256(f.read() + authorNameRules["version"].encode('utf-8')).hexdigest()
+
+def knownPaperIndex(previousDois, doi, lastKnownIndex):
+    # the position of the paper in our last download, if we can tell it for sure (otherwise None)
+    # papers without a real DOI yet (e.g., "not_assigned_yet") are never known, and a DOI that appears more than once in the last download
+    # is only known if it follows right after the previous known paper
+    if doi[0:3] != "10.": return None
+    if (lastKnownIndex != None) and (lastKnownIndex + 1 < len(previousDois)) and (previousDois[lastKnownIndex + 1] == doi): return lastKnownIndex + 1
+    if previousDois.count(doi) == 1: return previousDois.index(doi)
+    return None
+
+def scrapeGrsiPapers(scrapeState, authorNameRules, stopAfterKnownPapers = 0):
+    # returns the list of papers on the GRSI page (in the order of the page), and updates the scrape state
+    # if stopAfterKnownPapers > 0, then we stop reading the page after so many papers in a row that we already had
+    # in our last download, and take the remaining papers from then
+    if scrapeState["rules_version"] != scraperVersion(authorNameRules):
+        # the rules changed, so we cannot reuse the papers we made with the old ones (and need the whole page again)
+        scrapeState["section_hashes"] = {}
+        scrapeState["etag"] = None
+        scrapeState["last_modified"] = None
+        scrapeState["rules_version"] = scraperVersion(authorNameRules)
+
+    response = fetchGrsiPage(scrapeState)
+    if response == None:
+        print("The GRSI page did not change since our last download, so we use the papers from then.")
+        paperList = json.loads(json.dumps(scrapeState["papers"])) # a deep copy
+    else:
+        previousDois = [paperItem["doi"] for paperItem in scrapeState["papers"]]
+        paperList = []
+        newSectionHashes = {}
+        newOrChangedSectionCount = 0
+        knownPapersInARow = 0
+        lastKnownIndex = None # the position in our last download of the last paper we read (if we know it)
+        stoppedEarly = False
+        for section in readGrsiSections(response):
+            hashOfSection = sectionHash(section)
+            if hashOfSection in scrapeState["section_hashes"].keys():
+                paperItem = json.loads(json.dumps(scrapeState["section_hashes"][hashOfSection])) # a deep copy
+            else:
+                paperItem = generatePaperItemFromSection(section, authorNameRules)
+                newOrChangedSectionCount += 1
+            newSectionHashes[hashOfSection] = json.loads(json.dumps(paperItem))
+            paperList.append(paperItem) # then save the data in the list
+
+            paperIndex = knownPaperIndex(previousDois, paperItem["doi"], lastKnownIndex if knownPapersInARow > 0 else None)
+            if paperIndex == None: knownPapersInARow = 0
+            elif (knownPapersInARow > 0) and (paperIndex == lastKnownIndex + 1): knownPapersInARow += 1
+            else: knownPapersInARow = 1 # a new run of known papers
+            lastKnownIndex = paperIndex
+            if (stopAfterKnownPapers > 0) and (knownPapersInARow >= stopAfterKnownPapers):
+                stoppedEarly = True
+                break
+        response.close()
+        print("Found " + str(newOrChangedSectionCount) + " new or changed paper(s) on the GRSI page.")
+
+        if stoppedEarly:
+            # the rest of the page is what we had last time, after the last paper we read now
+            for paperItem in scrapeState["papers"][lastKnownIndex + 1:]:
+                paperList.append(json.loads(json.dumps(paperItem)))
+            for hashOfSection in scrapeState["section_hashes"].keys():
+                if not (hashOfSection in newSectionHashes.keys()): newSectionHashes[hashOfSection] = scrapeState["section_hashes"][hashOfSection]
+        scrapeState["section_hashes"] = newSectionHashes
+        scrapeState["papers"] = json.loads(json.dumps(paperList))
+
+    for paperCounter, paperItem in enumerate(paperList):
+        paperItem['counter'] = paperCounter + 1
+    return paperList
@@ -1,28 +1,99 @@
 #!/usr/bin/python3
 
 import os,sys
-from xploreapi import XPLORE
 import json
 import time # max 10 calls per second, 200 per day
 import datetime
+from response_cache import getResponse, getCachedResponse, storeResponse
+from http_clients import getApiClient, apiGet
 
-def generateEntryForDoi(doi, apiKey = ''):
-    # find the correct date string to be able to read and write the correct files
-    current_date = datetime.datetime.now()
-    current_year = current_date.year
+ieeeApiUrl = 'https://ieeexploreapi.ieee.org/api/v1/search/articles'
+ieeeMaxRecords = 200 # the most articles the API returns per call
+tvcgPublicationNumber = '2945'
+ieeeBulkMinimumDois = 3 # only query a whole issue if we need at least so many of its papers (otherwise single queries are cheaper)
 
-    query = XPLORE(apiKey)
-    query.dataType('JSON')
-    query.maximumResults(2)
-    query.doi(doi)
-    dataText = query.callAPI()
+def fetchResponseForDoi(doi, apiKey = ''):
+    # the raw response of the API (which we may cache), the same query that the XPLORE class of the IEEE SDK makes
+    client = getApiClient(ieeeApiUrl, params = { 'apikey': apiKey, 'format': 'json' })
+    dataText = apiGet(client, params = { 'max_records': 2, 'start_record': 1, 'sort_order': 'asc', 'sort_field': 'article_number', 'doi': doi }).text
 
     # with open("ieee-test.txt", "w", encoding='utf-8') as f:
     #     f.write(dataText)
     #     f.close()
 
     # make sure that we actually got data
-    if 'IEEE <i>Xplore</i> is temporarily unavailable' in dataText: return {}
+    if 'IEEE <i>Xplore</i> is temporarily unavailable' in dataText: return None
+    return dataText
+
+def fetchArticlesForQuery(queryParameters, apiKey = ''):
+    # all articles for a query such as a whole issue (is_number) or the Early Access list, 200 per call
+    # returns the articles and the number of calls we needed
+    client = getApiClient(ieeeApiUrl, params = { 'apikey': apiKey, 'format': 'json' })
+    articles = []
+    numberOfCalls = 0
+    startRecord = 1
+    while True:
+        parameters = { 'max_records': ieeeMaxRecords, 'start_record': startRecord, 'sort_order': 'asc', 'sort_field': 'article_number' }
+        parameters.update(queryParameters)
+        dataText = apiGet(client, params = parameters).text
+        numberOfCalls += 1
+        if 'IEEE <i>Xplore</i> is temporarily unavailable' in dataText: break
+        data = json.loads(dataText)
+        if 'articles' in data.keys(): articles += data['articles']
+        startRecord += ieeeMaxRecords
+        if (not 'articles' in data.keys()) or (startRecord > int(data['total_records'])): break
+    return articles, numberOfCalls
+
+def prefetchResponsesForDois(dois, apiKey = '', responseCache = None):
+    # fills the response cache for the dois with as few calls as possible: TVCG papers we already had are
+    # looked up with their whole issue (in-press papers with the Early Access list, under which issue number
+    # they are listed), and new TVCG papers via the Early Access list (where new papers usually are);
+    # the dois we do not find this way are later queried one by one as before
+    # returns the number of dois for which we got a new response
+    if (responseCache == None) or responseCache["cache_only"]: return 0
+    doisPerQuery = {}
+    for doi in dois:
+        if getCachedResponse(responseCache, 'ieee', doi) != None: continue # still fresh
+        oldResponse = getCachedResponse(responseCache, 'ieee', doi, includeExpired = True)
+        oldArticles = json.loads(oldResponse).get('articles', []) if (oldResponse != None) else []
+        if (len(oldArticles) == 1) and ('is_number' in oldArticles[0].keys()):
+            query = ('is_number', str(oldArticles[0]['is_number']))
+        elif doi.startswith('10.1109/tvcg.'):
+            query = ('content_type', 'Early Access')
+        else: continue
+        doisPerQuery.setdefault(query, []).append(doi)
+
+    # an issue can also have papers from other queries (e.g., the Early Access list has the in-press papers and the new ones)
+    wantedDois = set([doi for query in doisPerQuery.keys() for doi in doisPerQuery[query]])
+    numberOfPrefetchedDois = 0
+    for query in doisPerQuery.keys():
+        if len([doi for doi in doisPerQuery[query] if doi in wantedDois]) < ieeeBulkMinimumDois: continue
+        queryParameters = { query[0]: query[1] }
+        if query[0] == 'content_type': queryParameters['publication_number'] = tvcgPublicationNumber
+        try:
+            articles, numberOfCalls = fetchArticlesForQuery(queryParameters, apiKey)
+        except Exception as e:
+            print("WARNING: Looking up the IEEE articles for " + query[0] + " " + query[1] + " failed: " + str(e))
+            continue
+        numberOfWantedDois = len(wantedDois)
+        for article in articles:
+            if (not 'doi' in article.keys()) or not (article['doi'].lower() in wantedDois): continue
+            # stored in the same form as the response to a single doi query
+            storeResponse(responseCache, 'ieee', article['doi'].lower(), json.dumps({ 'total_records': 1, 'total_searched': 1, 'articles': [article] }))
+            wantedDois.remove(article['doi'].lower())
+            numberOfPrefetchedDois += 1
+        print("Got the IEEE data for " + str(numberOfWantedDois - len(wantedDois)) + " papers (" + query[0] + " " + query[1] + ") with " + str(numberOfCalls) + " call(s).")
+    return numberOfPrefetchedDois
+
+def generateEntryForDoi(doi, apiKey = '', responseCache = None):
+    dataText = getResponse(responseCache, 'ieee', doi, lambda: fetchResponseForDoi(doi, apiKey))
+    if dataText == None: return {}
+    return generateEntryFromResponse(dataText)
+
+def generateEntryFromResponse(dataText):
+    # find the correct date string to be able to read and write the correct files
+    current_date = datetime.datetime.now()
+    current_year = current_date.year
 
     data = json.loads(dataText)
 
@@ -1,32 +1,45 @@
 #!/usr/bin/python3
 
-from urllib.request import urlopen
-from bs4 import BeautifulSoup
 import re
 import os,sys
 import csv
 import datetime
 import json
-import pandas as pd
-import altair as alt
-import time # to be able to wait if the calls are limited somehow
 from colorsys import rgb_to_hls, hls_to_rgb
 from math import nan
 import math
 import glob
-import shutil
+from author_names import loadAuthorNameRules, normalizeAuthorName
+from grsi_history import openGrsiHistory, hasGrsiSnapshot, materializeGrsiSnapshot, storeGrsiSnapshot, importGrsiSnapshotFiles
+from chart_rendering import createRenderQueue, setWantedCharts, findIncludedGraphics, isChartWanted, queueChartRender, chartOutputFiles, renderQueuedCharts
+from longitudinal_metrics import computeLongitudinalMetrics, writeLongitudinalMetrics
+from keyword_matcher import compileKeywordRules, matchKeywordRules, hasKeywordMatch
+from extended_paper_store import isExtendedPaperComplete, openExtendedPaperStore, syncExtendedPaperStore, loadExtendedPaperData, upsertExtendedPaper, exportExtendedPaperData, findIncompleteDois, findDoisWithoutCountries, findDoisPublishedAfter
+from extended_paper_journal import appendExtendedPaperJournal, replayExtendedPaperJournal, compactExtendedPaperJournal
+from venue_registry import createVenueRegistry, registerDoi, noteVenueYear, isDoiInVenue, venueConferenceYears, venueMostRecentYear, classifyPapers
+from paper_numbers import createPaperNumbers, registerPaperNumbers, evaluatePaperNumbers, findUsedMacros, paperNumbersLatex
+from country_contributions import loadCountryNames, computeCountryContributions
+from pipeline_stages import openStageManifest, dataContentHash, isStageCurrent, recordStage, copyChangedFiles
+from command_line import settingNames, parseCommandLine
+# pandas, numpy, and altair (and the modules that get the data from the web) take a while to import, so we only import them in the stages that need them
 
 # settings of how to do things and what extra stuff to do
 useLocalDataOnly = True # FIXME: should be True for submission
 exportVisualizations = True # ehether to create visualizations based on the data or not
 doNameChecking = False # run some heuristics to check if the names make sense
-doAbstractCheckingForKeywords = False # check for keywords in the abstract as well (otherwise only in title)
+doAbstractCheckingForKeywords = True # check for keywords in the abstract as well (otherwise only in title)
 doVerifyCountryInformation = True # check of the country information is provided
 doExportNumbersForPaper = True # generate a LaTeX file that records all kinds of collected statistics, which is needed to for later compiling the paper
+doNumbersOnly = False # if True, then only compute the numbers that the paper uses (see paperTexFiles) and create no charts at all, to quickly refresh the numbers after a data update
 doCopyPlotsAccordingToFigureNumbers = True # copy the visualizations into extra folder named according to the figure numbers from the paper
 downloadAcmFromCrossref = True # if True, then use the Crossref API to get ACM metadata, otherwise the acmdownload tool; FIXME: should be True for submission
 doPrintTVCGInPressDetails = False # print out a list of the IEEE papers that are currently in press still (for a report to the TVCG EiC)
 doPrintConferenceTotals = False # if true, then print the totals of IEEE VIS presentations (regular full paper plus journal)
+doLongitudinalAnalysis = False # replay all days in the GRSI data history (see grsiHistorySubdirectory) and record how the main numbers changed over time
+useExtendedPaperStore = False # if True, then also keep the extended paper data in an SQLite database (see extendedPaperStoreFile), so that we only read and write the entries we need
+rederiveExtendedDataFromCache = False # if True, then re-create the extended paper data of all papers from the cached DL responses (e.g., after changing how we process them), without querying the DLs
+doCheckExtendedDataAlways = False # if True, then check for missing data from the DLs in every run (otherwise only in the first run of a day, when we got new data from the web)
+lastStage = None # stop after this stage ("classify": the GRSI data and its classification, "enrich": the data from the DLs), None: run all of them
 
 # other configuration
 visPadding = 0 # the padding in pixels to be applied to the exported visualizations, set to 0 for use in paper, otherwise 5 is good
@@ -39,6 +52,17 @@ paperNumbersOutputFile = "paper/numbersFromScript.tex"
 paperNumbersOutputString = ""
 paperKeywordPapersOutputFile = "paper/keywordPapersFromScript.tex"
 paperKeywordPapersOutputString = ""
+responseCacheSubdirectory = "cache/dl_responses/" # the raw responses from the DL APIs, so that we do not have to query them again
+responseCacheTtlDays = 90 # after how many days we query a DL again instead of using the cached response
+responseCacheMaxEntries = 5000 # if there are more cached responses, then the least recently used ones are removed
+extendedPaperJournalFile = "cache/extended_paper_data_journal.jsonl" # each new or updated entry of publication_data/extended_paper_data.json is first saved here, so that it survives if the script stops
+extendedPaperJournalCompactionSize = 100 # after so many journaled entries we write them into publication_data/extended_paper_data.json (and at the end of the updates anyway)
+extendedPaperStoreFile = "cache/extended_paper_data.sqlite" # the SQLite version of publication_data/extended_paper_data.json (only used if useExtendedPaperStore is True)
+euroVisDoiCacheFile = "cache/eurovis_dois.json" # the DOIs we read from the EuroVis xlsx files, so that we only need to read them again (with pandas) when they changed
+grsiHistorySubdirectory = "grsi_history/" # the GRSI paper data of each day we ran the script, stored as compressed daily changes
+grsiScrapeStateFile = "cache/grsi_scrape_state.json" # what we know about the last download of the GRSI page
+grsiStopAfterKnownPapers = 0 # stop reading the GRSI page after so many papers in a row that we already know (0: always read the whole page)
+authorNameRulesFile = "input/author_name_rules.json" # the rules for cleaning up the author names we get from GRSI (and the digital libraries)
 numberOfAuhorHistogramBins = 11
 countryPieChartThreshold = 2.5 # in percent (1--100)
 neutralGray = "#a9a9a9"
@@ -46,6 +70,78 @@ paperNumbersOutputString += "\\newcommand{\\GrsiCountryPieChartThreshold}{" + st
 myLabelLimit = 500 # this is a weird issue: technically a value of 0 should mean no limit, but sometimes it literally means a limit of 0; so a sufficiently large number is needed here to avoid label cropping, 500 should work
 topLimitAuthorPlots = 1300 # to adjust all the author count plots in a similar way
 grayscaleLightnessFactor = 0.5
+chartRenderProcesses = None # how many processes render the charts in parallel (None: one per CPU core, 1: render them one after the other in this process, which we always do on Windows and macOS)
+chartOutputFormats = ["pdf"] # the files we write for each chart, any of "pdf" (needed for the paper), "svg", and "png"; the Vega-Lite spec is always written as .vl.json next to them
+chartRenderHashFile = "cache/chart_render_hashes.json" # the hashes of the chart specs of the last rendering, so that we only render the charts that changed (None: always render all of them)
+chartRenderMode = "all" # "all": render all charts, "paper": only render the charts that the paper includes (the \includegraphics in paperTexFiles) or that we copy into paperFiguresOutputSubdirectury (paperFigureFiles)
+paperTexFiles = "paper/*.tex"
+paperFigureFormat = "pdf" if ("pdf" in chartOutputFormats) else chartOutputFormats[0] # the format of the graphs we copy into paperFiguresOutputSubdirectury (the paper needs PDFs, but we can only copy what we write)
+# the graphs we copy into paperFiguresOutputSubdirectury, named by their figure number in the paper (graph, figure)
+paperFigureFiles = [
+    ('replicability_visualization-by-venue-stackedbargraph', 'figure01'),
+    ('replicability_visualization-by-venue-stackedbargraph-ieee_vis', 'figure01-ieee_vis'),
+    ('replicability_visualization-by-venue-stackedbargraph-eurovis', 'figure01-eurovis'),
+    ('replicability_visualization-by-venue-stackedbargraph-pacificvis', 'figure01-pacificvis'),
+    ('replicability_visualization-by-venue-stackedbargraph-vcbm', 'figure01-vcbm'),
+    ('replicability_all-by-journal-linegraph', 'figure02'),
+    ('replicability_all-by-journal_aggregated-stackedbargraph', 'figure03'),
+    ('replicability_all-by-journal_aggregated_plain-stackedbargraph', 'figure03_merged'),
+    ('replicability_all-by-visualization-stackedbargraph', 'figure04'),
+    ('replicability_visualization-by-journal_plus_type_aggregated-stackedbargraph', 'figure05'),
+    ('replicability_visualization-by-journal_plus_type-stackedbargraph', 'figure06'),
+    ('replicability_visualization-by-type-groupedbargraph', 'figure07'),
+    ('replicability_visualization-by-venue-stackedbargraph-normalized', 'figure08'),
+    ('replicability_visualization-by-venue-stackedbargraph-normalized-ieee_vis', 'figure08-ieee_vis'),
+    ('replicability_visualization-by-venue-stackedbargraph-normalized-eurovis', 'figure08-eurovis'),
+    ('replicability_visualization-by-venue-stackedbargraph-normalized-pacificvis', 'figure08-pacificvis'),
+    ('replicability_visualization-by-venue-stackedbargraph-normalized-vcbm', 'figure08-vcbm'),
+    ('replicability_all-histogram-stamps-per-person', 'figure09a'),
+    ('replicability_visualization-histogram-stamps-per-person', 'figure09b'),
+    ('replicability-histogram-people-vis-percentages', 'figure10a'),
+    ('replicability-histogram-people-vis-percentages-multiple-papers', 'figure10b'),
+    ('replicability_all-piechart-by-country-thresholded-proportional', 'figure11a'),
+    ('replicability_visualization-piechart-by-country-thresholded-proportional', 'figure11b'),
+    ('replicability_all-piechart-by-country-senior-only-thresholded-proportional', 'figure12a'),
+    ('replicability_visualization-piechart-by-country-senior-only-thresholded-proportional', 'figure12b'),
+    ('replicability_visualization-by-venue-linegraph', 'figure13'),
+    ('replicability_all-by-journal-groupedbargraph', 'figure14'),
+    ('replicability_all-by-journal_aggregated-stackedbargraph-normalized', 'figure15'),
+    ('replicability_visualization-piechart-by-vis-status', 'figure16a'),
+    ('replicability_visualization-piechart-by-journal', 'figure16b'),
+    ('replicability_all-by-visualization-stackedbargraph-normalized', 'figure17'),
+    ('replicability_all-by-visualization-groupedbargraph', 'figure17_absolute-bars'),
+    ('replicability_all-by-visualization-linegraph', 'figure17_absolute-lines'),
+    ('replicability_visualization-by-journal_plus_type_aggregated-stackedbargraph-normalized', 'figure18'),
+    ('replicability_visualization-by-journal_plus_type-stackedbargraph-normalized', 'figure19'),
+    ('replicability_visualization-by-type-stackedbargraph', 'figure20'),
+    ('replicability_visualization-by-type-stackedbargraph-normalized', 'figure21'),
+    ('replicability-histogram-people-vis-percentages-nolog', 'figure22a'),
+    ('replicability-histogram-people-vis-percentages-multiple-papers-nolog', 'figure22b'),
+    ('replicability_all-piechart-by-country-proportional', 'figure23a'),
+    ('replicability_all-piechart-by-country-absolute', 'figure23b'),
+    ('replicability_all-piechart-by-country-senior-only-proportional', 'figure24a'),
+    ('replicability_all-piechart-by-country-senior-only-absolute', 'figure24b'),
+    ('replicability_visualization-piechart-by-country-proportional', 'figure25a'),
+    ('replicability_visualization-piechart-by-country-absolute', 'figure25b'),
+    ('replicability_visualization-piechart-by-country-senior-only-proportional', 'figure26a'),
+    ('replicability_visualization-piechart-by-country-senior-only-absolute', 'figure26b'),
+]
+stageManifestFile = "cache/stage_manifest.json" # the content hashes of the inputs and outputs of the stages below when they last ran, so that we only run the stages whose inputs changed (None: always run all of them); the paper figures are recorded per file
+# the files that each stage reads (the stages also depend on the data that we loaded, classified, and enriched above them, which we hash as well)
+stageInputFiles = {
+    "plots": ["input/*.csv", "input/*.xlsx", "input/*.json", "palettes.js", "*.py"],
+}
+
+#####################################
+# the subcommands and options on the command line (see command_line.py) override the settings above
+#####################################
+commandLineSettings = parseCommandLine(sys.argv[1:], { settingName: globals()[settingName] for settingName in settingNames })
+for settingName in settingNames: globals()[settingName] = commandLineSettings[settingName]
+
+#####################################
+# in the numbers-only mode we do not create any charts
+#####################################
+if doNumbersOnly: exportVisualizations = False
 
 #####################################
 # change to directory of the script
@@ -66,6 +162,10 @@ if (dataOutputSubdirectury != "") and not (os.path.isdir(dataOutputSubdirectury)
 #####################################
 # pre-load some data to avoid loading it multiple times
 #####################################
+chartRenderQueue = createRenderQueue(chartRenderHashFile, chartOutputFormats) # the charts are only rendered (in parallel) once we created all of them
+stageManifest = openStageManifest(stageManifestFile)
+if chartRenderMode == "paper":
+    setWantedCharts(chartRenderQueue, findIncludedGraphics(glob.glob(paperTexFiles)) | set([graphName for graphName, figureName in paperFigureFiles]))
 vegaPalletData = {}
 with open('palettes.js', 'r') as file:
     for line in file:
@@ -225,67 +325,72 @@ def markPapersByDoi(paperList, doiList, label = "is_vis", type = ""):
             if len(type) > 0:
                 paper["type"] = type
 
-def markVisPapersByKeywords(paperList):
-    for paper in paperList:
-        # manual classification based on general keywords in the title
-        if  (paper["is_vis"] == False) and ( # ensure that we do not overwrite the status of already recognized papers
-            ("visualization" in paper["title"].lower()) or
-            ("visualisation" in paper["title"].lower()) or
-            ("visualizing" in paper["title"].lower()) or
-            ("visualising" in paper["title"].lower()) or
-            ( ("visual" in paper["title"].lower()) and ("analytics" in paper["title"].lower()) ) or
-            ( ("visual" in paper["title"].lower()) and ("analysis" in paper["title"].lower()) ) or
-            ("visual representation" in paper["title"].lower()) or
-            ("data exploration" in paper["title"].lower()) or
-            ("visual exploration" in paper["title"].lower()) or
-            ("graph drawing" in paper["title"].lower()) or
-            ("parallel coordinates" in paper["title"].lower()) or
-            ("scatterplot" in paper["title"].lower()) or
-            ("choropleth" in paper["title"].lower()) or
-            ("cartogram" in paper["title"].lower()) or
-            ("star glyph" in paper["title"].lower()) or
-            ("glyph design" in paper["title"].lower()) or
-            ("line graph" in paper["title"].lower()) or
-            ("streamgraph" in paper["title"].lower()) or
-            ("focus+context" in paper["title"].lower()) or
-            ("categorical data" in paper["title"].lower()) or
-            ("ordinal data" in paper["title"].lower()) or
-            ("quantitative data" in paper["title"].lower()) or
-            # ("topology" in paper["title"].lower()) or # not good: some graphics papers also captured
-            ("t-sne" in paper["title"].lower()) or
-            ("high-dimensional data" in paper["title"].lower()) or
-            ("visual abstraction" in paper["title"].lower())
-            ):
-            paper["is_vis"] = True
-            paper["type"] = "keyword"
-
-        # manual selections of specific papers which we believe to be on visualization topics
-        if  (
-            ("10.1109/tvcg.2022.3214821" in paper["doi"]) or # visualization author keyword
-            ("10.1109/tvcg.2021.3101418" in paper["doi"]) or # visualization author keyword
-            # ("10.1109/tvcg.2023.3237768" in paper["doi"]) or # visual analysis author keyword, but automatically found by keyword search
-            ("10.1109/tvcg.2021.3067820" in paper["doi"]) or # visualization in the abstract
-            ("10.1109/tvcg.2020.2966702" in paper["doi"]) or # is on flattening of 3D surfaces from data
-            ("10.1016/j.cag.2024.01.001" in paper["doi"]) or # visualization in the abstract
-            ("10.1016/j.cag.2023.06.023" in paper["doi"]) or # talks about molecular channel datasets
-            ("10.1145/3528223.3530102" in paper["doi"]) or   # talks about simulation and visualization of stellar atmospheres
-            ("10.1111/cgf.14784" in paper["doi"]) or         # talks about topology, graphs, and scalar fields
-            ("10.1111/cgf.13910" in paper["doi"]) or         # talks about point clouds and topology
-            ("10.1145/3687996" in paper["doi"]) or           # talks about the simulation of 3D flows and their visual representation
-            ("10.1109/tvcg.2025.3589748" in paper["doi"])    # visualization in abstract and author keyword
-            ):
-            paper["is_vis"] = True
-            paper["type"] = "manual"
-
-def markVisPapersByFutureVISPresentation(paperList):
-    for paper in paperList:
-        # presentations at the coming VIS conference we already know about
-        if  (
-            # ("10.1109/tvcg.2026.add-future-ids-here" in paper["doi"]) or
-            ("10.1109/tvcg.2026.add-future-ids-here" in paper["doi"])
-            ):
-            paper["is_vis"] = True                     # will be presented at next VIS
-            paper["type"] = "journal pres. @ IEEE VIS" # also hack the paper type
+# keyword rules for the classification of visualization papers: each rule fires if all of its terms are in the (lowercase) text
+visTitleKeywordRules = [
+    ["visualization"],
+    ["visualisation"],
+    ["visualizing"],
+    ["visualising"],
+    ["visual", "analytics"],
+    ["visual", "analysis"],
+    ["visual representation"],
+    ["data exploration"],
+    ["visual exploration"],
+    ["graph drawing"],
+    ["parallel coordinates"],
+    ["scatterplot"],
+    ["choropleth"],
+    ["cartogram"],
+    ["star glyph"],
+    ["glyph design"],
+    ["line graph"],
+    ["streamgraph"],
+    ["focus+context"],
+    ["categorical data"],
+    ["ordinal data"],
+    ["quantitative data"],
+    # ["topology"], # not good: some graphics papers also captured
+    ["t-sne"],
+    ["high-dimensional data"],
+    ["visual abstraction"],
+]
+visTitleKeywordMatcher = compileKeywordRules(visTitleKeywordRules)
+
+# the same rules for checking the abstracts, except for those that would be too unspecific in a longer text
+visAbstractKeywordRules = [rule for rule in visTitleKeywordRules if not (rule[0] in ["categorical data", "ordinal data", "quantitative data", "visual abstraction"])]
+visAbstractKeywordMatcher = compileKeywordRules(visAbstractKeywordRules)
+
+def isVisPaperByKeywords(title):
+    # manual classification based on general keywords in the title
+    return hasKeywordMatch(visTitleKeywordMatcher, title)
+
+# manual selections of specific papers which we believe to be on visualization topics
+manuallySelectedVisPaperDois = {
+    "10.1109/tvcg.2022.3214821", # visualization author keyword
+    "10.1109/tvcg.2021.3101418", # visualization author keyword
+    # "10.1109/tvcg.2023.3237768", # visual analysis author keyword, but automatically found by keyword search
+    "10.1109/tvcg.2021.3067820", # visualization in the abstract
+    "10.1109/tvcg.2020.2966702", # is on flattening of 3D surfaces from data
+    "10.1016/j.cag.2024.01.001", # visualization in the abstract
+    "10.1016/j.cag.2023.06.023", # talks about molecular channel datasets
+    "10.1145/3528223.3530102",   # talks about simulation and visualization of stellar atmospheres
+    "10.1111/cgf.14784",         # talks about topology, graphs, and scalar fields
+    "10.1111/cgf.13910",         # talks about point clouds and topology
+    "10.1145/3687996",           # talks about the simulation of 3D flows and their visual representation
+    "10.1109/tvcg.2025.3589748", # visualization in abstract and author keyword
+}
+
+def isManuallySelectedVisPaper(doi):
+    return doi in manuallySelectedVisPaperDois
+
+# presentations at the coming VIS conference we already know about (they are counted as IEEE VIS journal presentations)
+futureVisPresentationDois = {
+    # "10.1109/tvcg.2026.add-future-ids-here",
+    "10.1109/tvcg.2026.add-future-ids-here",
+}
+
+def isFutureVisPresentation(doi):
+    return doi in futureVisPresentationDois
 
 def filterAndShortenJournalNames(journalName = ""):
     publicationVenue = journalName
@@ -380,7 +485,8 @@ def generateColorArrayFromColorScheme(sourceColorScheme, lightenFactor=0.5, colo
     
     return colorArray
 
-def plotTimeSeriesPublicationData(dataToPlot, baseName = "replicability", dataField = "venue", cTitleSpecifier = "", yTitleSpecifier = "", colorScheme = "tableau10", legendColumns = 10, visPadding = 5, legendOffset = 10, labelAngle=0, chartsToPlot = ["all"], addTicksBetweenYears = False, addNoteBelowLegend = False, noteXOffset = 33):
+def plotTimeSeriesPublicationData(dataToPlot, baseName = "replicability", dataField = "venue", cTitleSpecifier = "", yTitleSpecifier = "", colorScheme = "tableau10", legendColumns = 10, visPadding = 5, legendOffset = 10, labelAngle=0, chartsToPlot = ["all"], addTicksBetweenYears = False, addNoteBelowLegend = False, noteXOffset = 33, lineGraphDataToPlot = None):
+    # lineGraphDataToPlot: the data for the line graph if it differs from dataToPlot (e.g., with nan instead of 0 where we do not want a line), which would fail the aggregated plots
     altairData = pd.DataFrame(dataToPlot)
     cTitle = dataField
     if cTitleSpecifier != "": cTitle = cTitleSpecifier
@@ -390,7 +496,7 @@ def plotTimeSeriesPublicationData(dataToPlot, baseName = "replicability", dataFi
     xTitle = None # we don't really need a title
 
     # if ("all" in chartsToPlot) or ("stackedareagraph" in chartsToPlot):
-    if ("stackedareagraph" in chartsToPlot): # only if requested explicitly, for now we don't need the stacked area graphs, and some are confusing, too
+    if ("stackedareagraph" in chartsToPlot) and isChartWanted(chartRenderQueue, baseName + '-stackedareagraph'): # only if requested explicitly, for now we don't need the stacked area graphs, and some are confusing, too
         chart = alt.Chart(altairData).mark_area().encode(
             x = alt.X('year:N', title=xTitle, sort=None).axis(labelAngle=labelAngle),
             y = alt.Y('sum(count):Q', title=yTitle), #.stack('zero'),
@@ -407,9 +513,9 @@ def plotTimeSeriesPublicationData(dataToPlot, baseName = "replicability", dataFi
             height=300
         ).configure_legend(orient='bottom', direction='horizontal', columns=legendColumns, offset=legendOffset, titleLimit=0, labelLimit=myLabelLimit)
 
-        chart.save(baseName + '-stackedareagraph.pdf')
+        queueChartRender(chartRenderQueue, chart, baseName + '-stackedareagraph.pdf')
 
-    if ("all" in chartsToPlot) or ("stackedbargraph" in chartsToPlot):
+    if (("all" in chartsToPlot) or ("stackedbargraph" in chartsToPlot)) and isChartWanted(chartRenderQueue, baseName + '-stackedbargraph'):
         chart = alt.Chart(altairData).mark_bar().encode(
             x = alt.X('year:N', title=xTitle, sort=None).axis(tickWidth=0, labelAngle=labelAngle),
             y = alt.Y('sum(count):Q', title=yTitle).stack('zero'),
@@ -425,9 +531,9 @@ def plotTimeSeriesPublicationData(dataToPlot, baseName = "replicability", dataFi
             height=300
         ).configure_legend(orient='bottom', direction='horizontal', columns=legendColumns, offset=legendOffset, titleLimit=0, labelLimit=myLabelLimit)
 
-        chart.save(baseName + '-stackedbargraph.pdf')
+        queueChartRender(chartRenderQueue, chart, baseName + '-stackedbargraph.pdf')
 
-    if ("all" in chartsToPlot) or ("stackedbargraph-normalized" in chartsToPlot):
+    if (("all" in chartsToPlot) or ("stackedbargraph-normalized" in chartsToPlot)) and isChartWanted(chartRenderQueue, baseName + '-stackedbargraph-normalized'):
         chart = alt.Chart(altairData).mark_bar().encode(
             x = alt.X('year:N', title=xTitle, sort=None).axis(tickWidth=0, labelAngle=labelAngle),
             y = alt.Y('sum(count):Q', title=yTitle).stack("normalize"),
@@ -443,10 +549,10 @@ def plotTimeSeriesPublicationData(dataToPlot, baseName = "replicability", dataFi
             height=300
         ).configure_legend(orient='bottom', direction='horizontal', columns=legendColumns, offset=legendOffset, titleLimit=0, labelLimit=myLabelLimit)
 
-        chart.save(baseName + '-stackedbargraph-normalized.pdf')
+        queueChartRender(chartRenderQueue, chart, baseName + '-stackedbargraph-normalized.pdf')
 
     # if ("all" in chartsToPlot) or ("singlebargraphs" in chartsToPlot):
-    if ("singlebargraphs" in chartsToPlot): # only if requested explicitly, for now we do not need the single bar graphs
+    if ("singlebargraphs" in chartsToPlot) and isChartWanted(chartRenderQueue, baseName + '-singlebargraphs'): # only if requested explicitly, for now we do not need the single bar graphs
         chart = alt.Chart(altairData).mark_bar().encode(
             x = alt.X('year:N', title=xTitle, sort=None).axis(tickWidth=0, labelAngle=labelAngle),
             y = alt.Y('sum(count):Q', title=yTitle),
@@ -462,9 +568,9 @@ def plotTimeSeriesPublicationData(dataToPlot, baseName = "replicability", dataFi
             height=300
         ).configure_legend(orient='bottom', direction='horizontal', columns=legendColumns, offset=legendOffset, titleLimit=0, labelLimit=myLabelLimit)
 
-        chart.save(baseName + '-singlebargraphs.pdf')
+        queueChartRender(chartRenderQueue, chart, baseName + '-singlebargraphs.pdf')
 
-    if ("all" in chartsToPlot) or ("groupedbargraph" in chartsToPlot):
+    if (("all" in chartsToPlot) or ("groupedbargraph" in chartsToPlot)) and isChartWanted(chartRenderQueue, baseName + '-groupedbargraph'):
         chart = alt.Chart(altairData).mark_bar().encode(
             x = alt.X('year:N', title=xTitle, sort=None).axis(tickWidth=0, labelAngle=labelAngle),
             y = alt.Y('count:Q', title=yTitle),
@@ -510,9 +616,10 @@ def plotTimeSeriesPublicationData(dataToPlot, baseName = "replicability", dataFi
                 dy=13, dx=noteXOffset
             ))
 
-        chart.save(baseName + '-groupedbargraph.pdf')
+        queueChartRender(chartRenderQueue, chart, baseName + '-groupedbargraph.pdf')
 
-    if ("all" in chartsToPlot) or ("linegraph" in chartsToPlot):
+    if (("all" in chartsToPlot) or ("linegraph" in chartsToPlot)) and isChartWanted(chartRenderQueue, baseName + '-linegraph'):
+        if lineGraphDataToPlot != None: altairData = pd.DataFrame(lineGraphDataToPlot)
         chart = alt.Chart(altairData).mark_line().encode(
             x = alt.X('year:N', title=xTitle, sort=None).axis(tickWidth=0, labelAngle=labelAngle),
             y = alt.Y('count:Q', title=yTitle),
@@ -527,7 +634,7 @@ def plotTimeSeriesPublicationData(dataToPlot, baseName = "replicability", dataFi
             height=300
         ).configure_legend(orient='bottom', direction='horizontal', columns=legendColumns, offset=legendOffset, titleLimit=0, labelLimit=myLabelLimit)
 
-        chart.save(baseName + '-linegraph.pdf')
+        queueChartRender(chartRenderQueue, chart, baseName + '-linegraph.pdf')
 
 def digitToNameSequence(number):
     # Define a dictionary to map the digit to its English name
@@ -558,11 +665,11 @@ def digitToNameSequence(number):
 # read in external verification files (DOIs of published visualization papers)
 #####################################
 
+# all of these go into one registry that maps each doi to its venue(s) and conference year
+venueRegistry = createVenueRegistry()
+
 # read the dois of the IEEE VIS papers from vispubdata (as csv file)
-visPubDataDois = []
-visPubDataConferenceYears = {}
 visPubDataAuthorsDeduped = {}
-visPubDataMostRecentYear = 0
 with open('input/vispubdata.csv', 'r', encoding="utf-8") as csvfile:
     # create a CSV reader object
     reader = csv.DictReader(csvfile)
@@ -570,10 +677,8 @@ with open('input/vispubdata.csv', 'r', encoding="utf-8") as csvfile:
     for row in reader:
         doi = row['DOI'].lower()
         year = int(row['Year'])
-        visPubDataDois.append(doi)
-        visPubDataConferenceYears[doi] = year
+        registerDoi(venueRegistry, doi, 'vis', year, updateExisting = True)
         visPubDataAuthorsDeduped[doi] = row['AuthorNames-Deduped'].split(';') # AuthorNames-Deduped,AuthorNames
-        if (year > visPubDataMostRecentYear): visPubDataMostRecentYear = year
 
 # when vispubdata is not current, we can also use TVCG's CSV export of the VIS issues to add the missing data
 tvcgFilenamesList = glob.glob('input/tvcg-[0-9][0-9][0-9][0-9]-vol-[0-9][0-9]-no-[0-9][0-9].csv')
@@ -584,11 +689,9 @@ for tvcgFilename in tvcgFilenamesList:
         # iterate over the rows
         for row in reader:
             tvcgDoi = row['DOI'].lower()
-            if tvcgDoi not in visPubDataDois: # so that we do not duplicate the loaded dois
+            if not isDoiInVenue(venueRegistry, tvcgDoi, 'vis'): # so that we do not duplicate the loaded dois
                 year = int(row['Publication Year']) - 1 # the year in the data is the year of publication in TVCG, not presentation at VIS, so we need to deduct 1
-                visPubDataDois.append(tvcgDoi)
-                visPubDataConferenceYears[tvcgDoi] = year
-                if (year > visPubDataMostRecentYear): visPubDataMostRecentYear = year
+                registerDoi(venueRegistry, tvcgDoi, 'vis', year)
 
 # another alternative: a manually created spreadsheet of accepted VIS papers (I added this mainly for the BELIV paper submission)
 acceptedVisPapersFilenamesList = glob.glob('input/vis-[0-9][0-9][0-9][0-9].csv')
@@ -599,11 +702,11 @@ for acceptedVisPapersFilename in acceptedVisPapersFilenamesList:
         # iterate over the rows
         for row in reader:
             visDoi = row['DOI'].lower()
-            if visDoi not in visPubDataDois: # so that we do not duplicate the loaded dois (should not happen if we use fake DOIs)
+            if not isDoiInVenue(venueRegistry, visDoi, 'vis'): # so that we do not duplicate the loaded dois (should not happen if we use fake DOIs)
                 year = int(row['Year']) # the year in the data is the year of presentation at VIS
-                visPubDataDois.append(visDoi)
-                visPubDataConferenceYears[visDoi] = year
-                if (year > visPubDataMostRecentYear): visPubDataMostRecentYear = year
+                registerDoi(venueRegistry, visDoi, 'vis', year)
+visPubDataConferenceYears = venueConferenceYears(venueRegistry, 'vis')
+visPubDataMostRecentYear = venueMostRecentYear(venueRegistry, 'vis')
 
 # when done with all loading of proper VIS papers, count the totals of papers per year and output strings
 listOfVispubDataYears = list(set(val for val in visPubDataConferenceYears.values()))
@@ -612,20 +715,16 @@ for year in listOfVispubDataYears:
     paperNumbersOutputString += "\\newcommand{\\TotalIeeeVisPapersIn" + intToRoman(year) + "}{" + str(papersThatYear) + "}\n"
 
 # read the dois of the IEEE VIS journal presentations (as csv file)
-visJournalPresentationDois = []
-visJournalPresentationMostRecentYear = 0
-visTVCGJournalPresentationConferenceYears = {}
 with open('input/vis_journal_presentations.csv', 'r', encoding="utf-8") as csvfile:
     # create a CSV reader object
     reader = csv.DictReader(csvfile)
     # iterate over the rows
     for row in reader:
         tvcgDoi = row['doi'].lower()
-        visJournalPresentationDois.append(tvcgDoi)
-        year = int(row['year'])
-        if (row['journal'] == "TVCG"): # only for TVCG papers
-            visTVCGJournalPresentationConferenceYears[tvcgDoi] = year # the year of the presentation
-        if (year > visJournalPresentationMostRecentYear): visJournalPresentationMostRecentYear = year
+        year = int(row['year']) # the year of the presentation
+        registerDoi(venueRegistry, tvcgDoi, 'vis_journal', year, { "journal": row['journal'] }, updateExisting = True)
+visJournalPresentationMostRecentYear = venueMostRecentYear(venueRegistry, 'vis_journal')
+visTVCGJournalPresentationConferenceYears = venueConferenceYears(venueRegistry, 'vis_journal', lambda entry: entry["journal"] == "TVCG") # only for TVCG papers
 
 # when done with all loading of proper VIS journal papers, count the totals of TVCG journal papers per year and output strings
 listOfTVCGJournalPresentationYears = list(set(val for val in visTVCGJournalPresentationConferenceYears.values()))
@@ -633,149 +732,70 @@ for year in listOfTVCGJournalPresentationYears:
     papersThatYear = sum(value == year for value in visTVCGJournalPresentationConferenceYears.values())
     paperNumbersOutputString += "\\newcommand{\\TotalIeeeVisTVCGJournalPapersIn" + intToRoman(year) + "}{" + str(papersThatYear) + "}\n"
 
-# read the dois of the PacificVis TVCG papers (as csv file)
-pacificVisTvcgDois = []
-pacificVisTvcgMostRecentYear = 0
-with open('input/pacificvis_tvcg.csv', 'r', encoding="utf-8") as csvfile:
-    # create a CSV reader object
-    reader = csv.DictReader(csvfile)
-    # iterate over the rows
-    for row in reader:
-        pacificVisTvcgDois.append(row['doi'].lower())
-        year = int(row['year'])
-        if (year > pacificVisTvcgMostRecentYear): pacificVisTvcgMostRecentYear = year
-
-# read the dois of the EuroVis journal presentation papers (as csv file)
-pacificVisJournalPresentationDois = []
-pacificVisJournalPresentationMostRecentYear = 0
-with open('input/pacificvis_journal_presentations.csv', 'r', encoding="utf-8") as csvfile:
-    # create a CSV reader object
-    reader = csv.DictReader(csvfile)
-    # iterate over the rows
-    for row in reader:
-        pacificVisJournalPresentationDois.append(row['doi'].lower())
-        year = int(row['year'])
-        if (year > pacificVisJournalPresentationMostRecentYear): pacificVisJournalPresentationMostRecentYear = year
-
-
-# read the dois of the EuroVis journal presentation papers (as csv file)
-euroVisJournalPresentationDois = []
-euroVisJournalPresentationMostRecentYear = 0
-with open('input/eurovis_journal_presentations.csv', 'r', encoding="utf-8") as csvfile:
-    # create a CSV reader object
-    reader = csv.DictReader(csvfile)
-    # iterate over the rows
-    for row in reader:
-        euroVisJournalPresentationDois.append(row['doi'].lower())
-        year = int(row['year'])
-        if (year > euroVisJournalPresentationMostRecentYear): euroVisJournalPresentationMostRecentYear = year
-# for 2024 and onward, we just use the bibtex export from the EG DL, converted to CSV
-with open('input/eurovis.csv', 'r', encoding="utf-8") as csvfile:
-    # create a CSV reader object
-    reader = csv.DictReader(csvfile)
-    # iterate over the rows
-    for row in reader:
-        euroVisJournalPresentationDois.append(row['doi'].lower())
-        year = int(row['year'])
-        if (year > euroVisJournalPresentationMostRecentYear): euroVisJournalPresentationMostRecentYear = year
-
-# read the dois of the VCBM journal (C&G) papers (as csv file)
-vcbmJournalDois = []
-vcbmJournalMostRecentYear = 0
-with open('input/vcbm_cag.csv', 'r', encoding="utf-8") as csvfile:
-    # create a CSV reader object
-    reader = csv.DictReader(csvfile)
-    # iterate over the rows
-    for row in reader:
-        vcbmJournalDois.append(row['doi'].lower())
-        year = int(row['conf. year'])
-        if (year > vcbmJournalMostRecentYear): vcbmJournalMostRecentYear = year
-
-# read the dois of the C&G visualization-topic special issue papers (as csv file)
-cagVisSpecialIssueDois = []
-cagVisSpecialIssueMostRecentYear = 0
-with open('input/envirvis_cag.csv', 'r', encoding="utf-8") as csvfile:
-    # create a CSV reader object
-    reader = csv.DictReader(csvfile)
-    # iterate over the rows
-    for row in reader:
-        cagVisSpecialIssueDois.append(row['doi'].lower())
-        year = int(row['conf. year'])
-        if (year > cagVisSpecialIssueMostRecentYear): cagVisSpecialIssueMostRecentYear = year
-with open('input/eurova_cag.csv', 'r', encoding="utf-8") as csvfile:
-    # create a CSV reader object
-    reader = csv.DictReader(csvfile)
-    # iterate over the rows
-    for row in reader:
-        cagVisSpecialIssueDois.append(row['doi'].lower())
-        year = int(row['conf. year'])
-        if (year > cagVisSpecialIssueMostRecentYear): cagVisSpecialIssueMostRecentYear = year
-with open('input/molva_cag.csv', 'r', encoding="utf-8") as csvfile:
-    # create a CSV reader object
-    reader = csv.DictReader(csvfile)
-    # iterate over the rows
-    for row in reader:
-        cagVisSpecialIssueDois.append(row['doi'].lower())
-        year = int(row['conf. year'])
-        if (year > cagVisSpecialIssueMostRecentYear): cagVisSpecialIssueMostRecentYear = year
-with open('input/cgvc_cag.csv', 'r', encoding="utf-8") as csvfile:
-    # create a CSV reader object
-    reader = csv.DictReader(csvfile)
-    # iterate over the rows
-    for row in reader:
-        cagVisSpecialIssueDois.append(row['doi'].lower())
-        year = int(row['conf. year'])
-        if (year > cagVisSpecialIssueMostRecentYear): cagVisSpecialIssueMostRecentYear = year
-
-# read the dois of the proper EuroVis papers (as xlsx file)
-euroVisPaperDois = []
-euroVisPaperMostRecentYear = 0
-with pd.ExcelFile('input/EuroVisFull_CGF.xlsx') as xls:
-    sheetX = xls.parse(0) # select the first sheet
-    targetCellName = 'dc.identifier.doi[]'
-    numberOfRows = len(sheetX[targetCellName])
-    for i in range(0, numberOfRows):
-        doi = sheetX[targetCellName][i]
-        year = int(sheetX['dc.date.issued[en_US]'][i])
-        abstract = str(sheetX['dc.description.abstract[en_US]'][i])
-        if (len(abstract) > 0) and (abstract != 'nan'): # avoid including frontmatter that has no abstract
-            if ((type(doi) == str) and (doi != 0) and (doi != '')): euroVisPaperDois.append(doi)
-            else:
-                doi = sheetX['dc.identifier.uri[en_US]'][i].replace('http://dx.doi.org/', '')
-                if ((not 'handle' in doi) and ('10.1111/' in doi)):
-                    euroVisPaperDois.append(doi)
-                # else: # this is just for double-checking, could be added to a verbose mode
-                #     print('Incorrect EuroVis DOI: ' + doi)
-            if (year > euroVisPaperMostRecentYear): euroVisPaperMostRecentYear = year
-# for 2024 and onward, we just use the bibtex export from the EG DL, converted to CSV
-with open('input/eurovis.csv', 'r', encoding="utf-8") as csvfile:
-    # create a CSV reader object
-    reader = csv.DictReader(csvfile)
-    # iterate over the rows
-    for row in reader:
-        euroVisPaperDois.append(row['doi'].lower())
-        year = int(row['year'])
-        if (year > euroVisPaperMostRecentYear): euroVisPaperMostRecentYear = year
-
-# read the dois of the EuroVis STAR papers (as xlsx file)
-with pd.ExcelFile('input/EuroVisSTARS_CGF.xlsx') as xls:
-    sheetX = xls.parse(0) # select the first sheet
-    targetCellName = 'dc.identifier.doi[]'
-    numberOfRows = len(sheetX[targetCellName])
-    for i in range(0, numberOfRows):
-        doi = sheetX[targetCellName][i]
-        year = int(sheetX['dc.date.issued[]'][i])
-        abstract = str(sheetX['dc.description.abstract[en_US]'][i])
-        if (len(abstract) > 0) and (abstract != 'nan'): # avoid including frontmatter that has no abstract
-            if ((type(doi) == str) and (doi != 0) and (doi != '')): euroVisPaperDois.append(doi)
-            else:
-                doi = sheetX['dc.identifier.uri[]'][i].replace('http://dx.doi.org/', '')
-                if ((not 'handle' in doi) and ('10.1111/' in doi)):
-                    euroVisPaperDois.append(doi)
-                # else: # this is just for double-checking, could be added to a verbose mode
-                #     print('Incorrect EuroVis DOI: ' + doi)
-            if (year > euroVisPaperMostRecentYear): euroVisPaperMostRecentYear = year
-
+# read the dois of the PacificVis TVCG papers, the PacificVis and EuroVis journal presentation papers, as well as
+# the VCBM journal (C&G) papers and the C&G visualization-topic special issue papers (all as csv files)
+# for EuroVis 2024 and onward, we just use the bibtex export from the EG DL, converted to CSV (which we use both for the journal presentations and the proper papers)
+venueCsvFiles = [
+    ('input/pacificvis_tvcg.csv', 'pacificvis_tvcg', 'year'),
+    ('input/pacificvis_journal_presentations.csv', 'pacificvis_journal', 'year'),
+    ('input/eurovis_journal_presentations.csv', 'eurovis_journal', 'year'),
+    ('input/eurovis.csv', 'eurovis_journal', 'year'),
+    ('input/vcbm_cag.csv', 'vcbm', 'conf. year'),
+    ('input/envirvis_cag.csv', 'cag_special_issue', 'conf. year'),
+    ('input/eurova_cag.csv', 'cag_special_issue', 'conf. year'),
+    ('input/molva_cag.csv', 'cag_special_issue', 'conf. year'),
+    ('input/cgvc_cag.csv', 'cag_special_issue', 'conf. year'),
+    ('input/eurovis.csv', 'eurovis', 'year'),
+]
+for venueCsvFilename, venue, yearColumn in venueCsvFiles:
+    with open(venueCsvFilename, 'r', encoding="utf-8") as csvfile:
+        # create a CSV reader object
+        reader = csv.DictReader(csvfile)
+        # iterate over the rows
+        for row in reader:
+            registerDoi(venueRegistry, row['doi'].lower(), venue, int(row[yearColumn]))
+
+# read the dois of the proper EuroVis papers and the EuroVis STAR papers (as xlsx files)
+# (reading them needs pandas, so we keep the DOIs and years in euroVisDoiCacheFile and only read the files again when they changed)
+euroVisXlsxFiles = [('input/EuroVisFull_CGF.xlsx', '[en_US]'), ('input/EuroVisSTARS_CGF.xlsx', '[]')]
+if isStageCurrent(stageManifest, "eurovis_dois", [euroVisXlsxFilename for euroVisXlsxFilename, columnSuffix in euroVisXlsxFiles]):
+    with open(euroVisDoiCacheFile, "r", encoding='utf-8') as f:
+        euroVisDois = json.load(f)
+else:
+    import pandas as pd
+    euroVisDois = [] # [doi (None if it is not a proper one), year] of each paper, in the order of the files
+    for euroVisXlsxFilename, columnSuffix in euroVisXlsxFiles:
+        with pd.ExcelFile(euroVisXlsxFilename) as xls:
+            sheetX = xls.parse(0) # select the first sheet
+            targetCellName = 'dc.identifier.doi[]'
+            numberOfRows = len(sheetX[targetCellName])
+            for i in range(0, numberOfRows):
+                doi = sheetX[targetCellName][i]
+                year = int(sheetX['dc.date.issued' + columnSuffix][i])
+                abstract = str(sheetX['dc.description.abstract[en_US]'][i])
+                if (len(abstract) > 0) and (abstract != 'nan'): # avoid including frontmatter that has no abstract
+                    if ((type(doi) == str) and (doi != 0) and (doi != '')): euroVisDois.append([doi, year])
+                    else:
+                        doi = sheetX['dc.identifier.uri' + columnSuffix][i].replace('http://dx.doi.org/', '')
+                        if ((not 'handle' in doi) and ('10.1111/' in doi)):
+                            euroVisDois.append([doi, year])
+                        else:
+                            # print('Incorrect EuroVis DOI: ' + doi) # this is just for double-checking, could be added to a verbose mode
+                            euroVisDois.append([None, year])
+    os.makedirs(os.path.dirname(euroVisDoiCacheFile), exist_ok=True)
+    with open(euroVisDoiCacheFile, "w", encoding='utf-8') as f:
+        json.dump(euroVisDois, f)
+    recordStage(stageManifest, "eurovis_dois", [euroVisXlsxFilename for euroVisXlsxFilename, columnSuffix in euroVisXlsxFiles], [euroVisDoiCacheFile])
+for doi, year in euroVisDois:
+    if doi != None: registerDoi(venueRegistry, doi, 'eurovis', year)
+    noteVenueYear(venueRegistry, 'eurovis', year)
+
+pacificVisTvcgMostRecentYear = venueMostRecentYear(venueRegistry, 'pacificvis_tvcg')
+pacificVisJournalPresentationMostRecentYear = venueMostRecentYear(venueRegistry, 'pacificvis_journal')
+euroVisJournalPresentationMostRecentYear = venueMostRecentYear(venueRegistry, 'eurovis_journal')
+euroVisPaperMostRecentYear = venueMostRecentYear(venueRegistry, 'eurovis')
+vcbmJournalMostRecentYear = venueMostRecentYear(venueRegistry, 'vcbm')
+cagVisSpecialIssueMostRecentYear = venueMostRecentYear(venueRegistry, 'cag_special_issue')
 #####################################
 # rest of processing
 #####################################
@@ -783,6 +803,14 @@ with pd.ExcelFile('input/EuroVisSTARS_CGF.xlsx') as xls:
 updatingGrsiDataFromWeb = False # we will only do this for the first run of the script in a day, otherwise we use the stored data
 # this variable will also be used for determining if we should update the extra data for the papers from the digital libraries
 
+# the author name normalization rules, compiled once
+authorNameRules = loadAuthorNameRules(authorNameRulesFile)
+
+# the daily snapshots of the GRSI data (we used to keep a full "YYYYMMDD grsi paper data.json" file for each day, which we now import)
+grsiHistory = openGrsiHistory(grsiHistorySubdirectory)
+for fileName in importGrsiSnapshotFiles(grsiHistory, pathOfTheScript):
+    print("Imported " + fileName + " into the GRSI data history in " + grsiHistorySubdirectory + " (the file can now be deleted)")
+
 # this will be the list that records all data
 paperList = []
 paperCounter = 0
@@ -800,197 +828,21 @@ if useLocalDataOnly:
     data_date_year = grsiMetaData["data_download_year"]
     formatted_date = f"{data_date_year}{data_date_month:02d}{data_date_day:02d}"
 else:
-    if (not (os.path.isfile(pathOfTheScript + "/" + formatted_date + " grsi paper data.json"))):
+    if not hasGrsiSnapshot(grsiHistory, formatted_date):
         # if we have not yet downloaded/scraped today's data, then get the data from the web
         print("Getting the current data from the web ...")
         updatingGrsiDataFromWeb = True
-        page = urlopen('https://www.replicabilitystamp.org/').read()
-        soup = BeautifulSoup(page, features="lxml")
-
-        for anchor in soup.body.find_all('section', attrs={'class': 'spotlight'}):
-            paperCounter += 1
-            paperItem = {}
-            paperItem['counter'] = paperCounter
-            paperItem['is_vis'] = False # by default
-            x = anchor.find('div', attrs={'class': 'content'})
-
-            title = str(x.find_next("h3").find_next("a").get_text())
-            title = title.replace("Towards Efficieant Novel View Synthesis", "Towards Efficient Novel View Synthesis")
-            paperItem['title'] = title.strip()
-            if paperItem['title'][-1] == '.': paperItem['title'] = paperItem['title'][:-1] # cleaning up
-
-            # doi data clean-up
-            doi = str(x.find_all("a")[3].get('href'))
-            doi = doi.replace("https://doi.org/", "")
-            doi = doi.replace("https://doi.ieeecomputersociety.org/", "")
-            doi = re.sub(pattern=r"https://diglib\.eg\.org(?::443)?/handle/10\.1111/cgf(\d+)", repl=r"10.1111/cgf.\1", string=doi)
-            doi = doi.replace("https://dl.acm.org/doi/", "")
-            # some manual doi assignments because the GRSI page occasionally only provided Google searches instead of a real DOI at the beginning
-            # please note to replace the '%20' in the Google search links with a ' ' (manually or via a .replace("%20", " ") call as in the examples); otherwise the replacement does not work
-            doi = doi.replace("http://www.google.com/search?q=ArchComplete:%20Autoregressive%203D%20Architectural%20Design%20Generation%20with%20Hierarchical%20Diffusion-Based%20Upsampling".replace("%20", " "), "10.1016/j.cag.2025.104477")
-            # accepted real VIS papers below, need to fix later in both vis-2025.csv and via vispubdata, and remove here
-            doi = doi.replace("http://www.google.com/search?q=SynAnno:%20Interactive%20Guided%20Proofreading%20of%20Synaptic%20Annotations".replace("%20", " "), "10.vis2025/1718")
-            doi = doi.replace("http://www.google.com/search?q=Your%20Model%20Is%20Unfair,%20Are%20You%20Even%20Aware?%20Inverse%20Relationship%20Between%20Comprehension%20and%20Trust%20in%20Explainability%20Visualizations%20of%20Biased%20ML%20Models".replace("%20", " "), "10.vis2025/1446")
-            doi = doi.replace("http://www.google.com/search?q=Cluster-Based%20Random%20Forest%20Visualization%20and%20Interpretation".replace("%20", " "), "10.vis2025/1432")
-            doi = doi.replace("http://www.google.com/search?q=BondMatcher:%20H-Bond%20Stability%20Analysis%20in%20Molecular%20Systems".replace("%20", " "), "10.vis2025/1440")
-            doi = doi.replace("%20", " ") # in case we copy-pasted the link from the website
-            doi = re.sub(pattern=r"http(?:s)?://www\.google\.com/search.*", repl=r"NOT_ASSIGNED_YET", string=doi) # automatically assign the NOT_ASSIGNED_YET tag for remaining Google searches (once assigned but not yet on GRSI page add a manual override as above)
-            paperItem['doi'] = doi.lower()
-            # print a warning if the doi does not check out
-            if (doi[0:3] != "10."): print("WARNING: The DOI we read from GRSI page that does not seem to formatted correctly for a DOI: " + doi)
-
-            grsiUrl = str(x.find_all("a")[1].get('href'))
-            paperItem['grsi_url'] = "https://www.replicabilitystamp.org/" + grsiUrl
-
-            journalName = str(x.find_all("a")[2].get_text().strip())
-            paperItem['journal'] = journalName
-
-            repoUrl = str(x.find_all("a")[4].get('href'))
-            paperItem['repo_url'] = repoUrl
-
-            repoArchiveUrl = ""
-            if (len(x.find_all("a")) > 5):
-                repoArchiveUrl = str(x.find_all("a")[5].get('href'))
-            paperItem['repo_archive_url'] = repoArchiveUrl
-
-            y = anchor.find('div', attrs={'class': 'image'})
-            imageUrl = str(y.find_all("img")[0].get('src'))
-            paperItem['image_url'] = "https://www.replicabilitystamp.org/" + imageUrl
-
-            authors = str(x.find_next("p")).split("\n")[1].lstrip().split('<br/>')[0].rstrip() # this is now the list of authors per paper
-
-            # some systematic fixes
-            if (authors[-1] == '.'): authors = authors[:-1] # remove trailing dots (somewhat common)
-            if (authors[-1] == ','): authors = authors[:-1] # remove trailing commas (somewhat common)
-
-            # some ad-hoc author name fixes (easier than finding general solutions, if there even are any)
-            if doi == '10.1145/3528223.3530124': authors = authors.replace('Alexandre Mercier-Aubin, Alexander Winter, David I.W. Levin, and Paul G. Kry', 'Alexandre Mercier-Aubin, Paul G. Kry, Alexandre Winter, David I. W. Levin')
-            if doi == '10.1016/j.cag.2022.07.015': authors = authors.replace("Ariel Caputo, Marco Emporio, Andrea Giachetti, Marco Cristani, Guido Borghi, Andrea D'Eusanio, Minh-Quan Le, Hai-Dang Nguyen, Minh-Triet Tran, F. Ambellan, M. Hanik, E. Nava-Yazdani, C. von Tycowicz", "Marco Emporio, Ariel Caputo, Andrea Giachetti, Marco Cristani, Guido Borghi, Andrea D’Eusanio, Minh-Quan Le, Hai-Dang Nguyen, Minh-Triet Tran, Felix Ambellan, Martin Hanik, Esfandiar Nava-Yazdani, Christoph von Tycowicz")
-            authors = authors.replace('\u200b', '')
-            authors = re.sub(pattern=r"(\w),(\w)", repl=r"\1, \2", string=authors) # we need spaces after commas
-            authors = authors.replace('Chen, Shu-Yu and Su, Wanchao and Gao, Lin and Xia, Shihong and Fu, Hongbo', 'Shu-Yu Chen and Wanchao Su and Lin Gao and Shihong Xia and Hongbo Fu')
-            authors = authors.replace('Bora Yalçıner(1), Ahmet Oğuz Akyüz (1) ((1)Middle East Technical University, Computer Engineering Department)', 'Bora Yalçıner, Ahmet Oğuz Akyüz')
-            authors = authors.replace(' (*Joint first authors)', '')
-            authors = authors.replace('*', '')
-            authors = authors.replace('D. Mlakar, M. Winter, P. Stadlbauer, H.-P. Seidel, M. Steinberger, R. Zayer', 'Daniel Mlakar, Martin Winter, Pascal Stadlbauer, Hans-Peter Seidel, Markus Steinberger, Rhaleb Zayer')
-            authors = authors.replace('   (F# code by Martin Sarov)', '')
-            authors = authors.replace('F. Ambellan, M. Hanik, E. Nava-Yazdani, C. von Tycowicz', 'Felix Ambellan, Martin Hanik, Esfandiar Nava-Yazdani, Christoph von Tycowicz')
-            authors = authors.replace('Suzi Kim,Sunghee Choi', 'Suzi Kim, Sunghee Choi')
-            authors = authors.replace('Viekash V K', 'Viekash Vinoth Kumar')
-            authors = authors.replace('Yandong Guo Nihar Bagewadi', 'Yandong Guo, Nihar Bagewadi')
-            authors = authors.replace('Gao Lin, Yang Jie, Wu Tong, Yuan Yu-Jie, Fu Hongbo, Lai, Yu-Kun, Zhang Hao(Richard)', 'Lin Gao, Jie Yang, Tong Wu, Yu-Jie Yuan, Hongbo Fu, Yu-Kun Lai, Hao Zhang')
-            authors = authors.replace('ZHONGSHI JIANG, ZIYI ZHANG, YIXIN HU, TESEO SCHNEIDER, DENIS ZORIN, DANIELE PANOZZO', 'Zhongshi Jiang, Ziyi Zhang, Yixin Hu, Teseo Schneider, Denis Zorin, Daniele Panozzo')
-            authors = authors.replace('Guillaume Lavoue', 'Guillaume Lavoué')
-            authors = authors.replace('Felix Knoeppel', 'Felix Knöppel')
-            authors = authors.replace('Clement Lemeunier', 'Clément Lemeunier')
-            authors = authors.replace('Eric Guerin', 'Eric Guérin')
-            authors = authors.replace('Eric Gurin', 'Eric Guérin')
-            authors = authors.replace('Loic Barthe', 'Loïc Barthe')
-            authors = authors.replace('Jean-Sbastien Franco', 'Jean-Sébastien Franco')
-            authors = authors.replace('Johannes Schoning', 'Johannes Schöning')
-            authors = authors.replace('Peter Konig', 'Peter König')
-            authors = authors.replace('Jurgen Bernard', 'Jürgen Bernard')
-            authors = authors.replace('Katharina Wnsche', 'Katharina Wünsche')
-            authors = authors.replace('Torsten Mller', 'Torsten Möller')
-            authors = authors.replace('Peter Schroeder', 'Peter Schröder')
-            authors = authors.replace('Rudiger Westermann', 'Rüdiger Westermann')
-            authors = authors.replace('Simon T. Perrault', 'Simon Tangi Perrault')
-            authors = authors.replace('Stephen Kobourov', 'Stephen G. Kobourov')
-            authors = authors.replace('Thomas Mller', 'Thomas Müller')
-            authors = authors.replace('Lonni Besancon', 'Lonni Besançon')
-            authors = authors.replace('Stephane Gosset', 'Stéphane Gosset')
-            authors = authors.replace('Robert S Laramee', 'Robert S. Laramee')
-            authors = authors.replace('Salles V.G. Magalhães', 'Salles V. G. Magalhães')
-            authors = authors.replace('Charlie C.L. Wang', 'Charlie C. L. Wang')
-            authors = authors.replace('David I.W. Levin', 'David I. W. Levin')
-            authors = authors.replace('Marcus V.A. Andrade', 'Marcus V. A. Andrade')
-            authors = authors.replace('Boudewijn P.F. Lelieveldt', 'Boudewijn P. F. Lelieveldt')
-            authors = authors.replace('Martin Nollenburg', 'Martin Nöllenburg')
-            authors = authors.replace('Florian Schaefer', 'Florian Schäfer')
-            authors = authors.replace('Remi Allegre', 'Rémi Allègre')
-            authors = authors.replace('Jorg Peters', 'Jörg Peters')
-            authors = authors.replace('Rdiger Westermann', 'Rüdiger Westermann')
-            authors = authors.replace('Mihai Bce', 'Mihai Bâce')
-            authors = authors.replace('Alex Buerle', 'Alex Bäuerle')
-            authors = authors.replace('Emanuele Rodola', 'Emanuele Rodolà')
-            authors = authors.replace('Jonas Martinez', 'Jonàs Martínez')
-            authors = authors.replace('Juliane Mueller', 'Juliane Müller') # Juliane Müller-Sielaff https://orcid.org/0000-0002-8279-0901
-            authors = authors.replace('Juliane Mller', 'Juliane Müller') # same person
-            authors = authors.replace('Lidija Comic', 'Lidija Čomić')
-            authors = authors.replace('Renate Gruner', 'Renate Grüner')
-            authors = authors.replace('Kestutis Karciauskas', 'Kȩstutis Karčiauskas')
-            authors = authors.replace('Kęstutis Karčiauskas', 'Kȩstutis Karčiauskas')
-            authors = authors.replace('Rafal K. Mantiuk', 'Rafał K. Mantiuk')
-            authors = authors.replace('Gabriela Molina', 'Gabriela Molina León')
-            authors = authors.replace('Gabriela Molina León León', 'Gabriela Molina León') # fix the potential duplication of the second last name
-            authors = authors.replace('Marti Hearst', 'Marti A. Hearst')
-            authors = authors.replace('Vinicius da Silva', 'Vinícius da Silva')
-            authors = authors.replace('Helio Lopes', 'Hélio Lopes')
-            authors = authors.replace('Andrew McNutt', 'Andrew M. McNutt')
-            authors = authors.replace('Nikos Papadakis', 'Nikolaos Papadakis')
-            authors = authors.replace('Jol Randrianandrasana', 'Joël Randrianandrasana')
-            authors = authors.replace('Annemarie Moigne', 'Anne-Marie Moigne')
-            authors = authors.replace('Elie Michel', 'Élie Michel')
-            authors = authors.replace('Wei Jiang', 'Jiang Wei')
-            authors = authors.replace('Yana Nehme', 'Yana Nehmé')
-            authors = authors.replace('Alberto Cannavo', 'Alberto Cannavò')
-            authors = authors.replace('Silvia Sellan', 'Silvia Sellán')
-            authors = authors.replace('Yagiz Aksoy', 'Yağiz Aksoy')
-            authors = authors.replace('Yongjin Liu', 'Yong-Jin Liu')
-            authors = authors.replace('Fabian Prada', 'Fabián Prada')
-            authors = authors.replace('Stefano Zappala', 'Stefano Zappalà')
-            authors = authors.replace('Jungyu Yang', 'Jingyu Yang')
-            authors = authors.replace('Jakub Vasicek', 'Jakub Vašíček')
-            authors = authors.replace('Marta Nunez-Garcia', 'Marta Nuñez-Garcia')
-            authors = authors.replace('Francisco Alarcon', 'Francisco Alarcón')
-            authors = authors.replace('Lluis Mont', 'Lluís Mont')
-            authors = authors.replace('Corrado Cali', 'Corrado Calì')
-            authors = authors.replace('Jeremie Dumas', 'Jérémie Dumas')
-            authors = authors.replace('Milos Hasan', 'Miloš Hašan')
-            authors = authors.replace('Arsene Perard-Gayot', 'Arsène Pérard-Gayot')
-            authors = authors.replace('Roland Leissa', 'Roland Leißa')
-            authors = authors.replace('George Brown', 'George E. Brown')
-            authors = re.sub(pattern=r"Cindy Xiong(?: Bearfield)?", repl=r"Cindy Xiong Bearfield", string=authors) # same person, name change due to marriage (I assume)
-            authors = authors.replace('Jianjun Zhang', 'Jian Jun Zhang')
-            authors = authors.replace('LORENZO DIAZZI, DANIELE PANOZZO, AMIR VAXMAN, MARCO ATTENE', 'Lorenzo Diazzi, Daniele Panozzo, Amir Vaxman, Marco Attene')
-            authors = authors.replace('Lois Paulin', 'Loïs Paulin')
-            authors = authors.replace('Thomas Hollt', 'Thomas Höllt')
-            authors = authors.replace('Hao Huanga', 'Hao Huang')
-            authors = authors.replace('Shuaihang Yuana', 'Shuaihang Yuan')
-            authors = authors.replace('Yu Haoa', 'Yu Hao')
-            authors = authors.replace('Yağiz Aksoy', 'Yağız Aksoy')
-            authors = authors.replace('Matt I.B. Oddo', 'Matt I. B. Oddo')
-            authors = authors.replace('Dennis Bukenberger', 'Dennis R. Bukenberger')
-            authors = authors.replace('Rafael Azevedo', 'Rafael V. Azevedo')
-            authors = authors.replace('Joao Rulff', 'João Rulff')
-            authors = authors.replace('Tamal Dey', 'Tamal K. Dey')
-            authors = authors.replace('Alex Bronstein', 'Alex M. Bronstein')
-            authors = authors.replace('Michael Bronstein', 'Michael M. Bronstein')
-            authors = authors.replace('Scott Mitchell', 'Scott A. Mitchell')
-            authors = authors.replace('SASWAT SUBHAJYOTI MALLICK', 'Saswat Subhajyoti Mallick')
-            authors = authors.replace('RAHUL GOEL', 'Rahul Goel')
-            authors = authors.replace('BERNHARD KERBL', 'Bernhard Kerbl')
-            authors = authors.replace('FRANCISCO VICENTE CARRASCO', 'Markus Steinberger')
-            authors = authors.replace('MARKUS STEINBERGER', 'Francisco Vicente Carrasco')
-            authors = authors.replace('FERNANDO DE LA TORRE', 'Fernando De La Torre')
-
-            # make the author list reporting consistent
-            authors = authors.replace(' ; ', ', ')
-            authors = authors.replace('; ', ', ')
-            authors = authors.replace(';', ', ')
-            authors = authors.replace(', and ', ', ')
-            authors = authors.replace(' and ', ', ')
-            authors = authors.replace(' , ', ', ')
-            authors = authors.replace('  ', ' ')
-
-            paperItem['authors'] = authors # save the filtered authors list
-            paperList.append(paperItem) # then save the data in the list
+        from query_grsi import loadGrsiScrapeState, saveGrsiScrapeState, scrapeGrsiPapers
+        # only the papers that are new on the page or that changed since our last download are processed again
+        grsiScrapeState = loadGrsiScrapeState(grsiScrapeStateFile)
+        paperList = scrapeGrsiPapers(grsiScrapeState, authorNameRules, grsiStopAfterKnownPapers)
+        saveGrsiScrapeState(grsiScrapeStateFile, grsiScrapeState)
+        paperCounter = len(paperList)
 
     else:
         # otherwise we have today's data already, so load it
-        print("Loading already existing JSON file from disk ...")
-        with open(formatted_date + " grsi paper data.json", "r", encoding='utf-8') as f:
-            paperList = json.load(f)
+        print("Loading today's data from the GRSI data history ...")
+        paperList = materializeGrsiSnapshot(grsiHistory, formatted_date)
         unmarkPapers(paperList)  # this is, of course, old data: we redo it below
         paperCounter = len(paperList)
 
@@ -1004,7 +856,8 @@ paperNumbersOutputString += "\\newcommand{\\GrsiDataCurrentAsOfLong}{" + data_da
 
 # prepare the data for the author counting
 authorCounts = {}
-for paper in paperList:
+authorPaperIndices = {} # inverted index: author -> indices of their papers in paperList (each paper only once)
+for paperIndex, paper in enumerate(paperList):
     authors = paper['authors']
     authors = authors.replace(' Jr.', u'\u00A0Jr.') # last conversion, important later for the sorting (replacement with &nbsp;)
 
@@ -1015,6 +868,9 @@ for paper in paperList:
             authorCounts[authorFiltered] = authorCounts[authorFiltered] + 1
         else:
             authorCounts[authorFiltered] = 1
+            authorPaperIndices[authorFiltered] = []
+        if (len(authorPaperIndices[authorFiltered]) == 0) or (authorPaperIndices[authorFiltered][-1] != paperIndex):
+            authorPaperIndices[authorFiltered].append(paperIndex)
 
 #######################################################
 #######################################################
@@ -1044,18 +900,8 @@ with open(formatted_date + " current-list.txt", "w", encoding='utf-8') as f:
     paperNumbersOutputString += "\\newcommand{\\GrsiTotalPapers}{" + str(paperCounter) + "}\n"
     print("", file=f)
 
-    # mark all vis papers to be able to check by person
-    unmarkPapers(paperList)
-    markPapersByDoi(paperList, visPubDataDois, "is_vis")
-    markPapersByDoi(paperList, visJournalPresentationDois, "is_vis")
-    markPapersByDoi(paperList, pacificVisTvcgDois, "is_vis")
-    markPapersByDoi(paperList, pacificVisJournalPresentationDois, "is_vis")
-    markPapersByDoi(paperList, euroVisPaperDois, "is_vis")
-    markPapersByDoi(paperList, euroVisJournalPresentationDois, "is_vis")
-    markPapersByDoi(paperList, vcbmJournalDois, "is_vis")
-    markPapersByDoi(paperList, cagVisSpecialIssueDois, "is_vis")
-    markVisPapersByKeywords(paperList)
-    markVisPapersByFutureVISPresentation(paperList)
+    # classify all vis papers in a single pass (this also allows us to check by person); the analysis below is printed from this classification
+    visClassification = classifyPapers(paperList, venueRegistry, isVisPaperByKeywords, isManuallySelectedVisPaper, isFutureVisPresentation, "is_vis")
 
     print("===============\nSorted by rank:\n===============", file=f)
     for author in authorCountsSortedByNumbers.keys():
@@ -1065,11 +911,10 @@ with open(formatted_date + " current-list.txt", "w", encoding='utf-8') as f:
             countPerPlace = 0
         authorPlaces[author] = place
         
-        # count the author's vis papers
+        # count the author's vis papers (via the index, so that we only look at their own papers and do not match parts of other names)
         authorVisPaperCount = 0
-        for paper in paperList:
-            if (author in paper["authors"]):
-                if (paper["is_vis"]): authorVisPaperCount += 1
+        for paperIndex in authorPaperIndices[author]:
+            if (paperList[paperIndex]["is_vis"]): authorVisPaperCount += 1
         authorVisPapers[author] = authorVisPaperCount
         visPercentage = 100.0*float(authorVisPapers[author])/float(authorCounts[author])
 
@@ -1127,64 +972,44 @@ with open(formatted_date + " current-list.txt", "w", encoding='utf-8') as f:
     ############################################
     ### proper IEEE VIS papers
     ############################################
-    unmarkPapers(paperList)
     doiPaddingCount = 25
     print("\n\n=================================", file=f)
     print("Analysis for visualization papers", file=f)
     print("=================================", file=f)
 
-    # check if a paper is a IEEE vis paper
-    markPapersByDoi(paperList, visPubDataDois, "is_vis", "IEEE VIS")
-
-    # count the IEEE vis papers
-    oldVisCounter = 0
-    visCounter = 0
-    for paper in paperList:
-        if (paper["is_vis"]): visCounter += 1
+    # each venue's count only includes the papers not already counted for one of the venues before it
+    venueCounts = { venue : visClassification["venues"][venue]["count"] for venue in visClassification["venues"].keys() }
+    venueMembers = { venue : visClassification["venues"][venue]["members"] for venue in visClassification["venues"].keys() }
 
     # print IEEE vis papers
-    print("\nIEEE VIS papers (only those we know were accepted directly to the conference, up to the conference in " + str(visPubDataMostRecentYear) + ", via vispubdata DOIs): " + str(visCounter - oldVisCounter) + " papers", file=f)
-    paperNumbersOutputString += "\\newcommand{\\GrsiIeeeVisPapersCount}{" + str(visCounter - oldVisCounter) + "}\n"
+    print("\nIEEE VIS papers (only those we know were accepted directly to the conference, up to the conference in " + str(visPubDataMostRecentYear) + ", via vispubdata DOIs): " + str(venueCounts['vis']) + " papers", file=f)
+    paperNumbersOutputString += "\\newcommand{\\GrsiIeeeVisPapersCount}{" + str(venueCounts['vis']) + "}\n"
     paperNumbersOutputString += "\\newcommand{\\GrsiIeeeVisPapersLastYear}{" + str(visPubDataMostRecentYear) + "}\n"
     visPapersPerYear = {}
     for year in range(2017, current_year): visPapersPerYear[year] = 0 # just to ensure that we have all years since 2017
-    for paper in paperList:
-        if ((paper["is_vis"]) and (paper["doi"] in visPubDataDois)):
-            print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
-            year = visPubDataConferenceYears[paper["doi"]]
-            if year in visPapersPerYear.keys(): visPapersPerYear[year] += 1
-            else: visPapersPerYear[year] = 1
+    for year, count in visClassification["venues"]['vis']["per_year"].items():
+        if year in visPapersPerYear.keys(): visPapersPerYear[year] += count
+        else: visPapersPerYear[year] = count
+    for paper in venueMembers['vis']: print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
     for year in visPapersPerYear.keys(): paperNumbersOutputString += "\\newcommand{\\GrsiIeeeVisPapersIn" + intToRoman(year) + "}{" + str(visPapersPerYear[year]) + "}\n"
 
     ############################################
     ### journal paper presentations at IEEE VIS
     ############################################
 
-    # check if a paper was presented at IEEE
-    markPapersByDoi(paperList, visJournalPresentationDois, "is_vis", "journal pres. @ IEEE VIS")
-    markVisPapersByFutureVISPresentation(paperList)
-
-    # maked by keyword
-    oldVisCounter = visCounter
-    visCounter = 0
-    for paper in paperList:
-        if (paper["is_vis"]): visCounter += 1
-
-    # print IEEE VIS journal presentations
-    print("\nIEEE VIS TVCG journal presentations (up to the conference in " + str(visJournalPresentationMostRecentYear) + ", and some planned ones we know of): " + str(visCounter - oldVisCounter) + " papers", file=f)
-    paperNumbersOutputString += "\\newcommand{\\GrsiIeeeVisJournalPresentationsCount}{" + str(visCounter - oldVisCounter) + "}\n"
+    # print IEEE VIS journal presentations (the members also include the planned presentations we already know of)
+    print("\nIEEE VIS TVCG journal presentations (up to the conference in " + str(visJournalPresentationMostRecentYear) + ", and some planned ones we know of): " + str(venueCounts['vis_journal']) + " papers", file=f)
+    paperNumbersOutputString += "\\newcommand{\\GrsiIeeeVisJournalPresentationsCount}{" + str(venueCounts['vis_journal']) + "}\n"
     paperNumbersOutputString += "\\newcommand{\\GrsiIeeeVisJournalPresentationsLastYear}{" + str(visJournalPresentationMostRecentYear) + "}\n"
     
     visTVCGJournalPapersPerYear = {}
     for year in range(2017, current_year): visTVCGJournalPapersPerYear[year] = 0 # just to ensure that we have all years since 2017
-    for paper in paperList:
-        # if ((paper["is_vis"]) and (paper["doi"] in visJournalPresentationDois)): # this does not catch the manually marked papers
-        if ((paper["is_vis"]) and (paper["type"] == "journal pres. @ IEEE VIS")): # but this does :-)
-            print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
-            if paper["doi"] in visTVCGJournalPresentationConferenceYears.keys(): # there may also be CG&A papers in the list of visJournalPresentationDois
-                year = visTVCGJournalPresentationConferenceYears[paper["doi"]]
-                if year in visTVCGJournalPapersPerYear.keys(): visTVCGJournalPapersPerYear[year] += 1
-                else: visTVCGJournalPapersPerYear[year] = 1
+    for paper in venueMembers['vis_journal']:
+        print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
+        if paper["doi"] in visTVCGJournalPresentationConferenceYears.keys(): # there may also be CG&A papers among the IEEE VIS journal presentations
+            year = visTVCGJournalPresentationConferenceYears[paper["doi"]]
+            if year in visTVCGJournalPapersPerYear.keys(): visTVCGJournalPapersPerYear[year] += 1
+            else: visTVCGJournalPapersPerYear[year] = 1
     onlyTvcgJournalPresentations = 0 # this count may be different from the value above once CG&A also starts awarding stamps
     for year in visTVCGJournalPapersPerYear.keys():
         onlyTvcgJournalPresentations += visTVCGJournalPapersPerYear[year]
@@ -1192,197 +1017,87 @@ with open(formatted_date + " current-list.txt", "w", encoding='utf-8') as f:
     paperNumbersOutputString += "\\newcommand{\\GrsiIeeeVisTvcgJournalPresentationsCount}{" + str(onlyTvcgJournalPresentations) + "}\n"
 
     ############################################
-    ### proper PacificVis TVCG papers
-    ############################################
-
-    # check if a paper was a PacificVis TVCG paper
-    markPapersByDoi(paperList, pacificVisTvcgDois, "is_vis", "PacificVis TVCG")
-
-    # count all papers so far
-    oldVisCounter = visCounter
-    visCounter = 0
-    for paper in paperList:
-        if (paper["is_vis"]): visCounter += 1
-
-    # print PacificVis TVCG paper
-    print("\nIEEE PacificVis TVCG papers (up to the conference in " + str(pacificVisTvcgMostRecentYear) + "): " + str(visCounter - oldVisCounter) + " papers", file=f)
-    paperNumbersOutputString += "\\newcommand{\\GrsiPacificVisTvcgPapersCount}{" + str(visCounter - oldVisCounter) + "}\n"
-    paperNumbersOutputString += "\\newcommand{\\GrsiPacificVisTvcgPapersLastYear}{" + str(pacificVisTvcgMostRecentYear) + "}\n"
-    for paper in paperList:
-        if ((paper["is_vis"]) and (paper["doi"] in pacificVisTvcgDois)): print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
-
-    ############################################
-    ### journal paper presentations at PacificVis
-    ############################################
-
-    # check if a paper was presented at PacificVis
-    markPapersByDoi(paperList, pacificVisJournalPresentationDois, "is_vis", "journal pres. @ PacificVis")
-
-    # count all papers so far
-    oldVisCounter = visCounter
-    visCounter = 0
-    for paper in paperList:
-        if (paper["is_vis"]): visCounter += 1
-
-    # print PacificVis journal presentations
-    print("\nPacificVis journal presentations (up to the conference in " + str(pacificVisJournalPresentationMostRecentYear) + "): " + str(visCounter - oldVisCounter) + " papers", file=f)
-    paperNumbersOutputString += "\\newcommand{\\GrsiPacificVisJournalPresentationsCount}{" + str(visCounter - oldVisCounter) + "}\n"
-    paperNumbersOutputString += "\\newcommand{\\GrsiPacificVisJournalPresentationsLastYear}{" + str(pacificVisJournalPresentationMostRecentYear) + "}\n"
-    for paper in paperList:
-        if ((paper["is_vis"]) and (paper["doi"] in pacificVisJournalPresentationDois)): print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
-
-    ############################################
-    ### proper EuroVis papers
-    ############################################
-
-    # check if a paper was a EuroVis CGF paper
-    markPapersByDoi(paperList, euroVisPaperDois, "is_vis", "EuroVis")
-
-    # count all papers so far
-    oldVisCounter = visCounter
-    visCounter = 0
-    for paper in paperList:
-        if (paper["is_vis"]): visCounter += 1
-
-    # print proper EuroVis papers
-    print("\nproper EuroVis papers/STARs (up to the conference in " + str(euroVisPaperMostRecentYear) + "): " + str(visCounter - oldVisCounter) + " papers", file=f)
-    paperNumbersOutputString += "\\newcommand{\\GrsiEuroVisPapersCount}{" + str(visCounter - oldVisCounter) + "}\n"
-    paperNumbersOutputString += "\\newcommand{\\GrsiEuroVisPapersLastYear}{" + str(euroVisPaperMostRecentYear) + "}\n"
-    for paper in paperList:
-        if ((paper["is_vis"]) and (paper["doi"] in euroVisPaperDois)): print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
-
-    ############################################
-    ### journal paper presentations at EuroVis
-    ############################################
-
-    # check if a paper was presented at EuroVis
-    markPapersByDoi(paperList, euroVisJournalPresentationDois, "is_vis", "journal pres. @ EuroVis")
-
-    # count all papers so far
-    oldVisCounter = visCounter
-    visCounter = 0
-    for paper in paperList:
-        if (paper["is_vis"]): visCounter += 1
-
-    # print EuroVis journal presentation papers
-    print("\nEuroVis journal presentations (up to the conference in " + str(euroVisJournalPresentationMostRecentYear) + "): " + str(visCounter - oldVisCounter) + " papers", file=f)
-    paperNumbersOutputString += "\\newcommand{\\GrsiEuroVisJournalPresentationsCount}{" + str(visCounter - oldVisCounter) + "}\n"
-    paperNumbersOutputString += "\\newcommand{\\GrsiEuroVisJournalPresentationsLastYear}{" + str(euroVisJournalPresentationMostRecentYear) + "}\n"
-    for paper in paperList:
-        if ((paper["is_vis"]) and (paper["doi"] in euroVisJournalPresentationDois)): print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
-
-    ############################################
-    ### VCBM journal papers (in C&G)
-    ############################################
-
-    # check if a paper was a VCBM journal paper
-    markPapersByDoi(paperList, vcbmJournalDois, "is_vis", "VCBM C&G")
-
-    # count all papers so far
-    oldVisCounter = visCounter
-    visCounter = 0
-    for paper in paperList:
-        if (paper["is_vis"]): visCounter += 1
-
-    # print EuroVis journal presentation papers
-    print("\nVCBM journal papers (up to the conference in " + str(vcbmJournalMostRecentYear) + "): " + str(visCounter - oldVisCounter) + " papers", file=f)
-    paperNumbersOutputString += "\\newcommand{\\GrsiVcbmCagPapersCount}{" + str(visCounter - oldVisCounter) + "}\n"
-    paperNumbersOutputString += "\\newcommand{\\GrsiVcbmCagPapersLastYear}{" + str(vcbmJournalMostRecentYear) + "}\n"
-    for paper in paperList:
-        if ((paper["is_vis"]) and (paper["doi"] in vcbmJournalDois)): print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
-
-    ############################################
-    ### C&G special issue papers on VIS conferences
+    ### the other venues: proper PacificVis TVCG papers, journal paper presentations at PacificVis,
+    ### proper EuroVis papers, journal paper presentations at EuroVis, VCBM journal papers (in C&G),
+    ### and C&G special issue papers on VIS conferences
     ############################################
 
-    # check if a paper was a C&G special issue paper
-    markPapersByDoi(paperList, cagVisSpecialIssueDois, "is_vis", "C&G special issue")
-
-    # count all papers so far
-    oldVisCounter = visCounter
-    visCounter = 0
-    for paper in paperList:
-        if (paper["is_vis"]): visCounter += 1
-
-    # print EuroVis journal presentation papers
-    print("\nC&G special issue papers (up to the respective conferences in " + str(cagVisSpecialIssueMostRecentYear) + "): " + str(visCounter - oldVisCounter) + " papers", file=f)
-    paperNumbersOutputString += "\\newcommand{\\GrsiCagSpecialIssuesPapersCount}{" + str(visCounter - oldVisCounter) + "}\n"
-    paperNumbersOutputString += "\\newcommand{\\GrsiCagSpecialIssuesPapersLastYear}{" + str(cagVisSpecialIssueMostRecentYear) + "}\n"
-    for paper in paperList:
-        if ((paper["is_vis"]) and (paper["doi"] in cagVisSpecialIssueDois)): print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
+    # venue, heading in the report, macro name prefix, most recent year
+    otherVenueReports = [
+        ('pacificvis_tvcg', "IEEE PacificVis TVCG papers (up to the conference in ", "GrsiPacificVisTvcgPapers", pacificVisTvcgMostRecentYear),
+        ('pacificvis_journal', "PacificVis journal presentations (up to the conference in ", "GrsiPacificVisJournalPresentations", pacificVisJournalPresentationMostRecentYear),
+        ('eurovis', "proper EuroVis papers/STARs (up to the conference in ", "GrsiEuroVisPapers", euroVisPaperMostRecentYear),
+        ('eurovis_journal', "EuroVis journal presentations (up to the conference in ", "GrsiEuroVisJournalPresentations", euroVisJournalPresentationMostRecentYear),
+        ('vcbm', "VCBM journal papers (up to the conference in ", "GrsiVcbmCagPapers", vcbmJournalMostRecentYear),
+        ('cag_special_issue', "C&G special issue papers (up to the respective conferences in ", "GrsiCagSpecialIssuesPapers", cagVisSpecialIssueMostRecentYear),
+    ]
+    for venue, heading, macroName, mostRecentYear in otherVenueReports:
+        print("\n" + heading + str(mostRecentYear) + "): " + str(venueCounts[venue]) + " papers", file=f)
+        paperNumbersOutputString += "\\newcommand{\\" + macroName + "Count}{" + str(venueCounts[venue]) + "}\n"
+        paperNumbersOutputString += "\\newcommand{\\" + macroName + "LastYear}{" + str(mostRecentYear) + "}\n"
+        for paper in venueMembers[venue]: print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
 
     ############################################
     ### filter by keywords in the title (and add specific papers)
     ############################################
 
-    # check if a paper is a visusalization paper
-    markVisPapersByKeywords(paperList)
-
-    # count all the visualization papers maked by keyword
-    visCounter = 0
-    for paper in paperList:
-        if ("type" in paper.keys()) and (paper["type"] == "keyword"): visCounter += 1
-
     # print visualization papers maked by keyword
-    print("\nadditional papers on visualization topics identified by keyword: " + str(visCounter) + " papers", file=f)
-    paperNumbersOutputString += "\\newcommand{\\GrsiVisByKeywordPapersCount}{" + str(visCounter) + "}\n"
-    visByKeywordCount = visCounter
-    for paper in paperList:
-        if ("type" in paper.keys()) and (paper["type"] == "keyword"):
-            print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
-            paperKeywordPapersOutputString += "\\item \\href{https://doi.org/" + paper["doi"] + "}{doi: " + paper["doi"] + "}\n"
-
-    # count the visualization papers maked manually
-    visCounter = 0
-    for paper in paperList:
-        if ("type" in paper.keys()) and (paper["type"] == "manual"): visCounter += 1
+    visByKeywordCount = len(visClassification["keyword"])
+    print("\nadditional papers on visualization topics identified by keyword: " + str(visByKeywordCount) + " papers", file=f)
+    paperNumbersOutputString += "\\newcommand{\\GrsiVisByKeywordPapersCount}{" + str(visByKeywordCount) + "}\n"
+    for paper in visClassification["keyword"]:
+        print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
+        paperKeywordPapersOutputString += "\\item \\href{https://doi.org/" + paper["doi"] + "}{doi: " + paper["doi"] + "}\n"
 
     # print visualization papers maked manually
-    print("\nadditional manually selected papers that could not be identified by keyword: " + str(visCounter) + " papers", file=f)
-    paperNumbersOutputString += "\\newcommand{\\GrsiVisManuallyMarkedPapersCount}{" + str(visCounter) + "}\n"
-    paperNumbersOutputString += "\\newcommand{\\GrsiVisKeywordPlusManualPapersCount}{" + str(visCounter + visByKeywordCount) + "}\n"
-    visKeywordPlusManualPapersCount = visCounter + visByKeywordCount
-    for paper in paperList:
-        if ("type" in paper.keys()) and (paper["type"] == "manual"): print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
-
-    # count the visualization papers
-    visCounter = 0
-    for paper in paperList:
-        if (paper["is_vis"]): visCounter += 1
+    visManuallyMarkedCount = len(visClassification["manual"])
+    print("\nadditional manually selected papers that could not be identified by keyword: " + str(visManuallyMarkedCount) + " papers", file=f)
+    paperNumbersOutputString += "\\newcommand{\\GrsiVisManuallyMarkedPapersCount}{" + str(visManuallyMarkedCount) + "}\n"
+    paperNumbersOutputString += "\\newcommand{\\GrsiVisKeywordPlusManualPapersCount}{" + str(visManuallyMarkedCount + visByKeywordCount) + "}\n"
+    visKeywordPlusManualPapersCount = visManuallyMarkedCount + visByKeywordCount
+    for paper in visClassification["manual"]: print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
 
     # print visualization papers
+    visCounter = len(visClassification["vis"])
     print("\npapers on visualization topics (all of the above): " + str(visCounter) + " papers (may be larger than the sum of the above since we manually re-classified some of the papers to come from more recent VIS or to be presented there in the future)", file=f)
-    for paper in paperList:
-        if (paper["is_vis"]): print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
+    for paper in visClassification["vis"]: print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
 
     print("\n=========================================", file=f)
     print("Papers apparently not about visualization", file=f)
     print("=========================================", file=f)
 
+    # sort the remaining papers by their publisher in one pass over them
+    notVisTvcgPapers = []
+    notVisCgfPapers = []
+    notVisCagPapers = []
+    notVisTogPapers = []
+    notVisOtherPapers = []
+    for paper in visClassification["not_vis"]:
+        if ("tvcg." in paper["doi"]): notVisTvcgPapers.append(paper)
+        if ("cgf." in paper["doi"]): notVisCgfPapers.append(paper)
+        if ("j.cag." in paper["doi"]): notVisCagPapers.append(paper)
+        if ("10.1145/" in paper["doi"]): notVisTogPapers.append(paper)
+        if not ("10.1145/" in paper["doi"]) and not ("j.cag." in paper["doi"]) and not ("cgf." in paper["doi"]) and not ("tvcg." in paper["doi"]): notVisOtherPapers.append(paper)
+
     # print TVCG papers that are not in the list of visualization papers yet
     print("\nremaining TVCG papers *apparently* not on visualization topics (but some may be presented at IEEE VIS in the future)", file=f)
-    for paper in paperList:
-        if ( (paper["is_vis"] == False) and ("tvcg." in paper["doi"]) ): print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
+    for paper in notVisTvcgPapers: print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
 
     # print CGF papers that are not in the list of visualization papers yet
     print("\nremaining CGF papers *apparently* not on visualization topics", file=f)
-    for paper in paperList:
-        if ( (paper["is_vis"] == False) and ("cgf." in paper["doi"]) ): print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
+    for paper in notVisCgfPapers: print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
 
     # print C&G papers that are not in the list of visualization papers yet
     print("\nremaining C&G papers *apparently* not on visualization topics", file=f)
-    for paper in paperList:
-        if ( (paper["is_vis"] == False) and ("j.cag." in paper["doi"]) ): print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
+    for paper in notVisCagPapers: print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
 
     # print TOG papers that are not in the list of visualization papers yet
     print("\nremaining TOG journal or SIGGRAPH (Asia) conference papers *apparently* not on visualization topics", file=f)
-    for paper in paperList:
-        if ( (paper["is_vis"] == False) and ("10.1145/" in paper["doi"]) ): print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
+    for paper in notVisTogPapers: print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
 
     # print all othger papers that are not in the list of visualization papers yet
     print("\nremaining papers *apparently* not on visualization topics", file=f)
-    for paper in paperList:
-        if ( (paper["is_vis"] == False) and not ("10.1145/" in paper["doi"]) and not ("j.cag." in paper["doi"]) and not ("cgf." in paper["doi"]) and not ("tvcg." in paper["doi"]) ): print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
+    for paper in notVisOtherPapers: print("https://doi.org/" + str(paper["doi"].ljust(doiPaddingCount) + " -- " + str(paper["title"])), file=f)
 
     f.close()
 
@@ -1399,10 +1114,15 @@ with open(formatted_date + " current-list.txt", "w", encoding='utf-8') as f:
     f.close()
 
 unmarkPapers(paperList, ["counter"], [None]) # remove the counters for writing
-with open(formatted_date + " grsi paper data.json", "w", encoding='utf-8') as f:
-    json.dump(paperList, f, indent=4)
+storeGrsiSnapshot(grsiHistory, formatted_date, paperList)
+grsiPaperDataText = json.dumps(paperList, indent=4) # this state of the data is what we finally save in the output directory
 with open(dataOutputSubdirectury + "grsi_metadata.json", "w", encoding='utf-8') as f:
     json.dump(grsiMetaData, f, indent=4)
+# copy the final GRSI data file to the respective output directory
+with open(dataOutputSubdirectury + "grsi_paper_data.json", "w", encoding='utf-8') as f:
+    f.write(grsiPaperDataText)
+
+if lastStage == "classify": sys.exit(0)
 
 #######################################################
 #######################################################
@@ -1411,25 +1131,70 @@ with open(dataOutputSubdirectury + "grsi_metadata.json", "w", encoding='utf-8')
 #######################################################
     
 # first check if we have all extra data updated, and if not try to update it
-with open(dataOutputSubdirectury + "extended_paper_data.json", "r", encoding='utf-8') as f:
-    paperListExtended = json.load(f)
-    f.close()
+if useExtendedPaperStore:
+    extendedPaperStore = openExtendedPaperStore(extendedPaperStoreFile)
+    if syncExtendedPaperStore(extendedPaperStore, dataOutputSubdirectury + "extended_paper_data.json"): print("Imported " + dataOutputSubdirectury + "extended_paper_data.json into " + extendedPaperStoreFile)
+    paperListExtended = loadExtendedPaperData(extendedPaperStore)
+else:
+    with open(dataOutputSubdirectury + "extended_paper_data.json", "r", encoding='utf-8') as f:
+        paperListExtended = json.load(f)
+        f.close()
+
+# how the journal is written back into the JSON file (by default directly from paperListExtended)
+writeExtendedPaperData = (lambda jsonFileName: exportExtendedPaperData(extendedPaperStore, jsonFileName)) if useExtendedPaperStore else None
+
+# entries that we got in an earlier run that stopped before it saved them
+replayedJournalEntries = replayExtendedPaperJournal(extendedPaperJournalFile, paperListExtended)
+if len(replayedJournalEntries) > 0:
+    print("Recovered " + str(len(replayedJournalEntries)) + " entries of the extended paper data from " + extendedPaperJournalFile)
+    if useExtendedPaperStore:
+        for doi, entry in replayedJournalEntries: upsertExtendedPaper(extendedPaperStore, doi, entry)
+    compactExtendedPaperJournal(extendedPaperJournalFile, dataOutputSubdirectury + "extended_paper_data.json", paperListExtended, writeExtendedPaperData)
 
-# each of the following defines a function to query the data from the publisher's DL APIs, and then return a data item
-import query_crossref
-import query_acm
-import query_elsevier
-import query_ieee
 # if True: # this line would only be for testing/debugging
-if updatingGrsiDataFromWeb: # only then do we need to check (i.e., first run of the day, when we updated the data from the Web)
+if updatingGrsiDataFromWeb or rederiveExtendedDataFromCache or doCheckExtendedDataAlways: # only then do we need to check (i.e., first run of the day, when we updated the data from the Web)
+    # each of the following defines a function to query the data from the publisher's DL APIs, and then return a data item
+    import query_crossref
+    import query_acm
+    import query_elsevier
+    import query_ieee
+    from query_executor import fetchEntriesConcurrently
+    from response_cache import createResponseCache, hasCachedResponse, expireCachedResponse, saveResponseCacheIndex
+
+    # the raw DL responses we already have; when re-deriving the data we only use those
+    responseCache = createResponseCache(responseCacheSubdirectory, responseCacheTtlDays * 24 * 60 * 60, responseCacheMaxEntries, cacheOnly = rederiveExtendedDataFromCache)
+
     # get the needed API keys
-    with open("api-keys.json", "r", encoding='utf-8') as f:
-        config = json.load(f)
-        f.close()
-    apiKeyIeee = config['apikey-ieee']
-    apiKeyElsevier = config['apikey-elsevier']
+    apiKeyIeee = ''
+    apiKeyElsevier = ''
+    if not rederiveExtendedDataFromCache:
+        with open("api-keys.json", "r", encoding='utf-8') as f:
+            config = json.load(f)
+            f.close()
+        apiKeyIeee = config['apikey-ieee']
+        apiKeyElsevier = config['apikey-elsevier']
+
+    # which DL API (and thus which rate limit) we use for which publisher
+    def publisherForDoi(doi):
+        if ("10.1145/" in doi): # ACM
+            if (downloadAcmFromCrossref): return 'crossref'
+            else: return 'acm'
+        if ("10.1109/" in doi): return 'ieee' # IEEE
+        if ("10.1016/" in doi): return 'elsevier' # Elsevier
+        if ("10.1111/" in doi): return 'crossref' # Wiley (Crossref?)
+        return None
+    fetchFunctions = {
+        'acm': lambda doi: query_acm.generateEntryForDoi(doi, '', responseCache),
+        'ieee': lambda doi: query_ieee.generateEntryForDoi(doi, apiKeyIeee, responseCache),
+        'elsevier': lambda doi: query_elsevier.generateEntryForDoi(doi, apiKeyElsevier, responseCache),
+    }
 
+    # first find out for which papers we need to get or update the data
+    if useExtendedPaperStore: incompleteDois = set(findIncompleteDois(extendedPaperStore))
+    else: incompleteDois = set([doi for doi in paperListExtended.keys() if not isExtendedPaperComplete(paperListExtended[doi])])
     extraDataWasUpdated = False
+    doisToUpdate = []
+    oldEntries = {}
     for entry in paperList:
         doi = entry["doi"].lower()
 
@@ -1439,375 +1204,248 @@ if updatingGrsiDataFromWeb: # only then do we need to check (i.e., first run of
         if not (doi in paperListExtended.keys()):
             # print("extra data not yet collected for doi " + doi)
             needToUpdateData = True
+        elif rederiveExtendedDataFromCache:
+            # re-create all entries for which we have a cached response, but keep what we added manually
+            needToUpdateData = (publisherForDoi(doi) != None) and hasCachedResponse(responseCache, publisherForDoi(doi), doi)
+            oldEntry = paperListExtended[doi]
         else:
             # check if the data is complete
-            if (paperListExtended[doi]['volume'] == '') or (paperListExtended[doi]['pages'] == '') or (paperListExtended[doi]['number_of_pages'] < 1 ) or (paperListExtended[doi]['abstract'] == ''):
+            if doi in incompleteDois:
                 # print("!! extra data not yet complete for doi " + doi)
                 needToUpdateData = True
                 oldEntry = paperListExtended[doi]
+                # the cached response gave us this incomplete data, so we need a new one
+                if publisherForDoi(doi) != None: expireCachedResponse(responseCache, publisherForDoi(doi), doi)
         
-        if (needToUpdateData) and (doi[0:3] == "10."):
+        if (needToUpdateData) and (doi[0:3] == "10.") and not (doi in oldEntries.keys()):
             extraDataWasUpdated = True
             print("We will now try to get or update the extra data for doi " + doi)
-            
-            newEntry = {}
-
-            # ACM
-            if ("10.1145/" in doi):
-                # print("This is an ACM paper, so we use the ACM API")
-                if (downloadAcmFromCrossref):
-                    newEntry = query_crossref.generateEntryForDoi(doi)
-                else:
-                    newEntry = query_acm.generateEntryForDoi(doi)
-            # IEEE
-            if ("10.1109/" in doi):
-                # print("This is an IEEE paper, so we use the IEEE API")
-                newEntry = query_ieee.generateEntryForDoi(doi, apiKeyIeee)
-            # Elsevier
-            if ("10.1016/" in doi):
-                # print("This is an Elsevier paper, so we use the Elsevier API")
-                newEntry = query_elsevier.generateEntryForDoi(doi, apiKeyElsevier)
-            # Wiley (Crossref?)
-            if ("10.1111/" in doi):
-                # print("This is a Wiley paper, so we use the Crossref API")
-                newEntry = query_crossref.generateEntryForDoi(doi)
-                
-            if (not bool(newEntry)): print("WARNING: No new data generated when looking up paper (doi: " + doi + "). Please check.")
-            else: 
-                if bool(oldEntry): # if we had old data already, ensure that we are not loosing any data we had previously (maybe manually) collected
-                    for dataItem in oldEntry.keys(): # all genral items
-                        if not(dataItem in newEntry.keys()):
-                            newEntry[dataItem] = oldEntry[dataItem]
-                    for authorOld, authorNew in zip(oldEntry["authors"],newEntry["authors"]): # the list of all authors
-                        for dataItem in authorOld.keys(): # all author items
-                            if not(dataItem in authorNew.keys()):
-                                authorNew[dataItem] = authorOld[dataItem]
-                    
-                paperListExtended[doi] = newEntry # add or update the data for the doi
-                if not("countries" in newEntry.keys()):
-                    print("Remember to add the country information to the entry " + doi + ".")
-
-            # for all of them, wait for a bit to avoid triggering any issues with the APIs
-            time.sleep(0.5)
-
-    # save the appended database
+            doisToUpdate.append(doi)
+            oldEntries[doi] = oldEntry
+
+    # we merge each new entry into our database as soon as we have it, and save it in the journal right away
+    journaledDois = []
+    def mergeNewEntry(doi, newEntry):
+        if (not bool(newEntry)): return
+        oldEntry = oldEntries[doi]
+        if bool(oldEntry): # if we had old data already, ensure that we are not loosing any data we had previously (maybe manually) collected
+            for dataItem in oldEntry.keys(): # all genral items
+                if not(dataItem in newEntry.keys()):
+                    newEntry[dataItem] = oldEntry[dataItem]
+            for authorOld, authorNew in zip(oldEntry["authors"],newEntry["authors"]): # the list of all authors
+                for dataItem in authorOld.keys(): # all author items
+                    if not(dataItem in authorNew.keys()):
+                        authorNew[dataItem] = authorOld[dataItem]
+
+        paperListExtended[doi] = newEntry # add or update the data for the doi
+        if useExtendedPaperStore: upsertExtendedPaper(extendedPaperStore, doi, newEntry)
+        appendExtendedPaperJournal(extendedPaperJournalFile, doi, newEntry)
+        journaledDois.append(doi)
+        if len(journaledDois) % extendedPaperJournalCompactionSize == 0:
+            compactExtendedPaperJournal(extendedPaperJournalFile, dataOutputSubdirectury + "extended_paper_data.json", paperListExtended, writeExtendedPaperData)
+
+    # then look them up: Crossref gives us many dois with one request, and the others we look up concurrently,
+    # each publisher with its own rate limit (instead of waiting for a bit after every paper)
+    # (the cached responses do not count against the rate limits)
+    # the cache index is only saved once at the end, but also if a lookup fails, so that we keep the responses we already got
+    try:
+        newEntries = query_crossref.generateEntriesForDois([doi for doi in doisToUpdate if publisherForDoi(doi) == 'crossref'], responseCache)
+        for doi in newEntries.keys(): mergeNewEntry(doi, newEntries[doi])
+        query_ieee.prefetchResponsesForDois([doi for doi in doisToUpdate if publisherForDoi(doi) == 'ieee'], apiKeyIeee, responseCache) # whole TVCG issues at once (IEEE only allows 200 calls per day)
+        jobs = [(doi, publisherForDoi(doi)) for doi in doisToUpdate if not (publisherForDoi(doi) in [None, 'crossref'])]
+        newEntries.update(fetchEntriesConcurrently(jobs, fetchFunctions, isCachedFunction = lambda doi, publisher: hasCachedResponse(responseCache, publisher, doi), onEntryFunction = mergeNewEntry))
+    finally:
+        saveResponseCacheIndex(responseCache)
+
+    # and finally report on the new data, in the order of the papers
+    for doi in doisToUpdate:
+        newEntry = newEntries.get(doi, {})
+        if (not bool(newEntry)): print("WARNING: No new data generated when looking up paper (doi: " + doi + "). Please check.")
+        elif not("countries" in newEntry.keys()):
+            print("Remember to add the country information to the entry " + doi + ".")
+
+    # save the appended database (and start a new journal)
     if extraDataWasUpdated:
-        with open(dataOutputSubdirectury + "extended_paper_data.json", "w", encoding='utf-8') as f:
-            json.dump(paperListExtended, f, indent=4)
-            f.close()
+        compactExtendedPaperJournal(extendedPaperJournalFile, dataOutputSubdirectury + "extended_paper_data.json", paperListExtended, writeExtendedPaperData)
 
 differenceOfPaperEntries = len(paperList) - len(paperListExtended)
 paperNumbersOutputString += "\\newcommand{\\GrsiDifferenceInPaperDatabases}{" + str(differenceOfPaperEntries) + "}\n"
 
-#######################################################
-#######################################################
-# visualization/plots
-#######################################################
-#######################################################
-if exportVisualizations:
-    print("Now for the data analysis and visualization ...")
-
-    # then extract the data we want to visualize, first overall
-    journalsAndYears = {'IEEE TVCG': {}, 'ACM ToG': {}, 'Wiley CGF': {}, 'Elsevier C&G': {}, 'Elsevier CAD': {}, 'SIGGRAPH conf.': {}, 'Software Impacts': {}} # with pre-sorting
-    earliestYear = grsiMetaData["data_download_year"]
-    latestYear = grsiMetaData["data_download_year"]
-    for paper in paperList:
-        doi = paper["doi"]
-
-        if doi in paperListExtended.keys():
-            paperExtended = paperListExtended[doi]
-            publicationYear = paperExtended["publication_year"]
-            publicationVenue = filterAndShortenJournalNames(paperExtended["journal"])
-            if not (publicationVenue in journalsAndYears.keys()): journalsAndYears[publicationVenue] = {}
-
-            if publicationYear in journalsAndYears[publicationVenue].keys(): journalsAndYears[publicationVenue][publicationYear] = journalsAndYears[publicationVenue][publicationYear] + 1
-            else: journalsAndYears[publicationVenue][publicationYear] = 1
-
-            if publicationYear < earliestYear: earliestYear = publicationYear
-            if publicationYear > latestYear: # ignore the fake in-press year (grsiMetaData["data_download_year"] + 1000)
-                if publicationYear != grsiMetaData["data_download_year"] + 1000: latestYear = publicationYear
-
-    order = 0
-    dataToPlot = []
-    for publicationVenue in journalsAndYears.keys():
-        # sort the dictionary
-        journalsAndYears[publicationVenue] = dict(sorted(journalsAndYears[publicationVenue].items()))
-        order += 1
-
-        # collect all the data for visualization
-        listOfYears = list(range(earliestYear, latestYear + 1)) # all the real years, including the latest one yet without the in-press papers
-        listOfYears.append(grsiMetaData["data_download_year"] + 1000) # and now do not forget our fake "in-press" year
-        for year in listOfYears:
-            dataItem = {}
-            dataItem["journal"] = publicationVenue
-            dataItem["order"] = order
-            dataItem["year"] = str(year)
-            dataItem["count"] = 0 # as a fall-back, in case there were no publications from this venue in that year
-            if year == grsiMetaData["data_download_year"] + 1000:
-                dataItem["year"] = "in press"
-            if year in journalsAndYears[publicationVenue].keys(): dataItem["count"] = journalsAndYears[publicationVenue][year]
-            dataToPlot.append(dataItem)
-
-    plotTimeSeriesPublicationData(dataToPlot, baseName = graphOutputSubdirectury + "replicability_all-by-journal", dataField = "journal", cTitleSpecifier = "journal or conference", yTitleSpecifier = "published journal papers w/ GRS", visPadding = visPadding, legendColumns = 5, chartsToPlot = ["all"], addTicksBetweenYears = True, addNoteBelowLegend = True, noteXOffset = 33)
-
-    # now let's do that again and overwrite the line graph file with the nan hack (see below; which would fail the aggregated plots)
-    order = 0
-    dataToPlot = []
-    for publicationVenue in journalsAndYears.keys():
-        # sort the dictionary
-        journalsAndYears[publicationVenue] = dict(sorted(journalsAndYears[publicationVenue].items()))
-        order += 1
-
-        # collect all the data for visualization
-        listOfYears = list(range(earliestYear, latestYear + 1)) # all the real years, including the latest one yet without the in-press papers
-        listOfYears.append(grsiMetaData["data_download_year"] + 1000) # and now do not forget our fake "in-press" year
-        for year in listOfYears:
-            dataItem = {}
-            dataItem["journal"] = publicationVenue
-            dataItem["order"] = order
-            dataItem["year"] = str(year)
-            dataItem["count"] = 0 # as a fall-back, in case there were no publications from this venue in that year
-            if year == grsiMetaData["data_download_year"] + 1000:
-                dataItem["year"] = "in press"
-                dataItem["count"] = nan # only for in-press journals do we not want a value plotted if it is 0
-            if year in journalsAndYears[publicationVenue].keys(): dataItem["count"] = journalsAndYears[publicationVenue][year]
-            dataToPlot.append(dataItem)
-
-    plotTimeSeriesPublicationData(dataToPlot, baseName = graphOutputSubdirectury + "replicability_all-by-journal", dataField = "journal", cTitleSpecifier = "journal or conference", yTitleSpecifier = "published journal papers w/ GRS", visPadding = visPadding, legendColumns = 5, chartsToPlot = ["linegraph"], addTicksBetweenYears = True, addNoteBelowLegend = True, noteXOffset = 33)
-
-    # see how visualization contribution changes over the years    
-    visualizationAndYears = {'papers on visualization topics': {}, 'papers not on visualization topics': {}} # with pre-sorting
-    dataToPlot = []
-    earliestYear = grsiMetaData["data_download_year"]
-    latestYear = grsiMetaData["data_download_year"]
-    for paper in paperList:
-        doi = paper["doi"]
-        visType = list(visualizationAndYears.keys())[1]
-        if paper["is_vis"]: visType = list(visualizationAndYears.keys())[0]
-
-        if doi in paperListExtended.keys():
-            paperExtended = paperListExtended[doi]
-            publicationYear = paperExtended["publication_year"]
-            if not (visType in visualizationAndYears.keys()): visualizationAndYears[visType] = {}
-
-            if publicationYear in visualizationAndYears[visType].keys(): visualizationAndYears[visType][publicationYear] = visualizationAndYears[visType][publicationYear] + 1
-            else: visualizationAndYears[visType][publicationYear] = 1
-
-            if publicationYear < earliestYear: earliestYear = publicationYear
-            if publicationYear > latestYear: # ignore the fake in-press year (grsiMetaData["data_download_year"] + 1000)
-                if publicationYear != grsiMetaData["data_download_year"] + 1000: latestYear = publicationYear
-
-    order = 0
-    for visType in visualizationAndYears.keys():
-        # sort the dictionary
-        visualizationAndYears[visType] = dict(sorted(visualizationAndYears[visType].items()))
-        order += 1
-
-        # collect all the data for visualization
-        listOfYears = list(range(earliestYear, latestYear + 1)) # all the real years, including the latest one yet without the in-press papers
-        listOfYears.append(grsiMetaData["data_download_year"] + 1000) # and now do not forget our fake "in-press" year
-        for year in listOfYears:
-            dataItem = {}
-            dataItem["is_vis"] = visType
-            dataItem["order"] = order
-            dataItem["year"] = str(year)
-            if year == grsiMetaData["data_download_year"] + 1000: dataItem["year"] = "in press"
-            dataItem["count"] = 0 # as a fall-back, in case there were no publications from this venue in that year
-            if year in visualizationAndYears[visType].keys(): dataItem["count"] = visualizationAndYears[visType][year]
-            dataToPlot.append(dataItem)
-
-    plotTimeSeriesPublicationData(dataToPlot, baseName = graphOutputSubdirectury + "replicability_all-by-visualization", dataField = "is_vis", cTitleSpecifier = "paper classification (by presentation venue and keywords/manual)", yTitleSpecifier = "published journal papers w/ GRS", visPadding = visPadding)
-
-    # now visualize visualization, first by journal
-    visJournalListSorted = ['IEEE TVCG', 'ACM ToG', 'Wiley CGF', 'Elsevier C&G'] # with pre-sorting
-    journalsAndYears = {}
-    for venue in visJournalListSorted: # base the dictionary this time on the list (easier in case we later need to add another journal to the list)
-        journalsAndYears[venue] = {}
-    earliestYear = grsiMetaData["data_download_year"]
-    latestYear = grsiMetaData["data_download_year"]
-    for paper in paperList:
-        doi = paper["doi"]
-
-        if (doi in paperListExtended.keys()) and (paper["is_vis"]):
-            paperExtended = paperListExtended[doi]
-            publicationYear = paperExtended["publication_year"]
-            publicationVenue = filterAndShortenJournalNames(paperExtended["journal"])
-            if not (publicationVenue in journalsAndYears.keys()): journalsAndYears[publicationVenue] = {}
-
-            if publicationYear in journalsAndYears[publicationVenue].keys(): journalsAndYears[publicationVenue][publicationYear] = journalsAndYears[publicationVenue][publicationYear] + 1
-            else: journalsAndYears[publicationVenue][publicationYear] = 1
-
-            if publicationYear < earliestYear: earliestYear = publicationYear
-            if publicationYear > latestYear: # ignore the fake in-press year (grsiMetaData["data_download_year"] + 1000)
-                if publicationYear != grsiMetaData["data_download_year"] + 1000: latestYear = publicationYear
-
-    order = 0
-    dataToPlot = []
-    for publicationVenue in journalsAndYears.keys():
-        # sort the dictionary
-        journalsAndYears[publicationVenue] = dict(sorted(journalsAndYears[publicationVenue].items()))
-        order += 1
-
-        # collect all the data for visualization
-        listOfYears = list(range(earliestYear, latestYear + 1)) # all the real years, including the latest one yet without the in-press papers
-        listOfYears.append(grsiMetaData["data_download_year"] + 1000) # and now do not forget our fake "in-press" year
-        for year in listOfYears:
-            dataItem = {}
-            dataItem["journal"] = publicationVenue
-            dataItem["order"] = order
-            dataItem["year"] = str(year)
-            dataItem["count"] = 0 # as a fall-back, in case there were no publications from this venue in that year
-            if year == grsiMetaData["data_download_year"] + 1000:
-                dataItem["year"] = "in press"
-            if year in journalsAndYears[publicationVenue].keys(): dataItem["count"] = journalsAndYears[publicationVenue][year]
-            dataToPlot.append(dataItem)
+if lastStage == "enrich": sys.exit(0)
 
-    plotTimeSeriesPublicationData(dataToPlot, baseName = graphOutputSubdirectury + "replicability_visualization-by-journal", dataField = "journal", cTitleSpecifier = "journal", yTitleSpecifier = "published visualization journal papers w/ GRS", visPadding = visPadding, chartsToPlot = ["all"], addTicksBetweenYears = True, addNoteBelowLegend = True, noteXOffset = 33)
+if doLongitudinalAnalysis:
+    # how the numbers developed over all the days for which we have the GRSI data
+    print("Replaying the GRSI data history for the longitudinal analysis ...")
+    def venueOfPaper(paper):
+        if paper["doi"] in paperListExtended.keys(): return filterAndShortenJournalNames(paperListExtended[paper["doi"]]["journal"])
+        return paper["journal"]
+    longitudinalMetrics = computeLongitudinalMetrics(grsiHistory, paperListExtended, venueOfPaper)
+    writeLongitudinalMetrics(longitudinalMetrics, dataOutputSubdirectury + "grsi_history_metrics.csv")
 
-    # now let's do that again and overwrite the line graph file with the nan hack (see below; which would fail the aggregated plots)
-    order = 0
-    dataToPlot = []
-    for publicationVenue in journalsAndYears.keys():
-        # sort the dictionary
-        journalsAndYears[publicationVenue] = dict(sorted(journalsAndYears[publicationVenue].items()))
-        order += 1
+    if exportVisualizations:
+        import pandas as pd
+        import altair as alt
+        dataToPlot = []
+        for row in longitudinalMetrics:
+            for column, name in [("papers", "all papers"), ("vis_papers", "visualization papers"), ("in_press", "papers in press")]:
+                dataToPlot.append({"date": row["date"], "series": name, "count": row[column]})
+        chart = alt.Chart(pd.DataFrame(dataToPlot)).mark_line().encode(
+            x = alt.X('date:T', title=None),
+            y = alt.Y('count:Q', title='papers w/ GRS'),
+            color = alt.Color('series:N', title=None, sort=None)
+        ).configure_view(
+            strokeOpacity=0 # this removes the gray box around the plot
+        ).properties(
+            padding={"left": visPadding, "right": visPadding, "bottom": visPadding+visPaddingBottomExtra, "top": visPadding},
+            width=500,
+            height=300
+        ).configure_legend(orient='bottom', direction='horizontal', titleLimit=0, labelLimit=myLabelLimit)
+        queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability_history-totals-linegraph.pdf')
 
-        # collect all the data for visualization
-        listOfYears = list(range(earliestYear, latestYear + 1)) # all the real years, including the latest one yet without the in-press papers
-        listOfYears.append(grsiMetaData["data_download_year"] + 1000) # and now do not forget our fake "in-press" year
-        for year in listOfYears:
-            dataItem = {}
-            dataItem["journal"] = publicationVenue
-            dataItem["order"] = order
-            dataItem["year"] = str(year)
-            dataItem["count"] = 0 # as a fall-back, in case there were no publications from this venue in that year
-            if year == grsiMetaData["data_download_year"] + 1000:
-                dataItem["year"] = "in press"
-                dataItem["count"] = nan # only for in-press journals do we not want a value plotted if it is 0
-            if year in journalsAndYears[publicationVenue].keys(): dataItem["count"] = journalsAndYears[publicationVenue][year]
-            dataToPlot.append(dataItem)
+        dataToPlot = []
+        for row in longitudinalMetrics:
+            for column in row.keys():
+                if column.startswith("venue:"): dataToPlot.append({"date": row["date"], "venue": column[len("venue:"):], "count": row[column]})
+        chart = alt.Chart(pd.DataFrame(dataToPlot)).mark_line().encode(
+            x = alt.X('date:T', title=None),
+            y = alt.Y('count:Q', title='papers w/ GRS'),
+            color = alt.Color('venue:N', title="journal or conference", sort=None)
+        ).configure_view(
+            strokeOpacity=0 # this removes the gray box around the plot
+        ).properties(
+            padding={"left": visPadding, "right": visPadding, "bottom": visPadding+visPaddingBottomExtra, "top": visPadding},
+            width=500,
+            height=300
+        ).configure_legend(orient='bottom', direction='horizontal', columns=4, titleLimit=0, labelLimit=myLabelLimit)
+        queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability_history-by-venue-linegraph.pdf')
 
-    plotTimeSeriesPublicationData(dataToPlot, baseName = graphOutputSubdirectury + "replicability_visualization-by-journal", dataField = "journal", cTitleSpecifier = "journal", yTitleSpecifier = "published visualization journal papers w/ GRS", visPadding = visPadding, chartsToPlot = ["linegraph"], addTicksBetweenYears = True, addNoteBelowLegend = True, noteXOffset = 33)
+#######################################################
+#######################################################
+# the numbers for the paper that we only compute once someone needs them,
+# i.e., the plots below (which use the same data) or the export of the
+# numbers (which, in the numbers-only mode, only asks for the macros that
+# the paper uses)
+#######################################################
+#######################################################
+paperNumbers = createPaperNumbers()
+visJournalListSorted = ['IEEE TVCG', 'ACM ToG', 'Wiley CGF', 'Elsevier C&G'] # with pre-sorting
 
+def producePaperTable():
+    from paper_table import buildPaperTable
     # merge the keywords and manual
     for paper in paperList:
         if ("type" in paper.keys()) and ((paper["type"] == "manual") or (paper["type"] == "keyword")):
             paper["type"] = "keyword/manual"
 
-    # the same visualizations again by journal, but split into papers presented at vis venues and others only classified by keyword/manually
-    separationString = ': '
-    visVenueName = 'vis classification by presentation venue'
-    keywordName = 'vis classification by keyword/manual'
-    journalsAndYears = {}
-    for venue in visJournalListSorted: # base the dictionary this time on the list (easier in case we later need to add another journal to the list)
-        journalsAndYears[venue + separationString + visVenueName] = {}
-        journalsAndYears[venue + separationString + keywordName] = {}
-    earliestYear = grsiMetaData["data_download_year"]
-    latestYear = grsiMetaData["data_download_year"]
+    # one table of the papers with everything the plots group by; the year x category series then all come from yearCategorySeries
+    # (publication years up to the download year, plus the fake in-press year grsiMetaData["data_download_year"] + 1000 at the end)
+    return { "table": buildPaperTable(paperList, paperListExtended, filterAndShortenJournalNames, grsiMetaData["data_download_year"], grsiMetaData["data_download_year"] + 1000) }
+registerPaperNumbers(paperNumbers, "paper_table", producePaperTable)
+
+def produceVisPapersPerJournalAndType():
+    # the visualization papers by journal (aggregated, without years), split into papers presented at vis venues and others only classified by keyword/manually
+    # (counted directly from the papers, so that we do not need the paper table and thus pandas for the numbers)
+    result = { "separation": ': ', "presentation_name": 'vis classification by presentation venue', "keyword_name": 'vis classification by keyword/manual' }
+    result["journal_plus_type_list"] = []
+    for venue in visJournalListSorted: # base the list on the journal list (easier in case we later need to add another journal to the list)
+        result["journal_plus_type_list"].append(venue + result["separation"] + result["presentation_name"])
+        result["journal_plus_type_list"].append(venue + result["separation"] + result["keyword_name"])
+    journalsOnly = { journalPlusType: 0 for journalPlusType in result["journal_plus_type_list"] } # the others in the order in which they appear
     for paper in paperList:
-        doi = paper["doi"]
+        if paper["is_vis"] and (paper["doi"] in paperListExtended.keys()):
+            typeName = result["keyword_name"] if (paper.get("type", None) in ["keyword", "manual", "keyword/manual"]) else result["presentation_name"]
+            journalPlusType = filterAndShortenJournalNames(paperListExtended[paper["doi"]]["journal"]) + result["separation"] + typeName
+            journalsOnly[journalPlusType] = journalsOnly.get(journalPlusType, 0) + 1
+    result["journals_only"] = journalsOnly
 
-        if (doi in paperListExtended.keys()) and (paper["is_vis"]):
-            paperExtended = paperListExtended[doi]
-            publicationYear = paperExtended["publication_year"]
-            if paper["type"] == "keyword/manual":
-                publicationVenue = filterAndShortenJournalNames(paperExtended["journal"]) + separationString + keywordName
-            else:
-                publicationVenue = filterAndShortenJournalNames(paperExtended["journal"]) + separationString + visVenueName
-            if not (publicationVenue in journalsAndYears.keys()): journalsAndYears[publicationVenue] = {}
+    result["macros"] = []
+    for venue in visJournalListSorted:
+        macroName = "GrsiVisPapersIn" + venue.replace(" ", "").replace("&", "a")
+        presentationCount = journalsOnly[venue + result["separation"] + result["presentation_name"]]
+        keywordCount = journalsOnly[venue + result["separation"] + result["keyword_name"]]
+        result["macros"].append((macroName + "Total", presentationCount + keywordCount))
+        result["macros"].append((macroName + "Presentation", presentationCount))
+        result["macros"].append((macroName + "KeywordManual", keywordCount))
+        result["macros"].append((macroName + "PercentagePresentation", round(float(presentationCount)/float(presentationCount + keywordCount) * 100.0, 1)))
+    return result
+registerPaperNumbers(paperNumbers, "vis_papers_per_journal_and_type", produceVisPapersPerJournalAndType, [], [r"GrsiVisPapersIn\w+"])
+
+def produceCountryNames():
+    countryNames, countryNamesSentence = loadCountryNames('input/country-names.csv')
+    return { "names": countryNames, "sentence_names": countryNamesSentence }
+registerPaperNumbers(paperNumbers, "country_names", produceCountryNames)
+
+def registerCountryPaperNumbers(name, macroPrefix, authorListsFunction, seniorOnly):
+    # the country contributions for one of the pie charts, and the ranking of the countries for the paper (e.g., \GrsiCountryPieChartVisNoOneName)
+    def produceCountryContributions(countryNamesResult):
+        countryContributions = computeCountryContributions(authorListsFunction(), seniorOnly)
+        countryContributions["macros"] = []
+        for order, country in enumerate(countryContributions["proportional"].keys()):
+            countryContributions["macros"].append((macroPrefix + digitToNameSequence(order + 1) + "Name", countryNamesResult["sentence_names"][country]))
+            countryContributions["macros"].append((macroPrefix + digitToNameSequence(order + 1) + "Percentage", round(100.0 * countryContributions["proportional"][country]/countryContributions["papers_with_country_information"], 1)))
+        return countryContributions
+    registerPaperNumbers(paperNumbers, name, produceCountryContributions, ["country_names"], [macroPrefix + r"\w+"])
+
+allAuthorLists = lambda: [paperListExtended[paperIndex]["authors"] for paperIndex in paperListExtended.keys()]
+visAuthorLists = lambda: [paperListExtended[paper["doi"]]["authors"] for paper in paperList if paper['is_vis'] and (paper["doi"] in paperListExtended.keys())]
+registerCountryPaperNumbers("countries_overall", "GrsiCountryPieChartOverallNo", allAuthorLists, False)
+registerCountryPaperNumbers("countries_vis", "GrsiCountryPieChartVisNo", visAuthorLists, False)
+registerCountryPaperNumbers("countries_overall_senior", "GrsiCountryPieChartOverallSeniorNo", allAuthorLists, True)
+registerCountryPaperNumbers("countries_vis_senior", "GrsiCountryPieChartVisSeniorNo", visAuthorLists, True)
 
-            if publicationYear in journalsAndYears[publicationVenue].keys(): journalsAndYears[publicationVenue][publicationYear] = journalsAndYears[publicationVenue][publicationYear] + 1
-            else: journalsAndYears[publicationVenue][publicationYear] = 1
+#######################################################
+#######################################################
+# visualization/plots
+#######################################################
+#######################################################
+# the plots only need to be created again if the data or any of their input files changed (or if someone changed or removed the graphs)
+plotStageDataHash = dataContentHash([paperList, paperListExtended, grsiMetaData, None if (chartRenderQueue["wanted"] == None) else sorted(chartRenderQueue["wanted"])])
+plotStageCurrent = exportVisualizations and isStageCurrent(stageManifest, "plots", stageInputFiles["plots"], plotStageDataHash)
+if plotStageCurrent: print("The graphs are up to date (neither the data nor any of " + ", ".join(stageInputFiles["plots"]) + " changed since the last time), so we do not create them again")
+if exportVisualizations and not plotStageCurrent:
+    print("Now for the data analysis and visualization ...")
+    import numpy as np
+    import pandas as pd
+    import altair as alt
+    from paper_table import yearCategorySeries
 
-            if publicationYear < earliestYear: earliestYear = publicationYear
-            if publicationYear > latestYear: # ignore the fake in-press year (grsiMetaData["data_download_year"] + 1000)
-                if publicationYear != grsiMetaData["data_download_year"] + 1000: latestYear = publicationYear
+    paperTable = evaluatePaperNumbers(paperNumbers, "paper_table")["table"]
+    isInPress = lambda category, year: year == grsiMetaData["data_download_year"] + 1000 # only for in-press papers do we not want a value plotted in the line graphs if it is 0
 
-    order = 0
-    dataToPlot = []
-    for publicationVenue in journalsAndYears.keys():
-        # sort the dictionary
-        journalsAndYears[publicationVenue] = dict(sorted(journalsAndYears[publicationVenue].items()))
-        order += 1
+    # then extract the data we want to visualize, first overall
+    allJournalListSorted = ['IEEE TVCG', 'ACM ToG', 'Wiley CGF', 'Elsevier C&G', 'Elsevier CAD', 'SIGGRAPH conf.', 'Software Impacts'] # with pre-sorting
+    dataToPlot = yearCategorySeries(paperTable, paperTable["venue"], "journal", allJournalListSorted)
+    # for the line graph, we use nan instead of 0 where we do not want a line (see isInPress), which would fail the aggregated plots
+    lineGraphDataToPlot = yearCategorySeries(paperTable, paperTable["venue"], "journal", allJournalListSorted, nanMaskFunction = isInPress)
+    plotTimeSeriesPublicationData(dataToPlot, baseName = graphOutputSubdirectury + "replicability_all-by-journal", dataField = "journal", cTitleSpecifier = "journal or conference", yTitleSpecifier = "published journal papers w/ GRS", visPadding = visPadding, legendColumns = 5, addTicksBetweenYears = True, addNoteBelowLegend = True, noteXOffset = 33, lineGraphDataToPlot = lineGraphDataToPlot)
 
-        # collect all the data for visualization
-        listOfYears = list(range(earliestYear, latestYear + 1)) # all the real years, including the latest one yet without the in-press papers
-        listOfYears.append(grsiMetaData["data_download_year"] + 1000) # and now do not forget our fake "in-press" year
-        for year in listOfYears:
-            dataItem = {}
-            dataItem["journal"] = publicationVenue
-            dataItem["order"] = order
-            dataItem["year"] = str(year)
-            dataItem["count"] = 0 # as a fall-back, in case there were no publications from this venue in that year
-            if year == grsiMetaData["data_download_year"] + 1000:
-                dataItem["year"] = "in press"
-            if year in journalsAndYears[publicationVenue].keys(): dataItem["count"] = journalsAndYears[publicationVenue][year]
-            dataToPlot.append(dataItem)
-    
-    plotTimeSeriesPublicationData(dataToPlot, baseName = graphOutputSubdirectury + "replicability_visualization-by-journal_plus_type", dataField = "journal", cTitleSpecifier = "journal", yTitleSpecifier = "published visualization journal papers w/ GRS", visPadding = visPadding, colorScheme = "tableau20matching", legendColumns = 2, chartsToPlot = ["all"], addTicksBetweenYears = True, addNoteBelowLegend = True, noteXOffset = 33)
+    # see how visualization contribution changes over the years    
+    visTypes = ['papers on visualization topics', 'papers not on visualization topics'] # with pre-sorting
+    dataToPlot = yearCategorySeries(paperTable, np.where(paperTable["is_vis"], visTypes[0], visTypes[1]), "is_vis", visTypes)
+    plotTimeSeriesPublicationData(dataToPlot, baseName = graphOutputSubdirectury + "replicability_all-by-visualization", dataField = "is_vis", cTitleSpecifier = "paper classification (by presentation venue and keywords/manual)", yTitleSpecifier = "published journal papers w/ GRS", visPadding = visPadding)
 
-    # now let's do that again and overwrite the line graph file with the nan hack (see below; which would fail the aggregated plots)
-    order = 0
-    dataToPlot = []
-    for publicationVenue in journalsAndYears.keys():
-        # sort the dictionary
-        journalsAndYears[publicationVenue] = dict(sorted(journalsAndYears[publicationVenue].items()))
-        order += 1
+    # now visualize visualization, first by journal
+    dataToPlot = yearCategorySeries(paperTable, paperTable["venue"], "journal", visJournalListSorted, rowMask = paperTable["is_vis"])
+    lineGraphDataToPlot = yearCategorySeries(paperTable, paperTable["venue"], "journal", visJournalListSorted, rowMask = paperTable["is_vis"], nanMaskFunction = isInPress)
+    plotTimeSeriesPublicationData(dataToPlot, baseName = graphOutputSubdirectury + "replicability_visualization-by-journal", dataField = "journal", cTitleSpecifier = "journal", yTitleSpecifier = "published visualization journal papers w/ GRS", visPadding = visPadding, addTicksBetweenYears = True, addNoteBelowLegend = True, noteXOffset = 33, lineGraphDataToPlot = lineGraphDataToPlot)
 
-        # collect all the data for visualization
-        listOfYears = list(range(earliestYear, latestYear + 1)) # all the real years, including the latest one yet without the in-press papers
-        listOfYears.append(grsiMetaData["data_download_year"] + 1000) # and now do not forget our fake "in-press" year
-        for year in listOfYears:
-            dataItem = {}
-            dataItem["journal"] = publicationVenue
-            dataItem["order"] = order
-            dataItem["year"] = str(year)
-            dataItem["count"] = 0 # as a fall-back, in case there were no publications from this venue in that year
-            if year == grsiMetaData["data_download_year"] + 1000:
-                dataItem["year"] = "in press"
-                dataItem["count"] = nan # this is a hack to get correct line graphs: only for in-press journals do we not want a value plotted if it is 0
-            if year in journalsAndYears[publicationVenue].keys(): dataItem["count"] = journalsAndYears[publicationVenue][year]
-            dataToPlot.append(dataItem)
-    
-    plotTimeSeriesPublicationData(dataToPlot, baseName = graphOutputSubdirectury + "replicability_visualization-by-journal_plus_type", dataField = "journal", cTitleSpecifier = "journal", yTitleSpecifier = "published visualization journal papers w/ GRS", visPadding = visPadding, colorScheme = "tableau20matching", legendColumns = 2, chartsToPlot = ["linegraph"], addTicksBetweenYears = True, addNoteBelowLegend = True, noteXOffset = 33)
+    # the same visualizations again by journal, but split into papers presented at vis venues and others only classified by keyword/manually
+    visPapersPerJournalAndType = evaluatePaperNumbers(paperNumbers, "vis_papers_per_journal_and_type")
+    separationString = visPapersPerJournalAndType["separation"]
+    journalPlusTypeListSorted = visPapersPerJournalAndType["journal_plus_type_list"]
+    journalPlusType = paperTable["venue"] + separationString + np.where(paperTable["type"] == "keyword/manual", visPapersPerJournalAndType["keyword_name"], visPapersPerJournalAndType["presentation_name"])
+    dataToPlot = yearCategorySeries(paperTable, journalPlusType, "journal", journalPlusTypeListSorted, rowMask = paperTable["is_vis"])
+    lineGraphDataToPlot = yearCategorySeries(paperTable, journalPlusType, "journal", journalPlusTypeListSorted, rowMask = paperTable["is_vis"], nanMaskFunction = isInPress)
+    plotTimeSeriesPublicationData(dataToPlot, baseName = graphOutputSubdirectury + "replicability_visualization-by-journal_plus_type", dataField = "journal", cTitleSpecifier = "journal", yTitleSpecifier = "published visualization journal papers w/ GRS", visPadding = visPadding, colorScheme = "tableau20matching", legendColumns = 2, addTicksBetweenYears = True, addNoteBelowLegend = True, noteXOffset = 33, lineGraphDataToPlot = lineGraphDataToPlot)
 
     # the same visualizations again by journal but aggregated (without years), and again split into papers presented at vis venues and others only classified by keyword/manually
-    separationString = ': '
-    visVenueName = 'vis classification by presentation venue'
-    keywordName = 'vis classification by keyword/manual'
-    journalsOnly = {}
-    for venue in visJournalListSorted: # base the dictionary this time on the list (easier in case we later need to add another journal to the list)
-        journalsOnly[venue + separationString + visVenueName] = 0
-        journalsOnly[venue + separationString + keywordName] = 0
-
-    for paper in paperList:
-        doi = paper["doi"]
-
-        if (doi in paperListExtended.keys()) and (paper["is_vis"]):
-            paperExtended = paperListExtended[doi]
-            publicationYear = paperExtended["publication_year"]
-            if paper["type"] == "keyword/manual":
-                publicationVenue = filterAndShortenJournalNames(paperExtended["journal"]) + separationString + keywordName
-            else:
-                publicationVenue = filterAndShortenJournalNames(paperExtended["journal"]) + separationString + visVenueName
-            if not (publicationVenue in journalsOnly.keys()): journalsOnly[publicationVenue] = 0
-
-            journalsOnly[publicationVenue] += 1
-
-    # determine some numbers for the paper
-    for venue in visJournalListSorted:
-        paperNumbersOutputString += "\\newcommand{\\GrsiVisPapersIn" + venue.replace(" ", "").replace("&", "a") + "Total}{" + str(journalsOnly[venue + separationString + visVenueName] + journalsOnly[venue + separationString + keywordName]) + "}\n"
-        paperNumbersOutputString += "\\newcommand{\\GrsiVisPapersIn" + venue.replace(" ", "").replace("&", "a") + "Presentation}{" + str(journalsOnly[venue + separationString + visVenueName]) + "}\n"
-        paperNumbersOutputString += "\\newcommand{\\GrsiVisPapersIn" + venue.replace(" ", "").replace("&", "a") + "KeywordManual}{" + str(journalsOnly[venue + separationString + keywordName]) + "}\n"
-        paperNumbersOutputString += "\\newcommand{\\GrsiVisPapersIn" + venue.replace(" ", "").replace("&", "a") + "PercentagePresentation}{" + str(round(float(journalsOnly[venue + separationString + visVenueName])/float(journalsOnly[venue + separationString + visVenueName] + journalsOnly[venue + separationString + keywordName]) * 100.0, 1)) + "}\n"
+    journalsOnly = visPapersPerJournalAndType["journals_only"]
 
     dataToPlot = []
     order = 0
     for publicationVenue in journalsOnly.keys():
         # collect all the data for visualization
         order += 1
-        listOfYears = list(range(earliestYear, latestYear + 1)) # all the real years, including the latest one yet without the in-press papers
-        listOfYears.append(grsiMetaData["data_download_year"] + 1000) # and now do not forget our fake "in-press" year
         dataItem = {}
         dataItem["journal"] = publicationVenue
         dataItem["order"] = order
@@ -1819,75 +1457,13 @@ if exportVisualizations:
 
     # now visualize visualization, then by type
     # pre-sorting the order in which we want things
-    journalsAndYears = {'IEEE VIS': {}, 'journal pres. @ IEEE VIS': {}, 'EuroVis': {}, 'journal pres. @ EuroVis': {}, 'PacificVis TVCG': {}, 'journal pres. @ PacificVis': {}, 'VCBM C&G': {}, 'C&G special issue': {}, 'keyword/manual': {}}
-    earliestYear = grsiMetaData["data_download_year"]
-    latestYear = grsiMetaData["data_download_year"]
-    for paper in paperList:
-        doi = paper["doi"]
-
-        if (doi in paperListExtended.keys()) and (paper["is_vis"]):
-            paperExtended = paperListExtended[doi]
-            publicationYear = paperExtended["publication_year"]
-            publicationType = paper["type"]
-            if not (publicationType in journalsAndYears.keys()): journalsAndYears[publicationType] = {}
-
-            if publicationYear in journalsAndYears[publicationType].keys(): journalsAndYears[publicationType][publicationYear] = journalsAndYears[publicationType][publicationYear] + 1
-            else: journalsAndYears[publicationType][publicationYear] = 1
-
-            if publicationYear < earliestYear: earliestYear = publicationYear
-            if publicationYear > latestYear: # ignore the fake in-press year (grsiMetaData["data_download_year"] + 1000)
-                if publicationYear != grsiMetaData["data_download_year"] + 1000: latestYear = publicationYear
-
-    order = 0
-    dataToPlot = []
-    for publicationType in journalsAndYears.keys():
-        # sort the dictionary
-        journalsAndYears[publicationType] = dict(sorted(journalsAndYears[publicationType].items()))
-        order += 1
-
-        # collect all the data for visualization
-        listOfYears = list(range(earliestYear, latestYear + 1)) # all the real years, including the latest one yet without the in-press papers
-        listOfYears.append(grsiMetaData["data_download_year"] + 1000) # and now do not forget our fake "in-press" year
-        for year in listOfYears:
-            dataItem = {}
-            dataItem["type"] = publicationType
-            dataItem["order"] = order
-            dataItem["year"] = str(year)
-            dataItem["count"] = 0 # as a fall-back, in case there were no publications from this venue in that year
-            if year == grsiMetaData["data_download_year"] + 1000:
-                dataItem["year"] = "in press"
-            if year in journalsAndYears[publicationType].keys(): dataItem["count"] = journalsAndYears[publicationType][year]
-            dataToPlot.append(dataItem)
-
-    plotTimeSeriesPublicationData(dataToPlot, baseName = graphOutputSubdirectury + "replicability_visualization-by-type", dataField = "type", cTitleSpecifier = "classified as visualization by ...", yTitleSpecifier = "published visualization journal papers w/ GRS", colorScheme = "tableau20", legendColumns = 4, visPadding = visPadding, chartsToPlot = ["all"], addTicksBetweenYears = True, addNoteBelowLegend = True, noteXOffset = 33)
-
-    # now let's do that again and overwrite the line graph file with the nan hack (see below; which would fail the aggregated plots)
-    order = 0
-    dataToPlot = []
-    for publicationType in journalsAndYears.keys():
-        # sort the dictionary
-        journalsAndYears[publicationType] = dict(sorted(journalsAndYears[publicationType].items()))
-        order += 1
-
-        # collect all the data for visualization
-        listOfYears = list(range(earliestYear, latestYear + 1)) # all the real years, including the latest one yet without the in-press papers
-        listOfYears.append(grsiMetaData["data_download_year"] + 1000) # and now do not forget our fake "in-press" year
-        for year in listOfYears:
-            dataItem = {}
-            dataItem["type"] = publicationType
-            dataItem["order"] = order
-            dataItem["year"] = str(year)
-            dataItem["count"] = 0 # as a fall-back, in case there were no publications from this venue in that year
-            # some events did not exist before a given time
-            if ((publicationType == 'journal pres. @ PacificVis') and (year < 2024)) or ((publicationType == 'VCBM C&G') and (year < 2018)) or ((publicationType == 'C&G special issue') and (year < 2020)):
-                dataItem["count"] = nan # then no values exist
-            if year == grsiMetaData["data_download_year"] + 1000:
-                dataItem["year"] = "in press"
-                dataItem["count"] = nan # only for in-press journals do we not want a value plotted if it is 0
-            if year in journalsAndYears[publicationType].keys(): dataItem["count"] = journalsAndYears[publicationType][year]
-            dataToPlot.append(dataItem)
-
-    plotTimeSeriesPublicationData(dataToPlot, baseName = graphOutputSubdirectury + "replicability_visualization-by-type", dataField = "type", cTitleSpecifier = "classified as visualization by ...", yTitleSpecifier = "published visualization journal papers w/ GRS", colorScheme = "tableau20", legendColumns = 4, visPadding = visPadding, chartsToPlot = ["linegraph"], addTicksBetweenYears = True, addNoteBelowLegend = True, noteXOffset = 33)
+    visTypeListSorted = ['IEEE VIS', 'journal pres. @ IEEE VIS', 'EuroVis', 'journal pres. @ EuroVis', 'PacificVis TVCG', 'journal pres. @ PacificVis', 'VCBM C&G', 'C&G special issue', 'keyword/manual']
+    dataToPlot = yearCategorySeries(paperTable, paperTable["type"], "type", visTypeListSorted, rowMask = paperTable["is_vis"])
+    # some events did not exist before a given time, then no values exist
+    def isMissingVisType(publicationType, year):
+        return isInPress(publicationType, year) or ((publicationType == 'journal pres. @ PacificVis') and (year < 2024)) or ((publicationType == 'VCBM C&G') and (year < 2018)) or ((publicationType == 'C&G special issue') and (year < 2020))
+    lineGraphDataToPlot = yearCategorySeries(paperTable, paperTable["type"], "type", visTypeListSorted, rowMask = paperTable["is_vis"], nanMaskFunction = isMissingVisType)
+    plotTimeSeriesPublicationData(dataToPlot, baseName = graphOutputSubdirectury + "replicability_visualization-by-type", dataField = "type", cTitleSpecifier = "classified as visualization by ...", yTitleSpecifier = "published visualization journal papers w/ GRS", colorScheme = "tableau20", legendColumns = 4, visPadding = visPadding, addTicksBetweenYears = True, addNoteBelowLegend = True, noteXOffset = 33, lineGraphDataToPlot = lineGraphDataToPlot)
 
     # pie chart that compares the vis content from the rest, for all journals
     journalsAndCounts = {}
@@ -1928,7 +1504,7 @@ if exportVisualizations:
     ).properties(
         padding={"left": visPadding, "right": visPadding, "bottom": visPadding+visPaddingBottomExtra, "top": visPadding}
     )
-    pieChart.save(graphOutputSubdirectury + 'replicability_visualization-piechart-by-journal.pdf')
+    queueChartRender(chartRenderQueue, pieChart, graphOutputSubdirectury + 'replicability_visualization-piechart-by-journal.pdf')
 
     source = pd.DataFrame(dataToPlot)
     pieChart = alt.Chart(source).mark_arc().encode(
@@ -1940,7 +1516,7 @@ if exportVisualizations:
     ).properties(
         padding={"left": visPadding, "right": visPadding, "bottom": visPadding+visPaddingBottomExtra, "top": visPadding}
     )
-    pieChart.save(graphOutputSubdirectury + 'replicability_visualization-piechart-by-vis-status.pdf')
+    queueChartRender(chartRenderQueue, pieChart, graphOutputSubdirectury + 'replicability_visualization-piechart-by-vis-status.pdf')
 
     # the same data, but using the plotTimeSeriesPublicationData function, such that we get an aggregated view
     separationString = '–'
@@ -1989,13 +1565,13 @@ if exportVisualizations:
             visVenuesAndReplicability[venue][year]["is_replicable"] = 0
             visVenuesAndReplicability[venue][year]["not_replicable"] = 0
     dataToPlot = []
-    replicableDois = []
+    replicableDois = set() # hashed, since we check every venue paper against it
     for paper in paperList:
         doi = paper["doi"]
-        if doi[0:3] == "10.": replicableDois.append(doi)
+        if doi[0:3] == "10.": replicableDois.add(doi)
 
     # pure VIS papers from vispubdata
-    vispubdataLoadedDoisForChecking = []
+    vispubdataLoadedDoisForChecking = set()
     with open('input/vispubdata.csv', 'r', encoding="utf-8") as csvfile:
         venue = venues[0]
         # create a CSV reader object
@@ -2003,7 +1579,7 @@ if exportVisualizations:
         # iterate over the rows
         for row in reader:
             paperDoi = row['DOI'].lower()
-            vispubdataLoadedDoisForChecking.append(paperDoi)
+            vispubdataLoadedDoisForChecking.add(paperDoi)
             year = int(row['Year']) # this year is the year of presentation at VIS, not article publication, so what we want
             if year >= startYear and year <= endYear:
                 if paperDoi in replicableDois: visVenuesAndReplicability[venue][year]["is_replicable"] += 1
@@ -2020,7 +1596,7 @@ if exportVisualizations:
             for row in reader:
                 paperDoi = row['DOI'].lower()
                 if paperDoi not in vispubdataLoadedDoisForChecking: # so that we do not duplicate the loaded dois
-                    vispubdataLoadedDoisForChecking.append(paperDoi)
+                    vispubdataLoadedDoisForChecking.add(paperDoi)
                     year = int(row['Publication Year']) - 1 # the year in the data is the year of publication in TVCG, not presentation at VIS, so we need to deduct 1
                     if year >= startYear and year <= endYear:
                         if paperDoi in replicableDois: visVenuesAndReplicability[venue][year]["is_replicable"] += 1
@@ -2037,7 +1613,7 @@ if exportVisualizations:
             for row in reader:
                 visDoi = row['DOI'].lower()
                 if visDoi not in vispubdataLoadedDoisForChecking: # so that we do not duplicate the loaded dois (should not happen if we use fake DOIs)
-                    vispubdataLoadedDoisForChecking.append(visDoi)
+                    vispubdataLoadedDoisForChecking.add(visDoi)
                     year = int(row['Year']) # the year in the data is the year of presentation at VIS
                     if year >= startYear and year <= endYear:
                         if visDoi in replicableDois: visVenuesAndReplicability[venue][year]["is_replicable"] += 1
@@ -2312,31 +1888,31 @@ if exportVisualizations:
         dy=-80, dx=657 # emprirically found, should remain the same as long as the width and height in configure_view stay the same
     ))
 
-    chart.save(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph.pdf')
+    queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph.pdf')
     
     colors2 = []
     for i in range(0, len(colors)): colors2.append(rgb_adjust_lightness(rgb_to_grayscale(colors[i]), grayscaleLightnessFactor))
     for i in range(0, 4): colors2[i] = colors[i]
     chart = chart.configure_range(category=alt.RangeScheme(colors2))
-    chart.save(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-ieee_vis.pdf')
+    queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-ieee_vis.pdf')
 
     colors2 = []
     for i in range(0, len(colors)): colors2.append(rgb_adjust_lightness(rgb_to_grayscale(colors[i]), grayscaleLightnessFactor))
     for i in range(4, 8): colors2[i] = colors[i]
     chart = chart.configure_range(category=alt.RangeScheme(colors2))
-    chart.save(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-eurovis.pdf')
+    queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-eurovis.pdf')
 
     colors2 = []
     for i in range(0, len(colors)): colors2.append(rgb_adjust_lightness(rgb_to_grayscale(colors[i]), grayscaleLightnessFactor))
     for i in range(8, 12): colors2[i] = colors[i]
     chart = chart.configure_range(category=alt.RangeScheme(colors2))
-    chart.save(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-pacificvis.pdf')
+    queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-pacificvis.pdf')
 
     colors2 = []
     for i in range(0, len(colors)): colors2.append(rgb_adjust_lightness(rgb_to_grayscale(colors[i]), grayscaleLightnessFactor))
     for i in range(12, 14): colors2[i] = colors[i]
     chart = chart.configure_range(category=alt.RangeScheme(colors2))
-    chart.save(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-vcbm.pdf')
+    queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-vcbm.pdf')
 
     chart = alt.Chart(altairData, width={"step": 15}).mark_bar().encode(
         x = alt.X('year:N', title=None).axis(tickWidth=0, labelAngle=0),#domain=False, 
@@ -2375,31 +1951,31 @@ if exportVisualizations:
         subtitleFontSize=10,
         dy=-80, dx=666 # emprirically found, should remain the same as long as the width and height in configure_view stay the same
     ))
-    chart.save(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-normalized.pdf')
+    queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-normalized.pdf')
 
     colors2 = []
     for i in range(0, len(colors)): colors2.append(rgb_adjust_lightness(rgb_to_grayscale(colors[i]), grayscaleLightnessFactor))
     for i in range(0, 4): colors2[i] = colors[i]
     chart = chart.configure_range(category=alt.RangeScheme(colors2))
-    chart.save(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-normalized-ieee_vis.pdf')
+    queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-normalized-ieee_vis.pdf')
 
     colors2 = []
     for i in range(0, len(colors)): colors2.append(rgb_adjust_lightness(rgb_to_grayscale(colors[i]), grayscaleLightnessFactor))
     for i in range(4, 8): colors2[i] = colors[i]
     chart = chart.configure_range(category=alt.RangeScheme(colors2))
-    chart.save(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-normalized-eurovis.pdf')
+    queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-normalized-eurovis.pdf')
 
     colors2 = []
     for i in range(0, len(colors)): colors2.append(rgb_adjust_lightness(rgb_to_grayscale(colors[i]), grayscaleLightnessFactor))
     for i in range(8, 12): colors2[i] = colors[i]
     chart = chart.configure_range(category=alt.RangeScheme(colors2))
-    chart.save(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-normalized-pacificvis.pdf')
+    queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-normalized-pacificvis.pdf')
 
     colors2 = []
     for i in range(0, len(colors)): colors2.append(rgb_adjust_lightness(rgb_to_grayscale(colors[i]), grayscaleLightnessFactor))
     for i in range(12, 14): colors2[i] = colors[i]
     chart = chart.configure_range(category=alt.RangeScheme(colors2))
-    chart.save(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-normalized-vcbm.pdf')
+    queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-normalized-vcbm.pdf')
 
     dataToPlot = []
     for venue in venues: # redo the data for the line graph, because this is not stacked
@@ -2427,7 +2003,7 @@ if exportVisualizations:
         width=600,
         height=300
     )
-    chart.save(graphOutputSubdirectury + 'replicability_visualization-by-venue-linegraph.pdf')
+    queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability_visualization-by-venue-linegraph.pdf')
 
     # histogram of GRS per person for vis people
     dataToPlotAll = []
@@ -2467,7 +2043,7 @@ if exportVisualizations:
         width=400,
         height=300
     )
-    chart.save(graphOutputSubdirectury + 'replicability_all-histogram-stamps-per-person.pdf')
+    queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability_all-histogram-stamps-per-person.pdf')
 
     altairData = pd.DataFrame(dataToPlotVis)
     chart = alt.Chart(altairData).mark_bar(size=20).encode(
@@ -2478,7 +2054,7 @@ if exportVisualizations:
         width=400,
         height=300
     )
-    chart.save(graphOutputSubdirectury + 'replicability_visualization-histogram-stamps-per-person.pdf')
+    queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability_visualization-histogram-stamps-per-person.pdf')
 
     # histogram of vis percentages per person
     dataToPlot = []
@@ -2501,7 +2077,7 @@ if exportVisualizations:
         width=400,
         height=300
     )
-    chart.save(graphOutputSubdirectury + 'replicability-histogram-people-vis-percentages.pdf')
+    queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability-histogram-people-vis-percentages.pdf')
 
     altairData = pd.DataFrame(dataToPlot)
     chart = alt.Chart(altairData).mark_bar(size=20).encode(
@@ -2512,7 +2088,7 @@ if exportVisualizations:
         width=400,
         height=300
     )
-    chart.save(graphOutputSubdirectury + 'replicability-histogram-people-vis-percentages-nolog.pdf')
+    queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability-histogram-people-vis-percentages-nolog.pdf')
 
     # histogram of vis percentages per person
     dataToPlot = []
@@ -2535,7 +2111,7 @@ if exportVisualizations:
         width=400,
         height=300
     )
-    chart.save(graphOutputSubdirectury + 'replicability-histogram-people-vis-percentages-multiple-papers.pdf')
+    queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability-histogram-people-vis-percentages-multiple-papers.pdf')
 
     altairData = pd.DataFrame(dataToPlot)
     chart = alt.Chart(altairData).mark_bar(size=20).encode(
@@ -2546,30 +2122,10 @@ if exportVisualizations:
         width=400,
         height=300
     )
-    chart.save(graphOutputSubdirectury + 'replicability-histogram-people-vis-percentages-multiple-papers-nolog.pdf')
+    queueChartRender(chartRenderQueue, chart, graphOutputSubdirectury + 'replicability-histogram-people-vis-percentages-multiple-papers-nolog.pdf')
 
-    # load country names for visualization (from https://github.com/lukes/ISO-3166-Countries-with-Regional-Codes/blob/master/all/all.csv)
-    countryNames = {}
-    countryNamesSentence = {}
-    with open('input/country-names.csv', 'r', encoding="utf-8") as csvfile:
-        # create a CSV reader object
-        reader = csv.DictReader(csvfile)
-        # iterate over the rows
-        for row in reader:
-            countryNames[row['alpha-2']] = row['name'] \
-                .replace('United States of America', 'United States') \
-                .replace('United Kingdom of Great Britain and Northern Ireland', 'UK') \
-                .replace('Korea, Republic of', 'South Korea') \
-                .replace('Taiwan, Province of China', 'Taiwan') \
-                .replace('Viet Nam', 'Vietnam') \
-                .replace('Czechia', 'Czech Republic')
-            countryNamesSentence[row['alpha-2']] = countryNames[row['alpha-2']] \
-                .replace('United States', 'the United States') \
-                .replace('Netherlands', 'the Netherlands') \
-                .replace('Czech Republic', 'the Czech Republic') \
-                .replace('UK', 'the UK') \
-                .replace('United Arab Emirates', 'the United Arab Emirates')
-        csvfile.close()
+    # country names for visualization
+    countryNames = evaluatePaperNumbers(paperNumbers, "country_names")["names"]
 
     # analyze the contributions by country (all of GRSI)
     # need new color palette based on the code below
@@ -2581,28 +2137,10 @@ if exportVisualizations:
     # another alternative is to combine "category20b" and "category20c" to a single scale, which we actulally now do below
     colorsGrsiPerCountry = generateColorArrayFromColorScheme("category20b_plus_category20c")
 
-    grsiPerCountryProportional = {}
-    grsiPerCountrySum = {}
-    papersWithContryInformation = 0.0
-    for paperIndex in paperListExtended.keys():
-        doi = paperListExtended[paperIndex]["doi"]
-        authors = paperListExtended[paperIndex]["authors"]
-        contributionPerAuthor = 1.0 / len(authors)
-        countryAlreadyCountedForPaper = {}
-        paperHasCountryInfo = False
-        for author in authors:
-            if "countries" in author.keys(): # we may not have the whole information for everyone
-                paperHasCountryInfo = True
-                contributionOfSingleAuthorCountry = contributionPerAuthor / len(author["countries"])
-                for country in author["countries"]:
-                    if not (country in grsiPerCountryProportional.keys()): grsiPerCountryProportional[country] = 0.0
-                    if not (country in grsiPerCountrySum.keys()): grsiPerCountrySum[country] = 0
-                    grsiPerCountryProportional[country] += contributionOfSingleAuthorCountry
-                    # grsiPerCountrySum[country] += 1
-                    if not (country in countryAlreadyCountedForPaper.keys()):
-                        countryAlreadyCountedForPaper[country] = 1
-                        grsiPerCountrySum[country] += 1
-        if paperHasCountryInfo: papersWithContryInformation += 1.0
+    countryContributions = evaluatePaperNumbers(paperNumbers, "countries_overall")
+    grsiPerCountryProportional = dict(countryContributions["proportional"])
+    grsiPerCountrySum = dict(countryContributions["papers"])
+    papersWithContryInformation = countryContributions["papers_with_country_information"]
 
     if bool(grsiPerCountryProportional):
         grsiPerCountryProportional = dict(sorted(grsiPerCountryProportional.items(), key=lambda kv: kv[1], reverse = True))
@@ -2614,8 +2152,6 @@ if exportVisualizations:
             dataItem['value'] = grsiPerCountryProportional[country]
             dataItem['order'] = order
             order += 1
-            paperNumbersOutputString += "\\newcommand{\\GrsiCountryPieChartOverallNo" + digitToNameSequence(order) + "Name}{" + countryNamesSentence[country] + "}\n"
-            paperNumbersOutputString += "\\newcommand{\\GrsiCountryPieChartOverallNo" + digitToNameSequence(order) + "Percentage}{" + str(round(100.0 * grsiPerCountryProportional[country]/papersWithContryInformation, 1)) + "}\n"
             dataToPlot.append(dataItem)
 
         source = pd.DataFrame(dataToPlot)
@@ -2628,7 +2164,7 @@ if exportVisualizations:
         ).properties(
             padding={"left": visPadding, "right": visPadding, "bottom": visPadding+visPaddingBottomExtra, "top": visPadding}
         ).configure_legend(columns=2, symbolLimit=50, titleLimit=0, labelLimit=myLabelLimit)
-        pieChart.save(graphOutputSubdirectury + 'replicability_all-piechart-by-country-proportional.pdf')
+        queueChartRender(chartRenderQueue, pieChart, graphOutputSubdirectury + 'replicability_all-piechart-by-country-proportional.pdf')
 
         grsiPerCountrySum = dict(sorted(grsiPerCountrySum.items(), key=lambda kv: kv[1], reverse = True))
         dataToPlot = []
@@ -2651,7 +2187,7 @@ if exportVisualizations:
         ).properties(
             padding={"left": visPadding, "right": visPadding, "bottom": visPadding+visPaddingBottomExtra, "top": visPadding}
         ).configure_legend(columns=2, symbolLimit=50, titleLimit=0, labelLimit=myLabelLimit)
-        pieChart.save(graphOutputSubdirectury + 'replicability_all-piechart-by-country-absolute.pdf')
+        queueChartRender(chartRenderQueue, pieChart, graphOutputSubdirectury + 'replicability_all-piechart-by-country-absolute.pdf')
 
         colorsGrsiPerCountryLookup = {}
         colorsGrsiPerCountryThresholded = []
@@ -2724,7 +2260,7 @@ if exportVisualizations:
         ).properties(
             padding={"left": visPadding, "right": visPadding, "bottom": visPadding+visPaddingBottomExtra, "top": visPadding}
         ).configure_legend(columns=1, symbolLimit=50, titleLimit=0, labelLimit=myLabelLimit)
-        pieChart.save(graphOutputSubdirectury + 'replicability_all-piechart-by-country-thresholded-proportional.pdf')
+        queueChartRender(chartRenderQueue, pieChart, graphOutputSubdirectury + 'replicability_all-piechart-by-country-thresholded-proportional.pdf')
 
     # analyze the contributions by country (only visualization)
 
@@ -2733,29 +2269,10 @@ if exportVisualizations:
     # some additional pastel colors
     for newColor in ["#617957", "#a5d0a3", "#dfdfa1", "#fefad7", "#55a5be", "#a2d9ed"]: colorsGrsiPerCountryVsualization.append(newColor)
         
-    grsiPerCountryProportional = {}
-    grsiPerCountrySum = {}
-    papersWithContryInformation = 0
-    for paper in paperList:
-        doi = paper["doi"]
-        if paper['is_vis'] and doi in paperListExtended.keys():
-            authors = paperListExtended[doi]["authors"]
-            contributionPerAuthor = 1.0 / len(authors)
-            countryAlreadyCountedForPaper = {}
-            paperHasCountryInfo = False
-            for author in authors:
-                if "countries" in author.keys(): # we may not have the whole information for everyone
-                    paperHasCountryInfo = True
-                    contributionOfSingleAuthorCountry = contributionPerAuthor / len(author["countries"])
-                    for country in author["countries"]:
-                        if not (country in grsiPerCountryProportional.keys()): grsiPerCountryProportional[country] = 0.0
-                        if not (country in grsiPerCountrySum.keys()): grsiPerCountrySum[country] = 0
-                        grsiPerCountryProportional[country] += contributionOfSingleAuthorCountry
-                        # grsiPerCountrySum[country] += 1
-                        if not (country in countryAlreadyCountedForPaper.keys()):
-                            countryAlreadyCountedForPaper[country] = 1
-                            grsiPerCountrySum[country] += 1
-            if paperHasCountryInfo: papersWithContryInformation += 1
+    countryContributions = evaluatePaperNumbers(paperNumbers, "countries_vis")
+    grsiPerCountryProportional = dict(countryContributions["proportional"])
+    grsiPerCountrySum = dict(countryContributions["papers"])
+    papersWithContryInformation = countryContributions["papers_with_country_information"]
     
     if bool(grsiPerCountryProportional):
         grsiPerCountryProportional = dict(sorted(grsiPerCountryProportional.items(), key=lambda kv: kv[1], reverse = True))
@@ -2767,8 +2284,6 @@ if exportVisualizations:
             dataItem['value'] = grsiPerCountryProportional[country]
             dataItem['order'] = order
             order += 1
-            paperNumbersOutputString += "\\newcommand{\\GrsiCountryPieChartVisNo" + digitToNameSequence(order) + "Name}{" + countryNamesSentence[country] + "}\n"
-            paperNumbersOutputString += "\\newcommand{\\GrsiCountryPieChartVisNo" + digitToNameSequence(order) + "Percentage}{" + str(round(100.0 * grsiPerCountryProportional[country]/papersWithContryInformation, 1)) + "}\n"
             dataToPlot.append(dataItem)
 
         source = pd.DataFrame(dataToPlot)
@@ -2781,7 +2296,7 @@ if exportVisualizations:
         ).properties(
             padding={"left": visPadding, "right": visPadding, "bottom": visPadding+visPaddingBottomExtra, "top": visPadding}
         ).configure_legend(columns=2, symbolLimit=50, titleLimit=0, labelLimit=myLabelLimit)
-        pieChart.save(graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-proportional.pdf')
+        queueChartRender(chartRenderQueue, pieChart, graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-proportional.pdf')
 
         grsiPerCountrySum = dict(sorted(grsiPerCountrySum.items(), key=lambda kv: kv[1], reverse = True))
         dataToPlot = []
@@ -2804,7 +2319,7 @@ if exportVisualizations:
         ).properties(
             padding={"left": visPadding, "right": visPadding, "bottom": visPadding+visPaddingBottomExtra, "top": visPadding}
         ).configure_legend(columns=2, symbolLimit=50, titleLimit=0, labelLimit=myLabelLimit)
-        pieChart.save(graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-absolute.pdf')
+        queueChartRender(chartRenderQueue, pieChart, graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-absolute.pdf')
 
         # thresholded version for the proportional one
         if makeMainPieChartsComparable: colorsGrsiPerCountryThresholded = []
@@ -2856,30 +2371,13 @@ if exportVisualizations:
         ).properties(
             padding={"left": visPadding, "right": visPadding, "bottom": visPadding+visPaddingBottomExtra, "top": visPadding}
         ).configure_legend(columns=1, symbolLimit=50, titleLimit=0, labelLimit=myLabelLimit)
-        pieChart.save(graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-thresholded-proportional.pdf')
+        queueChartRender(chartRenderQueue, pieChart, graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-thresholded-proportional.pdf')
 
     # analyze the contributions by country (all of GRSI, but only by senior author)
-    grsiPerCountryProportional = {}
-    grsiPerCountrySum = {}
-    papersWithContryInformation = 0.0
-    for paperIndex in paperListExtended.keys():
-        doi = paperListExtended[paperIndex]["doi"]
-        authors = paperListExtended[paperIndex]["authors"]
-        countryAlreadyCountedForPaper = {}
-        paperHasCountryInfo = False
-        author = authors[-1] # we assume that the last author is the senior author
-        if "countries" in author.keys(): # we may not have the whole information for everyone
-            paperHasCountryInfo = True
-            contributionOfSingleAuthorCountry = 1.0 / len(author["countries"])
-            for country in author["countries"]:
-                if not (country in grsiPerCountryProportional.keys()): grsiPerCountryProportional[country] = 0.0
-                if not (country in grsiPerCountrySum.keys()): grsiPerCountrySum[country] = 0
-                grsiPerCountryProportional[country] += contributionOfSingleAuthorCountry
-                # grsiPerCountrySum[country] += 1
-                if not (country in countryAlreadyCountedForPaper.keys()):
-                    countryAlreadyCountedForPaper[country] = 1
-                    grsiPerCountrySum[country] += 1
-        if paperHasCountryInfo: papersWithContryInformation += 1.0
+    countryContributions = evaluatePaperNumbers(paperNumbers, "countries_overall_senior")
+    grsiPerCountryProportional = dict(countryContributions["proportional"])
+    grsiPerCountrySum = dict(countryContributions["papers"])
+    papersWithContryInformation = countryContributions["papers_with_country_information"]
 
     if bool(grsiPerCountryProportional):
         grsiPerCountryProportional = dict(sorted(grsiPerCountryProportional.items(), key=lambda kv: kv[1], reverse = True))
@@ -2891,8 +2389,6 @@ if exportVisualizations:
             dataItem['value'] = grsiPerCountryProportional[country]
             dataItem['order'] = order
             order += 1
-            paperNumbersOutputString += "\\newcommand{\\GrsiCountryPieChartOverallSeniorNo" + digitToNameSequence(order) + "Name}{" + countryNamesSentence[country] + "}\n"
-            paperNumbersOutputString += "\\newcommand{\\GrsiCountryPieChartOverallSeniorNo" + digitToNameSequence(order) + "Percentage}{" + str(round(100.0 * grsiPerCountryProportional[country]/papersWithContryInformation, 1)) + "}\n"
             dataToPlot.append(dataItem)
 
         source = pd.DataFrame(dataToPlot)
@@ -2905,7 +2401,7 @@ if exportVisualizations:
         ).properties(
             padding={"left": visPadding, "right": visPadding, "bottom": visPadding+visPaddingBottomExtra, "top": visPadding}
         ).configure_legend(columns=2, symbolLimit=50, titleLimit=0, labelLimit=myLabelLimit)
-        pieChart.save(graphOutputSubdirectury + 'replicability_all-piechart-by-country-senior-only-proportional.pdf')
+        queueChartRender(chartRenderQueue, pieChart, graphOutputSubdirectury + 'replicability_all-piechart-by-country-senior-only-proportional.pdf')
 
         grsiPerCountrySum = dict(sorted(grsiPerCountrySum.items(), key=lambda kv: kv[1], reverse = True))
         dataToPlot = []
@@ -2928,7 +2424,7 @@ if exportVisualizations:
         ).properties(
             padding={"left": visPadding, "right": visPadding, "bottom": visPadding+visPaddingBottomExtra, "top": visPadding}
         ).configure_legend(columns=2, symbolLimit=50, titleLimit=0, labelLimit=myLabelLimit)
-        pieChart.save(graphOutputSubdirectury + 'replicability_all-piechart-by-country-senior-only-absolute.pdf')
+        queueChartRender(chartRenderQueue, pieChart, graphOutputSubdirectury + 'replicability_all-piechart-by-country-senior-only-absolute.pdf')
 
         # thresholded version for the proportional one
         if makeMainPieChartsComparable: colorsGrsiPerCountryThresholded = []
@@ -2980,30 +2476,12 @@ if exportVisualizations:
         ).properties(
             padding={"left": visPadding, "right": visPadding, "bottom": visPadding+visPaddingBottomExtra, "top": visPadding}
         ).configure_legend(columns=1, symbolLimit=50, titleLimit=0, labelLimit=myLabelLimit)
-        pieChart.save(graphOutputSubdirectury + 'replicability_all-piechart-by-country-senior-only-thresholded-proportional.pdf')
+        queueChartRender(chartRenderQueue, pieChart, graphOutputSubdirectury + 'replicability_all-piechart-by-country-senior-only-thresholded-proportional.pdf')
 
-    grsiPerCountryProportional = {}
-    grsiPerCountrySum = {}
-    papersWithContryInformation = 0
-    for paper in paperList:
-        doi = paper["doi"]
-        countryAlreadyCountedForPaper = {}
-        if paper['is_vis'] and doi in paperListExtended.keys():
-            authors = paperListExtended[doi]["authors"]
-            paperHasCountryInfo = False
-            author = authors[-1]
-            if "countries" in author.keys(): # we may not have the whole information for everyone
-                paperHasCountryInfo = True
-                contributionOfSingleAuthorCountry = 1.0 / len(author["countries"])
-                for country in author["countries"]:
-                    if not (country in grsiPerCountryProportional.keys()): grsiPerCountryProportional[country] = 0.0
-                    if not (country in grsiPerCountrySum.keys()): grsiPerCountrySum[country] = 0
-                    grsiPerCountryProportional[country] += contributionOfSingleAuthorCountry
-                    # grsiPerCountrySum[country] += 1
-                    if not (country in countryAlreadyCountedForPaper.keys()):
-                        countryAlreadyCountedForPaper[country] = 1
-                        grsiPerCountrySum[country] += 1
-            if paperHasCountryInfo: papersWithContryInformation += 1
+    countryContributions = evaluatePaperNumbers(paperNumbers, "countries_vis_senior")
+    grsiPerCountryProportional = dict(countryContributions["proportional"])
+    grsiPerCountrySum = dict(countryContributions["papers"])
+    papersWithContryInformation = countryContributions["papers_with_country_information"]
     
     if bool(grsiPerCountryProportional):
         grsiPerCountryProportional = dict(sorted(grsiPerCountryProportional.items(), key=lambda kv: kv[1], reverse = True))
@@ -3015,8 +2493,6 @@ if exportVisualizations:
             dataItem['value'] = grsiPerCountryProportional[country]
             dataItem['order'] = order
             order += 1
-            paperNumbersOutputString += "\\newcommand{\\GrsiCountryPieChartVisSeniorNo" + digitToNameSequence(order) + "Name}{" + countryNamesSentence[country] + "}\n"
-            paperNumbersOutputString += "\\newcommand{\\GrsiCountryPieChartVisSeniorNo" + digitToNameSequence(order) + "Percentage}{" + str(round(100.0 * grsiPerCountryProportional[country]/papersWithContryInformation, 1)) + "}\n"
             dataToPlot.append(dataItem)
 
         source = pd.DataFrame(dataToPlot)
@@ -3029,7 +2505,7 @@ if exportVisualizations:
         ).properties(
             padding={"left": visPadding, "right": visPadding, "bottom": visPadding+visPaddingBottomExtra, "top": visPadding}
         ).configure_legend(columns=2, symbolLimit=50, titleLimit=0, labelLimit=myLabelLimit)
-        pieChart.save(graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-senior-only-proportional.pdf')
+        queueChartRender(chartRenderQueue, pieChart, graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-senior-only-proportional.pdf')
 
         grsiPerCountrySum = dict(sorted(grsiPerCountrySum.items(), key=lambda kv: kv[1], reverse = True))
         dataToPlot = []
@@ -3052,7 +2528,7 @@ if exportVisualizations:
         ).properties(
             padding={"left": visPadding, "right": visPadding, "bottom": visPadding+visPaddingBottomExtra, "top": visPadding}
         ).configure_legend(columns=2, symbolLimit=50, titleLimit=0, labelLimit=myLabelLimit)
-        pieChart.save(graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-senior-only-absolute.pdf')
+        queueChartRender(chartRenderQueue, pieChart, graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-senior-only-absolute.pdf')
 
         # thresholded version for the proportional one
         if makeMainPieChartsComparable: colorsGrsiPerCountryThresholded = []
@@ -3104,7 +2580,16 @@ if exportVisualizations:
         ).properties(
             padding={"left": visPadding, "right": visPadding, "bottom": visPadding+visPaddingBottomExtra, "top": visPadding}
         ).configure_legend(columns=1, symbolLimit=50, titleLimit=0, labelLimit=myLabelLimit)
-        pieChart.save(graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-senior-only-thresholded-proportional.pdf')
+        queueChartRender(chartRenderQueue, pieChart, graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-senior-only-thresholded-proportional.pdf')
+
+# now render all the charts we queued above (in parallel)
+failedCharts = {}
+if len(chartRenderQueue["charts"]) > 0:
+    print("Rendering " + str(len(chartRenderQueue["charts"])) + " charts (unless they did not change since the last time) ...")
+    chartFiles = [fileName for baseFileName in chartRenderQueue["charts"].keys() for fileName in chartOutputFiles(baseFileName, chartOutputFormats)]
+    failedCharts = renderQueuedCharts(chartRenderQueue, chartRenderProcesses)
+    if exportVisualizations and not plotStageCurrent and (len(failedCharts) == 0):
+        recordStage(stageManifest, "plots", stageInputFiles["plots"], chartFiles, plotStageDataHash)
 
 if doNameChecking:
     # some additional analysis to check for name spelling (to clean the data we got from GRSI): compare names from to DL entries
@@ -3115,8 +2600,7 @@ if doNameChecking:
             authorsDL = paperListExtended[doi]["authors"]
             authorsDLString = ""
             for author in authorsDL:
-                authorsDLString = authorsDLString + author["given"] + " "
-                authorsDLString = authorsDLString + author["family"] + ", "
+                authorsDLString = authorsDLString + normalizeAuthorName(authorNameRules, author["given"] + " " + author["family"]) + ", "
             authorsDLString = authorsDLString[:-2]
 
             if len(authorsGrsi) != len(authorsDL):
@@ -3140,16 +2624,18 @@ if doNameChecking:
         doi = paper["doi"]
         if doi in visPubDataAuthorsDeduped.keys():
             for nameVPD, nameGRSI in zip(visPubDataAuthorsDeduped[doi], paper["authors"].split(", ")):
-                nameVPD_withoutNumbers = re.sub(pattern=r"(.*) \d\d\d\d", repl=r"\1", string=nameVPD)
+                nameVPD_withoutNumbers = normalizeAuthorName(authorNameRules, re.sub(pattern=r"(.*) \d\d\d\d", repl=r"\1", string=nameVPD))
                 if nameVPD_withoutNumbers != nameGRSI:
                     print('Found difference between names between VisPubData data and GRSI (ignoring the numbers): ' + nameVPD_withoutNumbers + ' <-> ' + nameGRSI)
 
 # print the IEEE papers that are currently in press still (for a report to Han-Wei)
 if doPrintTVCGInPressDetails:
     print("TVCG papers currently in press:")
+    if useExtendedPaperStore: inPressDois = set(findDoisPublishedAfter(extendedPaperStore, grsiMetaData["data_download_year"], "10.1109/"))
+    else: inPressDois = set([doi for doi in paperListExtended.keys() if ("10.1109/" in doi) and (paperListExtended[doi]['publication_year'] > grsiMetaData["data_download_year"])])
     for paper in paperList:
         doi = paper["doi"]
-        if ("10.1109/" in doi) and (paperListExtended[doi]['publication_year'] > grsiMetaData["data_download_year"]):
+        if doi in inPressDois:
             print("* " + doi + ": " + paperListExtended[doi]['title'] + " (GRSI: " + paper["grsi_url"] + ")")
 
 if doAbstractCheckingForKeywords:
@@ -3158,45 +2644,25 @@ if doAbstractCheckingForKeywords:
     for paper in paperList:
         doi = paper["doi"]
 
-        reportVisKeywordInAbstract = False
-
         if (paper["is_vis"] == False) and (doi in paperListExtended.keys()):
-            if ("visualization" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            if ("visualisation" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            if ("visualizing" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            if ("visualising" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            if ( ("visual" in paperListExtended[doi]['abstract'].lower()) and ("analytics" in paperListExtended[doi]['abstract'].lower()) ): reportVisKeywordInAbstract = True
-            if ( ("visual" in paperListExtended[doi]['abstract'].lower()) and ("analysis" in paperListExtended[doi]['abstract'].lower()) ): reportVisKeywordInAbstract = True
-            if ("visual representation" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            if ("data exploration" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            if ("visual exploration" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            if ("graph drawing" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            if ("parallel coordinates" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            if ("scatterplot" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            if ("choropleth" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            if ("cartogram" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            if ("star glyph" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            if ("glyph design" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            if ("line graph" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            if ("streamgraph" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            if ("focus+context" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            # if ("topology" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True # not good: some graphics papers also captured
-            if ("t-sne" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-            if ("high-dimensional data" in paperListExtended[doi]['abstract'].lower()): reportVisKeywordInAbstract = True
-
-        if reportVisKeywordInAbstract:
-            print("https://doi.org/" + doi + " (" + paper["title"] + ") is not marked but has vis keywords in the abstract")
+            firedKeywordRules = matchKeywordRules(visAbstractKeywordMatcher, paperListExtended[doi]['abstract'])
+            if len(firedKeywordRules) > 0:
+                print("https://doi.org/" + doi + " (" + paper["title"] + ") is not marked but has vis keywords in the abstract: " + ", ".join(firedKeywordRules))
 
 if doVerifyCountryInformation:
     # check for visualization keywords in the paper abstracts
     print("Checking for missing country information")
-    for paper in paperListExtended.keys():
-        doi = paperListExtended[paper]["doi"]
-        if not("countries" in paperListExtended[doi].keys()):
-            print("Counties info missing for entry " + doi + ", please add it to " + dataOutputSubdirectury + "extended_paper_data.json.")
+    if useExtendedPaperStore: doisWithoutCountries = findDoisWithoutCountries(extendedPaperStore)
+    else: doisWithoutCountries = [paperListExtended[paper]["doi"] for paper in paperListExtended.keys() if not("countries" in paperListExtended[paper].keys())]
+    for doi in doisWithoutCountries:
+        print("Counties info missing for entry " + doi + ", please add it to " + dataOutputSubdirectury + "extended_paper_data.json.")
 
 if doExportNumbersForPaper:
     print("Writing the extracted numbers into a tex file for the paper")
+    usedMacros = None # all of them
+    if doNumbersOnly: # only the ones the paper uses (not counting the files we write here)
+        usedMacros = findUsedMacros([texFileName for texFileName in glob.glob(paperTexFiles) if not (os.path.normpath(texFileName) in [os.path.normpath(paperNumbersOutputFile), os.path.normpath(paperKeywordPapersOutputFile)])])
+    paperNumbersOutputString += paperNumbersLatex(paperNumbers, usedMacros)
     with open(paperNumbersOutputFile, "w") as text_file:
         text_file.write(paperNumbersOutputString)
     print("Writing the extracted keyword-marked papers into a tex file for the paper")
@@ -3204,54 +2670,10 @@ if doExportNumbersForPaper:
         text_file.write(paperKeywordPapersOutputString)
 
 if (doCopyPlotsAccordingToFigureNumbers) and (exportVisualizations):
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph.pdf', paperFiguresOutputSubdirectury + 'figure01.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-ieee_vis.pdf', paperFiguresOutputSubdirectury + 'figure01-ieee_vis.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-eurovis.pdf', paperFiguresOutputSubdirectury + 'figure01-eurovis.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-pacificvis.pdf', paperFiguresOutputSubdirectury + 'figure01-pacificvis.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-vcbm.pdf', paperFiguresOutputSubdirectury + 'figure01-vcbm.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_all-by-journal-linegraph.pdf', paperFiguresOutputSubdirectury + 'figure02.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_all-by-journal_aggregated-stackedbargraph.pdf', paperFiguresOutputSubdirectury + 'figure03.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_all-by-journal_aggregated_plain-stackedbargraph.pdf', paperFiguresOutputSubdirectury + 'figure03_merged.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_all-by-visualization-stackedbargraph.pdf', paperFiguresOutputSubdirectury + 'figure04.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-journal_plus_type_aggregated-stackedbargraph.pdf', paperFiguresOutputSubdirectury + 'figure05.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-journal_plus_type-stackedbargraph.pdf', paperFiguresOutputSubdirectury + 'figure06.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-type-groupedbargraph.pdf', paperFiguresOutputSubdirectury + 'figure07.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-normalized.pdf', paperFiguresOutputSubdirectury + 'figure08.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-normalized-ieee_vis.pdf', paperFiguresOutputSubdirectury + 'figure08-ieee_vis.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-normalized-eurovis.pdf', paperFiguresOutputSubdirectury + 'figure08-eurovis.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-normalized-pacificvis.pdf', paperFiguresOutputSubdirectury + 'figure08-pacificvis.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-venue-stackedbargraph-normalized-vcbm.pdf', paperFiguresOutputSubdirectury + 'figure08-vcbm.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_all-histogram-stamps-per-person.pdf', paperFiguresOutputSubdirectury + 'figure09a.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-histogram-stamps-per-person.pdf', paperFiguresOutputSubdirectury + 'figure09b.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability-histogram-people-vis-percentages.pdf', paperFiguresOutputSubdirectury + 'figure10a.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability-histogram-people-vis-percentages-multiple-papers.pdf', paperFiguresOutputSubdirectury + 'figure10b.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_all-piechart-by-country-thresholded-proportional.pdf', paperFiguresOutputSubdirectury + 'figure11a.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-thresholded-proportional.pdf', paperFiguresOutputSubdirectury + 'figure11b.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_all-piechart-by-country-senior-only-thresholded-proportional.pdf', paperFiguresOutputSubdirectury + 'figure12a.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-senior-only-thresholded-proportional.pdf', paperFiguresOutputSubdirectury + 'figure12b.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-venue-linegraph.pdf', paperFiguresOutputSubdirectury + 'figure13.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_all-by-journal-groupedbargraph.pdf', paperFiguresOutputSubdirectury + 'figure14.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_all-by-journal_aggregated-stackedbargraph-normalized.pdf', paperFiguresOutputSubdirectury + 'figure15.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-piechart-by-vis-status.pdf', paperFiguresOutputSubdirectury + 'figure16a.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-piechart-by-journal.pdf', paperFiguresOutputSubdirectury + 'figure16b.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_all-by-visualization-stackedbargraph-normalized.pdf', paperFiguresOutputSubdirectury + 'figure17.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_all-by-visualization-groupedbargraph.pdf', paperFiguresOutputSubdirectury + 'figure17_absolute-bars.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_all-by-visualization-linegraph.pdf', paperFiguresOutputSubdirectury + 'figure17_absolute-lines.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-journal_plus_type_aggregated-stackedbargraph-normalized.pdf', paperFiguresOutputSubdirectury + 'figure18.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-journal_plus_type-stackedbargraph-normalized.pdf', paperFiguresOutputSubdirectury + 'figure19.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-type-stackedbargraph.pdf', paperFiguresOutputSubdirectury + 'figure20.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-by-type-stackedbargraph-normalized.pdf', paperFiguresOutputSubdirectury + 'figure21.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability-histogram-people-vis-percentages-nolog.pdf', paperFiguresOutputSubdirectury + 'figure22a.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability-histogram-people-vis-percentages-multiple-papers-nolog.pdf', paperFiguresOutputSubdirectury + 'figure22b.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_all-piechart-by-country-proportional.pdf', paperFiguresOutputSubdirectury + 'figure23a.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_all-piechart-by-country-absolute.pdf', paperFiguresOutputSubdirectury + 'figure23b.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_all-piechart-by-country-senior-only-proportional.pdf', paperFiguresOutputSubdirectury + 'figure24a.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_all-piechart-by-country-senior-only-absolute.pdf', paperFiguresOutputSubdirectury + 'figure24b.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-proportional.pdf', paperFiguresOutputSubdirectury + 'figure25a.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-absolute.pdf', paperFiguresOutputSubdirectury + 'figure25b.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-senior-only-proportional.pdf', paperFiguresOutputSubdirectury + 'figure26a.pdf')
-    shutil.copy(graphOutputSubdirectury + 'replicability_visualization-piechart-by-country-senior-only-absolute.pdf', paperFiguresOutputSubdirectury + 'figure26b.pdf')
+    # only the figures whose graphs changed (so that the others keep their modification times), and not those whose graphs could not be rendered this time
+    figureFilePairs = []
+    for graphName, figureName in paperFigureFiles:
+        if graphOutputSubdirectury + graphName in failedCharts.keys(): print("WARNING: Not copying " + figureName + " for the paper, since its graph could not be rendered")
+        else: figureFilePairs.append((graphOutputSubdirectury + graphName + '.' + paperFigureFormat, paperFiguresOutputSubdirectury + figureName + '.' + paperFigureFormat))
+    copyChangedFiles(stageManifest, "figures", figureFilePairs)
 
-
-# copy the final GRSI data file to the respective output directory
-shutil.copy(formatted_date + " grsi paper data.json", dataOutputSubdirectury + "grsi_paper_data.json")
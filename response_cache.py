@@ -0,0 +1,108 @@
+#!/usr/bin/python3
+
+import os
+import json
+import time
+import hashlib
+import threading
+
+#####################################
+# An on-disk cache of the raw responses we get from the publishers' DL
+# APIs, keyed by publisher and DOI. With it, we can re-derive the extended
+# paper data (e.g., after changing how abstracts or journal names are
+# cleaned up) without querying the APIs again. Entries expire after a
+# given time, and if the cache has too many entries we drop the least
+# recently used ones. In cache-only mode we never go to the network, and
+# we then also use expired entries. We only write the index when the caller
+# saves it (once per batch of lookups); an entry that was stored but is not
+# yet in the saved index is just fetched again next time.
+#####################################
+
+def createResponseCache(directory, ttlSeconds = 90 * 24 * 60 * 60, maxEntries = 5000, cacheOnly = False):
+    responseCache = {}
+    responseCache["directory"] = directory
+    responseCache["ttl"] = ttlSeconds
+    responseCache["max_entries"] = maxEntries
+    responseCache["cache_only"] = cacheOnly
+    responseCache["lock"] = threading.Lock()
+    responseCache["index"] = {} # key -> {"file": ..., "stored": ..., "last_used": ...}
+    os.makedirs(directory, exist_ok=True)
+    if os.path.isfile(os.path.join(directory, "index.json")):
+        try:
+            with open(os.path.join(directory, "index.json"), "r", encoding='utf-8') as f:
+                responseCache["index"] = json.load(f)
+        except (OSError, ValueError): # e.g., a run was killed while an older version wrote it, then we start with an empty cache
+            print("The response cache index could not be read, so we start with an empty cache.")
+            responseCache["index"] = {}
+    return responseCache
+
+def responseCacheKey(publisher, doi):
+    return publisher + ":" + doi.lower()
+
+def writeResponseCacheFile(fileName, data, indent = None):
+    # via a temporary file, so that a killed run never leaves a half-written file behind
+    with open(fileName + ".tmp", "w", encoding='utf-8') as f:
+        json.dump(data, f, indent=indent)
+    os.replace(fileName + ".tmp", fileName)
+
+def saveResponseCacheIndex(responseCache):
+    with responseCache["lock"]:
+        writeResponseCacheFile(os.path.join(responseCache["directory"], "index.json"), responseCache["index"], indent=1)
+
+def isResponseFresh(responseCache, indexEntry):
+    return responseCache["cache_only"] or (time.time() - indexEntry["stored"] <= responseCache["ttl"])
+
+def hasCachedResponse(responseCache, publisher, doi):
+    key = responseCacheKey(publisher, doi)
+    with responseCache["lock"]:
+        return (key in responseCache["index"]) and isResponseFresh(responseCache, responseCache["index"][key])
+
+def getCachedResponse(responseCache, publisher, doi, includeExpired = False):
+    # returns None if we do not have a (fresh) response
+    key = responseCacheKey(publisher, doi)
+    with responseCache["lock"]:
+        if not (key in responseCache["index"]): return None
+        indexEntry = responseCache["index"][key]
+        if not (includeExpired or isResponseFresh(responseCache, indexEntry)): return None
+        fileName = os.path.join(responseCache["directory"], indexEntry["file"])
+        try:
+            with open(fileName, "r", encoding='utf-8') as f:
+                cacheItem = json.load(f)
+        except (OSError, ValueError): # the file is missing or unreadable, so we fetch the response again
+            del responseCache["index"][key]
+            return None
+        indexEntry["last_used"] = time.time()
+        return cacheItem["response"]
+
+def expireCachedResponse(responseCache, publisher, doi):
+    # the response is outdated (e.g., the paper was still in press), so we query the API again next time
+    # (the old response stays available via includeExpired, and is used in cache-only mode)
+    key = responseCacheKey(publisher, doi)
+    with responseCache["lock"]:
+        if key in responseCache["index"]: responseCache["index"][key]["stored"] = 0
+
+def storeResponse(responseCache, publisher, doi, response):
+    key = responseCacheKey(publisher, doi)
+    fileName = hashlib.sha256(key.encode('utf-8')).hexdigest() + ".json"
+    cacheItem = { "publisher": publisher, "doi": doi.lower(), "stored": time.time(), "response": response }
+    with responseCache["lock"]:
+        writeResponseCacheFile(os.path.join(responseCache["directory"], fileName), cacheItem)
+        responseCache["index"][key] = { "file": fileName, "stored": cacheItem["stored"], "last_used": cacheItem["stored"] }
+
+        # evict the least recently used entries if we have too many
+        if len(responseCache["index"]) > responseCache["max_entries"]:
+            keysByUse = sorted(responseCache["index"].keys(), key=lambda x: responseCache["index"][x]["last_used"])
+            for oldKey in keysByUse[:len(responseCache["index"]) - responseCache["max_entries"]]:
+                oldFileName = os.path.join(responseCache["directory"], responseCache["index"][oldKey]["file"])
+                if os.path.isfile(oldFileName): os.remove(oldFileName)
+                del responseCache["index"][oldKey]
+
+def getResponse(responseCache, publisher, doi, fetchFunction):
+    # the cached raw response if we have one, otherwise (unless we only use the cache) fetch and cache it
+    # fetchFunction returns None if it did not get a usable response, which we then do not cache
+    if responseCache == None: return fetchFunction()
+    response = getCachedResponse(responseCache, publisher, doi)
+    if (response != None) or responseCache["cache_only"]: return response
+    response = fetchFunction()
+    if response != None: storeResponse(responseCache, publisher, doi, response)
+    return response
@@ -0,0 +1,139 @@
+#!/usr/bin/python3
+
+#####################################
+# A single hash-indexed registry of all DOIs we know to be published
+# at (or presented at) a visualization venue. It maps each DOI to the
+# venues it belongs to, together with the conference year and some extra
+# per-venue data, so that classifying a paper is one dictionary lookup
+# instead of a linear scan through one list per venue.
+#####################################
+
+# the venues we know about, in the order of precedence in which the analysis marks papers,
+# with the paper type label that a paper gets when it is marked by this venue
+venueTypes = {
+    'vis': 'IEEE VIS',
+    'vis_journal': 'journal pres. @ IEEE VIS',
+    'pacificvis_tvcg': 'PacificVis TVCG',
+    'pacificvis_journal': 'journal pres. @ PacificVis',
+    'eurovis': 'EuroVis',
+    'eurovis_journal': 'journal pres. @ EuroVis',
+    'vcbm': 'VCBM C&G',
+    'cag_special_issue': 'C&G special issue',
+}
+
+def createVenueRegistry():
+    registry = {}
+    registry["dois"] = {} # doi -> {venue: {"year": ..., "type": ..., plus any extra data}}
+    registry["venues"] = {} # venue -> {"type": ..., "most_recent_year": ..., "dois": [...] in loading order}
+    for venue in venueTypes.keys():
+        registry["venues"][venue] = { "type": venueTypes[venue], "most_recent_year": 0, "dois": [] }
+    return registry
+
+def noteVenueYear(registry, venue, year):
+    # also used for rows we cannot register (e.g., missing DOIs), but whose year should still count
+    if year > registry["venues"][venue]["most_recent_year"]: registry["venues"][venue]["most_recent_year"] = year
+
+def registerDoi(registry, doi, venue, year, extraData = None, updateExisting = False):
+    # returns False if the doi was already registered for this venue (we then keep the first entry, unless asked to update it)
+    noteVenueYear(registry, venue, year)
+    doiVenues = registry["dois"].setdefault(doi, {})
+    if venue in doiVenues:
+        if updateExisting:
+            doiVenues[venue]["year"] = year
+            if extraData != None: doiVenues[venue].update(extraData)
+        return False
+    entry = { "year": year, "type": venueTypes[venue] }
+    if extraData != None: entry.update(extraData)
+    doiVenues[venue] = entry
+    registry["venues"][venue]["dois"].append(doi)
+    return True
+
+def isDoiInVenue(registry, doi, venue):
+    return (doi in registry["dois"]) and (venue in registry["dois"][doi])
+
+def venueEntry(registry, doi, venue):
+    return registry["dois"][doi][venue]
+
+def venuesOfDoi(registry, doi):
+    # the venues of a doi, in the order of precedence of venueTypes
+    if not (doi in registry["dois"]): return []
+    return [venue for venue in venueTypes.keys() if venue in registry["dois"][doi]]
+
+def venueDois(registry, venue):
+    return registry["venues"][venue]["dois"]
+
+def venueMostRecentYear(registry, venue):
+    return registry["venues"][venue]["most_recent_year"]
+
+def venueConferenceYears(registry, venue, filterFunction = None):
+    # doi -> conference year for one venue (optionally only for entries that pass the filter)
+    conferenceYears = {}
+    for doi in registry["venues"][venue]["dois"]:
+        entry = registry["dois"][doi][venue]
+        if (filterFunction == None) or filterFunction(entry):
+            conferenceYears[doi] = entry["year"]
+    return conferenceYears
+
+def markPapersByVenue(paperList, registry, venue, label = "is_vis", setType = True):
+    # same behavior as marking papers by a list of DOIs, but with a single hash lookup per paper
+    for paper in paperList:
+        if isDoiInVenue(registry, paper["doi"], venue):
+            paper[label] = True
+            if setType: paper["type"] = venueTypes[venue]
+
+def markPapersByAnyVenue(paperList, registry, label = "is_vis"):
+    # mark all papers that belong to any of the registered venues, in a single pass over the papers
+    for paper in paperList:
+        if paper["doi"] in registry["dois"]:
+            paper[label] = True
+
+def classifyPapers(paperList, registry, isVisPaperByKeywords, isManuallySelectedVisPaper, isFutureVisPresentation, label = "is_vis"):
+    # classify all papers in a single pass, with the same precedence as marking them venue by venue:
+    # - a paper is counted for the first venue (in the order of venueTypes) that it belongs to
+    # - its final type is that of the last venue it belongs to (later venues overwrite the type)
+    # - keywords are only checked for papers not at any venue, and manual selections overwrite everything
+    # - papers that we know will be presented at the next IEEE VIS count as IEEE VIS journal presentations
+    classification = {}
+    classification["venues"] = {}
+    for venue in venueTypes.keys():
+        classification["venues"][venue] = { "type": venueTypes[venue], "count": 0, "members": [], "per_year": {} }
+    classification["keyword"] = [] # final type "keyword"
+    classification["manual"] = [] # final type "manual"
+    classification["vis"] = [] # all papers on visualization topics
+    classification["not_vis"] = []
+
+    for paper in paperList:
+        doi = paper["doi"]
+        doiVenues = registry["dois"].get(doi, {})
+        matchedVenues = []
+        for venue in venueTypes.keys():
+            if (venue in doiVenues) or ((venue == 'vis_journal') and isFutureVisPresentation(doi)):
+                matchedVenues.append(venue)
+
+        paperType = None
+        if len(matchedVenues) > 0:
+            classification["venues"][matchedVenues[0]]["count"] += 1
+            for venue in matchedVenues:
+                venueClassification = classification["venues"][venue]
+                venueClassification["members"].append(paper)
+                if venue in doiVenues:
+                    year = doiVenues[venue]["year"]
+                    venueClassification["per_year"][year] = venueClassification["per_year"].get(year, 0) + 1
+            paperType = venueTypes[matchedVenues[-1]]
+        elif isVisPaperByKeywords(paper["title"]):
+            paperType = "keyword"
+        if isManuallySelectedVisPaper(doi):
+            paperType = "manual"
+
+        if paperType == None:
+            paper[label] = False
+            if "type" in paper.keys(): del paper["type"]
+            classification["not_vis"].append(paper)
+        else:
+            paper[label] = True
+            paper["type"] = paperType
+            if paperType == "keyword": classification["keyword"].append(paper)
+            if paperType == "manual": classification["manual"].append(paper)
+            classification["vis"].append(paper)
+
+    return classification